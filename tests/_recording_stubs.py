@@ -0,0 +1,34 @@
+"""Fake recorder-backend pieces shared by the recording CLI tests."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StopResult:
+    audio_file: str
+    session: dict[str, Any] | None
+    recording_id: str | None = None
+
+
+class BackendStub:
+    """Context-manager plumbing shared by the fake recorder backends."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+
+def write_fake_wav(path: Path) -> Path:
+    """Write a placeholder recording just large enough to be transcribed."""
+    from voicepipe.wav import MIN_AUDIO_BYTES
+
+    path.write_bytes(b"RIFF" + b"\0" * (MIN_AUDIO_BYTES - 4))
+    return path
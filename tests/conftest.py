@@ -7,6 +7,16 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _clear_transcriber_cache():
+    """Keep cached transcriber clients from leaking between tests."""
+    from voicepipe.transcription import clear_transcriber_cache
+
+    clear_transcriber_cache()
+    yield
+    clear_transcriber_cache()
+
+
 @pytest.fixture()
 def isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Isolate $HOME + XDG dirs so tests never touch real user files."""
@@ -113,28 +123,35 @@ if cmd == "cat":
     sys.exit(1)
 
 if cmd == "show":
-    # Minimal `systemctl show UNIT -p Key -p Key2` support.
+    # Minimal `systemctl show UNIT... -p Key -p Key2` support (one block per unit).
     props = []
+    units = []
     i = 0
     while i < len(rest):
         if rest[i] == "-p" and i + 1 < len(rest):
             props.append(rest[i + 1])
             i += 2
         else:
+            units.append(rest[i])
             i += 1
-    for p in props:
-        if p == "LoadState":
-            sys.stdout.write("LoadState=loaded\\n")
-        elif p == "ActiveState":
-            sys.stdout.write("ActiveState=inactive\\n")
-        elif p == "SubState":
-            sys.stdout.write("SubState=dead\\n")
-        elif p == "UnitFileState":
-            sys.stdout.write("UnitFileState=disabled\\n")
-        elif p == "FragmentPath":
-            sys.stdout.write("FragmentPath=\\n")
-        else:
-            sys.stdout.write(f"{p}=\\n")
+    for n, unit in enumerate(units or [""]):
+        if n:
+            sys.stdout.write("\\n")
+        for p in props:
+            if p == "Id":
+                sys.stdout.write(f"Id={unit}\\n")
+            elif p == "LoadState":
+                sys.stdout.write("LoadState=loaded\\n")
+            elif p == "ActiveState":
+                sys.stdout.write("ActiveState=inactive\\n")
+            elif p == "SubState":
+                sys.stdout.write("SubState=dead\\n")
+            elif p == "UnitFileState":
+                sys.stdout.write("UnitFileState=disabled\\n")
+            elif p == "FragmentPath":
+                sys.stdout.write("FragmentPath=\\n")
+            else:
+                sys.stdout.write(f"{p}=\\n")
     sys.exit(0)
 
 if cmd == "status":
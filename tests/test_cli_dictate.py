@@ -1,22 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
 
 from click.testing import CliRunner
 
+from tests._recording_stubs import BackendStub, StopResult, write_fake_wav
 from voicepipe.cli import main
 from voicepipe.transcription_result import TranscriptionResult
 
 
-@dataclass(frozen=True)
-class _StopResult:
-    audio_file: str
-    session: dict[str, Any] | None
-    recording_id: str | None = None
-
-
 def test_dictate_requires_seconds_without_tty(monkeypatch) -> None:
     runner = CliRunner()
     # Under CliRunner, stdin is not a TTY, so the default (wait for ENTER) should fail.
@@ -34,14 +26,14 @@ def test_dictate_records_transcribes_and_cleans_up(tmp_path: Path, monkeypatch)
     monkeypatch.setattr(recording_cmd, "is_windows", lambda: False)
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def start(self, *, device):
             return None
 
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=None)
+            return StopResult(audio_file=str(audio), session=None)
 
         def cancel(self):
             return None
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+import voicepipe.commands.doctor as doctor
+
+
+def test_wait_process_reaps_exited_child() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
+    t0 = time.monotonic()
+    assert doctor._wait_process(proc, 5.0) is True
+    assert time.monotonic() - t0 < 4.0
+    assert proc.returncode == 0
+
+
+def test_wait_process_times_out_without_pidfd(monkeypatch) -> None:
+    monkeypatch.setattr(doctor, "open_pidfd", lambda _pid: None)
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert doctor._wait_process(proc, 0.05) is False
+        assert proc.returncode is None
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals only")
+def test_terminate_process_escalates_to_sigkill() -> None:
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import signal, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(30)\n",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        **doctor._process_group_kwargs(),
+    )
+    try:
+        assert proc.stdout is not None
+        assert proc.stdout.readline().strip() == "ready"
+        assert doctor._terminate_process(proc, grace_s=0.2) is True
+        assert proc.returncode == -9
+        if sys.version_info >= (3, 11):
+            assert doctor._process_group_kwargs() == {"process_group": 0}
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def test_preserve_doctor_audio_file_avoids_name_collisions(isolated_home, tmp_path) -> None:
+    first = tmp_path / "rec.wav"
+    second = tmp_path / "other" / "rec.wav"
+    second.parent.mkdir()
+    first.write_bytes(b"one")
+    second.write_bytes(b"two")
+
+    kept_first = doctor._preserve_doctor_audio_file(str(first))
+    kept_second = doctor._preserve_doctor_audio_file(second)
+
+    assert isinstance(kept_first, str)
+    assert kept_first.endswith("rec.wav")
+    assert kept_second.endswith("rec-1.wav")
+    assert not first.exists() and not second.exists()
+    with open(kept_second, "rb") as fh:
+        assert fh.read() == b"two"
+
+
+def test_play_wav_plays_int16_frames_in_process(tmp_path, monkeypatch) -> None:
+    import types
+    import wave
+
+    np = pytest.importorskip("numpy")
+
+    path = tmp_path / "rec.wav"
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(np.arange(8, dtype=np.int16).tobytes())
+
+    calls: list[tuple] = []
+    fake_sd = types.SimpleNamespace(
+        play=lambda data, fs, **kw: calls.append(("play", data.shape, fs, kw)),
+        wait=lambda: calls.append(("wait",)),
+        stop=lambda: calls.append(("stop",)),
+    )
+    monkeypatch.setitem(sys.modules, "sounddevice", fake_sd)
+
+    assert doctor._play_wav(str(path), 5.0) is True
+    assert calls == [("play", (4, 2), 16000, {"latency": "low"}), ("wait",)]
+
+
+def test_play_wav_rejects_non_16_bit_files(tmp_path, monkeypatch) -> None:
+    import types
+    import wave
+
+    pytest.importorskip("numpy")
+
+    path = tmp_path / "rec.wav"
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(1)
+        wf.setframerate(8000)
+        wf.writeframes(b"\x80" * 4)
+    monkeypatch.setitem(sys.modules, "sounddevice", types.SimpleNamespace())
+
+    with pytest.raises(ValueError):
+        doctor._play_wav(str(path), 5.0)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake systemctl is a POSIX script")
+def test_doctor_systemd_writes_report_and_hints_once(fake_systemd, monkeypatch) -> None:
+    from click.testing import CliRunner
+
+    from voicepipe.cli import main
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    writes: list[bool] = []
+    real_echo = doctor.click.echo
+
+    def _echo(message=None, *args, **kwargs):
+        writes.append(bool(kwargs.get("err")))
+        return real_echo(message, *args, **kwargs)
+
+    monkeypatch.setattr(doctor.click, "echo", _echo)
+
+    result = CliRunner().invoke(main, ["doctor", "systemd"])
+    assert result.exit_code == 0, result.output
+    assert "unit: voicepipe.target" in result.output
+    assert "  LoadState: loaded" in result.output
+    assert writes == [False, True]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+def test_doctor_env_reports_dangling_symlink_as_missing(isolated_home, monkeypatch) -> None:
+    from click.testing import CliRunner
+
+    from voicepipe.cli import main
+    from voicepipe.paths import logs_dir, state_dir
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    state = state_dir()
+    state.mkdir(parents=True, exist_ok=True)
+    logs = logs_dir()
+    logs.parent.mkdir(parents=True, exist_ok=True)
+    logs.symlink_to(isolated_home / "gone")
+
+    result = CliRunner().invoke(main, ["doctor", "env"])
+    assert result.exit_code == 0, result.output
+    assert f"state dir: {state} exists: True" in result.output
+    assert f"logs dir: {logs} exists: False" in result.output
+
+
+def test_run_transcribe_test_records_text_or_error(monkeypatch) -> None:
+    import voicepipe.transcription as transcription
+
+    monkeypatch.setattr("voicepipe.config.get_transcribe_model", lambda *a, **k: "m")
+    monkeypatch.setattr(
+        transcription, "transcribe_audio_file", lambda path, **_k: f"text for {path}"
+    )
+    outcome: dict = {}
+    doctor._run_transcribe_test("/tmp/a.wav", outcome)
+    assert outcome == {"text": "text for /tmp/a.wav"}
+
+    def _boom(*_a, **_k):
+        raise RuntimeError("no key")
+
+    monkeypatch.setattr(transcription, "transcribe_audio_file", _boom)
+    outcome = {}
+    doctor._run_transcribe_test("/tmp/a.wav", outcome)
+    assert str(outcome["error"]) == "no key"
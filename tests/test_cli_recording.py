@@ -1,24 +1,17 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from click.testing import CliRunner
 
+from tests._recording_stubs import BackendStub, StopResult, write_fake_wav
 from voicepipe.cli import main
 from voicepipe.paths import preserved_audio_dir
 from voicepipe.transcription_result import TranscriptionResult
 
 
-@dataclass(frozen=True)
-class _StopResult:
-    audio_file: str
-    session: dict[str, Any] | None
-    recording_id: str | None = None
-
-
 def _combined_cli_output(result) -> str:
     out = getattr(result, "output", "") or ""
     try:
@@ -32,13 +25,13 @@ def test_stop_deletes_audio_file_on_success(tmp_path: Path, monkeypatch, isolate
     import voicepipe.commands.recording as recording_cmd
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     session_dict = {"pid": 1, "audio_file": str(audio)}
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=session_dict)
+            return StopResult(audio_file=str(audio), session=session_dict)
 
     cleaned: list[dict[str, Any]] = []
 
@@ -74,13 +67,13 @@ def test_stop_keep_audio_flag_keeps_audio_file_on_success(
     import voicepipe.commands.recording as recording_cmd
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     session_dict = {"pid": 1, "audio_file": str(audio)}
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=session_dict)
+            return StopResult(audio_file=str(audio), session=session_dict)
 
     cleaned: list[dict[str, Any]] = []
 
@@ -118,11 +111,11 @@ def test_stop_preserves_audio_file_on_transcription_error(
     import voicepipe.commands.recording as recording_cmd
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=None)
+            return StopResult(audio_file=str(audio), session=None)
 
     monkeypatch.setattr(recording_cmd, "AutoRecorderBackend", lambda: _FakeBackend())
 
@@ -144,19 +137,115 @@ def test_stop_preserves_audio_file_on_transcription_error(
     assert not audio.exists()
 
 
+def test_stop_skips_transcription_for_empty_recording(
+    tmp_path: Path, monkeypatch, isolated_home: Path
+) -> None:
+    import voicepipe.commands.recording as recording_cmd
+
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + b"\0" * 40)
+
+    class _FakeBackend(BackendStub):
+        def stop(self):
+            return StopResult(audio_file=str(audio), session=None)
+
+    monkeypatch.setattr(recording_cmd, "AutoRecorderBackend", lambda: _FakeBackend())
+
+    def _no_upload(*_a, **_k):
+        raise AssertionError("transcription attempted for an empty recording")
+
+    monkeypatch.setattr(recording_cmd, "transcribe_audio_file_result", _no_upload)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["stop"])
+    assert result.exit_code == 1
+    combined = _combined_cli_output(result)
+    assert "No audio captured (44 bytes recorded)" in combined
+    assert (preserved_audio_dir() / audio.name).exists()
+
+
+def test_stop_reports_empty_recording_without_waiting_for_prewarm(
+    tmp_path: Path, monkeypatch, isolated_home: Path
+) -> None:
+    import threading
+
+    import voicepipe.commands.recording as recording_cmd
+
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + b"\0" * 40)
+    release = threading.Event()
+    events: list[str] = []
+
+    class _FakeBackend(BackendStub):
+        def stop(self):
+            return StopResult(audio_file=str(audio), session={"pid": 1})
+
+    def _slow_prewarm(*_a, **_k):
+        release.wait(5)
+        events.append("prewarm")
+
+    def _cleanup(_session):
+        events.append("cleanup")
+        release.set()
+
+    monkeypatch.setattr(recording_cmd, "AutoRecorderBackend", lambda: _FakeBackend())
+    monkeypatch.setattr(recording_cmd, "prewarm_transcriber", _slow_prewarm)
+    monkeypatch.setattr(recording_cmd.RecordingSession, "cleanup_session", _cleanup)
+
+    result = CliRunner().invoke(main, ["stop"])
+    assert result.exit_code == 1
+    assert events == ["cleanup", "prewarm"]
+
+
+def test_stop_waits_for_prewarm_before_transcribing(
+    tmp_path: Path, monkeypatch, isolated_home: Path
+) -> None:
+    import voicepipe.commands.recording as recording_cmd
+
+    audio = tmp_path / "audio.wav"
+    write_fake_wav(audio)
+    events: list[str] = []
+
+    class _FakeBackend(BackendStub):
+        def stop(self):
+            return StopResult(audio_file=str(audio), session=None)
+
+    def _transcribe(*_a, **_k):
+        events.append("transcribe")
+        return TranscriptionResult(
+            text="hello",
+            backend="openai",
+            model="gpt-test",
+            audio_file=str(audio),
+            recording_id=None,
+            source="stop",
+            warnings=[],
+        )
+
+    monkeypatch.setattr(recording_cmd, "AutoRecorderBackend", lambda: _FakeBackend())
+    monkeypatch.setattr(
+        recording_cmd, "prewarm_transcriber", lambda *_a, **_k: events.append("prewarm")
+    )
+    monkeypatch.setattr(recording_cmd, "transcribe_audio_file_result", _transcribe)
+
+    result = CliRunner().invoke(main, ["stop"])
+    assert result.exit_code == 0, result.output
+    assert events == ["prewarm", "transcribe"]
+
+
 def test_stop_json_outputs_structured_result(tmp_path: Path, monkeypatch, isolated_home: Path) -> None:
     import json as _json
 
     import voicepipe.commands.recording as recording_cmd
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     session_dict = {"pid": 1, "audio_file": str(audio)}
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=session_dict, recording_id="rid123")
+            return StopResult(audio_file=str(audio), session=session_dict, recording_id="rid123")
 
     def _fake_transcribe(audio_file: str, **kwargs):
         assert audio_file == str(audio)
@@ -197,11 +286,11 @@ def test_stop_clipboard_verb_skips_typing_and_copies(
     import voicepipe.commands.recording as recording_cmd
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=None, recording_id="rid")
+            return StopResult(audio_file=str(audio), session=None, recording_id="rid")
 
     triggered: dict[str, str] = {}
 
@@ -259,11 +348,11 @@ def test_stop_routes_zwingli_command_via_triggers_when_enabled(
     import voicepipe.commands.recording as recording_cmd
 
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=None, recording_id="rid")
+            return StopResult(audio_file=str(audio), session=None, recording_id="rid")
 
     def _fake_transcribe(audio_file: str, **kwargs):
         return TranscriptionResult(
@@ -303,9 +392,9 @@ def _install_destination_fakes(
 
     session_dict = {"pid": 1, "audio_file": str(audio)}
 
-    class _FakeBackend:
+    class _FakeBackend(BackendStub):
         def stop(self):
-            return _StopResult(audio_file=str(audio), session=session_dict)
+            return StopResult(audio_file=str(audio), session=session_dict)
 
     clipboard_calls: list[str] = []
     typed: list[str] = []
@@ -350,7 +439,7 @@ def test_stop_clipboard_destination_copies_without_flags(
     isolated_home: Path,
 ) -> None:
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     clipboard_calls, typed = _install_destination_fakes(monkeypatch, audio, "clipboard")
 
@@ -368,7 +457,7 @@ def test_stop_clipboard_destination_overrides_type_flag(
     isolated_home: Path,
 ) -> None:
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     clipboard_calls, typed = _install_destination_fakes(monkeypatch, audio, "clipboard")
 
@@ -385,7 +474,7 @@ def test_stop_type_destination_types_without_flag(
     isolated_home: Path,
 ) -> None:
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     clipboard_calls, typed = _install_destination_fakes(monkeypatch, audio, "type")
 
@@ -402,7 +491,7 @@ def test_stop_type_destination_overrides_clipboard_flag(
     isolated_home: Path,
 ) -> None:
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     clipboard_calls, typed = _install_destination_fakes(monkeypatch, audio, "type")
 
@@ -419,7 +508,7 @@ def test_stop_both_destination_types_and_copies(
     isolated_home: Path,
 ) -> None:
     audio = tmp_path / "audio.wav"
-    audio.write_bytes(b"abc")
+    write_fake_wav(audio)
 
     clipboard_calls, typed = _install_destination_fakes(monkeypatch, audio, "both")
 
@@ -428,3 +517,37 @@ def test_stop_both_destination_types_and_copies(
     assert result.exit_code == 0, _combined_cli_output(result)
     assert typed == ["hello"]
     assert clipboard_calls == ["hello"]
+
+
+def test_record_entrypoint_exports_device_argument(monkeypatch) -> None:
+    import voicepipe.recording_subprocess as recording_subprocess
+
+    seen: dict[str, str | None] = {}
+    monkeypatch.delenv("VOICEPIPE_DEVICE", raising=False)
+    monkeypatch.setattr(
+        recording_subprocess,
+        "run_recording_subprocess",
+        lambda: seen.setdefault("device", os.environ.get("VOICEPIPE_DEVICE")),
+    )
+
+    result = CliRunner().invoke(main, ["_record", "--", "pulse:mic"])
+    assert result.exit_code == 0, result.output
+    assert seen["device"] == "pulse:mic"
+
+
+def test_recording_subprocess_entrypoint_skips_click() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, voicepipe.recording_subprocess as rs\n"
+        "seen = {}\n"
+        "rs.run_recording_subprocess = lambda *, ready_fd=None: seen.update(fd=ready_fd)\n"
+        "rs.main(['--ready-fd', '9', '--', '7'])\n"
+        "assert seen == {'fd': 9}\n"
+        "import os\n"
+        "assert os.environ['VOICEPIPE_DEVICE'] == '7'\n"
+        "assert 'click' not in sys.modules, 'click imported'\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
@@ -100,18 +100,138 @@ def test_service_uninstall_removes_unit_files(
     assert not (unit_dir / TARGET_UNIT).exists()
 
 
+def test_service_status_uses_single_show_call(
+    isolated_home: Path, fake_systemd: Path
+) -> None:
+    if sys.platform in ("win32", "darwin"):
+        pytest.skip("systemd is not supported on Windows/macOS")
+    runner = CliRunner()
+    assert runner.invoke(main, ["service", "install"]).exit_code == 0
+
+    fake_systemd.write_text("", encoding="utf-8")
+    result = runner.invoke(main, ["service", "status"])
+    assert result.exit_code == 0, result.output
+    assert f"{TARGET_UNIT}: inactive (dead) [disabled]" in result.output
+    assert f"{RECORDER_UNIT}: inactive (dead) [disabled]" in result.output
+    assert f"{TRANSCRIBER_UNIT}: inactive (dead) [disabled]" in result.output
+
+    calls = _read_json_lines(fake_systemd)
+    show_calls = [c for c in calls if "show" in c]
+    assert len(show_calls) == 1
+    assert [TARGET_UNIT, RECORDER_UNIT, TRANSCRIBER_UNIT] == show_calls[0][2:5]
+
+
+def _fake_status_props(monkeypatch, target_load_state: str) -> None:
+    import voicepipe.commands.service as service_cmd
+
+    def _show(units, _props):
+        out = {
+            unit: {
+                "LoadState": "loaded",
+                "ActiveState": "active",
+                "SubState": "running",
+                "UnitFileState": "enabled",
+            }
+            for unit in units
+        }
+        out[TARGET_UNIT] = {
+            "LoadState": target_load_state,
+            "ActiveState": "inactive",
+            "SubState": "dead",
+            "UnitFileState": "masked" if target_load_state == "masked" else "enabled",
+        }
+        return out
+
+    monkeypatch.setattr(service_cmd, "systemctl_path", lambda: "/usr/bin/systemctl")
+    monkeypatch.setattr(service_cmd, "systemctl_show_units", _show)
+
+
+@pytest.mark.parametrize(
+    ("load_state", "expected"),
+    [
+        ("loaded", f"{TARGET_UNIT}: inactive (dead) [enabled]"),
+        ("masked", f"{TARGET_UNIT}: inactive (dead) [masked]"),
+    ],
+)
+def test_service_status_lists_known_target(monkeypatch, load_state, expected) -> None:
+    _fake_status_props(monkeypatch, load_state)
+    result = CliRunner().invoke(main, ["service", "status"])
+    assert result.exit_code == 0, result.output
+    assert expected in result.output
+    assert f"{RECORDER_UNIT}: active (running) [enabled]" in result.output
+
+
+def test_service_status_hides_missing_target(monkeypatch) -> None:
+    _fake_status_props(monkeypatch, "not-found")
+    result = CliRunner().invoke(main, ["service", "status"])
+    assert result.exit_code == 0, result.output
+    assert TARGET_UNIT not in result.output
+    assert f"{TRANSCRIBER_UNIT}: active (running) [enabled]" in result.output
+
+
+def test_service_status_full_uses_single_status_call(
+    isolated_home: Path, fake_systemd: Path
+) -> None:
+    if sys.platform in ("win32", "darwin"):
+        pytest.skip("systemd is not supported on Windows/macOS")
+    runner = CliRunner()
+    assert runner.invoke(main, ["service", "install"]).exit_code == 0
+
+    fake_systemd.write_text("", encoding="utf-8")
+    result = runner.invoke(main, ["service", "status", "--full"])
+    assert result.exit_code == 0, result.output
+
+    calls = _read_json_lines(fake_systemd)
+    status_calls = [c for c in calls if "status" in c]
+    assert status_calls == [
+        ["--user", "--no-pager", "--full", "status", TARGET_UNIT, RECORDER_UNIT, TRANSCRIBER_UNIT]
+    ]
+
+
 def test_service_logs_uses_journalctl(fake_systemd: Path, monkeypatch) -> None:
     if sys.platform in ("win32", "darwin"):
         pytest.skip("systemd is not supported on Windows/macOS")
+    import subprocess
+
+    import voicepipe.commands.service as service_cmd
+
     runner = CliRunner()
     journal_log = fake_systemd.parent / "journalctl.log"
     monkeypatch.setenv("VOICEPIPE_TEST_JOURNALCTL_LOG", str(journal_log))
 
+    def run_instead_of_exec(path: str, argv: list[str]) -> None:
+        raise SystemExit(subprocess.run([path, *argv[1:]], check=False).returncode)
+
+    monkeypatch.setattr(service_cmd.os, "execv", run_instead_of_exec)
+
     result = runner.invoke(main, ["service", "logs", "--no-follow", "-n", "1"])
     assert result.exit_code == 0, result.output
     assert journal_log.exists()
 
 
+def test_service_logs_execs_journalctl(fake_systemd: Path, monkeypatch) -> None:
+    if sys.platform in ("win32", "darwin"):
+        pytest.skip("systemd is not supported on Windows/macOS")
+    import voicepipe.commands.service as service_cmd
+
+    calls: list[tuple[str, list[str]]] = []
+
+    def fake_execv(path: str, argv: list[str]) -> None:
+        calls.append((path, list(argv)))
+        raise SystemExit(0)
+
+    monkeypatch.setattr(service_cmd.os, "execv", fake_execv)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["service", "logs", "-n", "5"])
+    assert result.exit_code == 0, result.output
+    assert len(calls) == 1
+    path, argv = calls[0]
+    assert path.endswith("journalctl")
+    assert argv[0] == "journalctl"
+    assert argv[-3:] == ["-n", "5", "-f"]
+
+
 def test_service_commands_fail_on_windows(isolated_home: Path) -> None:
     if sys.platform != "win32":
         pytest.skip("Windows-only behavior")
@@ -37,3 +37,22 @@ def test_smoke_fails_when_expected_substring_missing(tmp_path: Path, monkeypatch
     assert result.exit_code != 0
     assert "Smoke test failed" in result.output
 
+
+def test_cli_import_defers_subcommand_modules() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, voicepipe.cli; "
+        "print(','.join(m for m in ('voicepipe.commands.doctor', "
+        "'voicepipe.commands.recording', 'voicepipe.commands.triggers') "
+        "if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=str(Path(__file__).resolve().parents[1]),
+    )
+    assert proc.stdout.strip() == ""
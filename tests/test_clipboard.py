@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import voicepipe.clipboard as clipboard
+
+if sys.platform in ("win32", "darwin"):  # pragma: no cover
+    pytest.skip("Linux clipboard tool selection", allow_module_level=True)
+
+
+def test_copy_to_clipboard_looks_up_each_tool_once(monkeypatch) -> None:
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+    monkeypatch.setenv("DISPLAY", ":0")
+    looked_up: list[str] = []
+
+    def fake_which(name: str):
+        looked_up.append(name)
+        return None
+
+    monkeypatch.setattr(clipboard.shutil, "which", fake_which)
+
+    ok, err = clipboard.copy_to_clipboard("hello")
+    assert ok is False
+    assert err is not None and "No clipboard tool found" in err
+    assert looked_up == ["wl-copy", "xclip", "xsel"]
+
+
+def test_copy_to_clipboard_prefers_x11_tool_on_x11(monkeypatch) -> None:
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+    monkeypatch.setenv("DISPLAY", ":0")
+    calls: list[list[str]] = []
+
+    monkeypatch.setattr(clipboard.shutil, "which", lambda name: f"/usr/bin/{name}")
+
+    def fake_run(cmd, **kwargs):
+        calls.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(clipboard.subprocess, "run", fake_run)
+
+    assert clipboard.copy_to_clipboard("hello") == (True, None)
+    assert calls == [["xclip", "-selection", "clipboard"]]
+
+
+def test_copy_to_clipboard_sends_utf8_bytes(monkeypatch) -> None:
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+    seen: list[dict] = []
+
+    monkeypatch.setattr(clipboard.shutil, "which", lambda name: f"/usr/bin/{name}")
+
+    def fake_run(cmd, **kwargs):
+        seen.append(kwargs)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(clipboard.subprocess, "run", fake_run)
+
+    assert clipboard.copy_to_clipboard("café") == (True, None)
+    assert seen[0]["input"] == "café".encode("utf-8")
+    assert "text" not in seen[0]
+    assert seen[0]["stdout"] is subprocess.DEVNULL
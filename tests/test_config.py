@@ -120,6 +120,12 @@ def test_read_env_file_strips_utf8_bom(tmp_path: Path, monkeypatch) -> None:
     assert os.environ.get("OPENAI_API_KEY") == "from-bom"
 
 
+def test_read_env_file_missing_or_unreadable_returns_empty(tmp_path: Path) -> None:
+    config = _reload_config()
+    assert config.read_env_file(tmp_path / "missing.env") == {}
+    assert config.read_env_file(tmp_path) == {}
+
+
 def test_ensure_env_file_creates_template(tmp_path: Path, monkeypatch) -> None:
     config = _reload_config()
     monkeypatch.setenv("HOME", str(tmp_path))
@@ -1026,3 +1032,40 @@ def test_profile_extends_normalizes_parent_name_case() -> None:
         }
     )
     assert profiles["child"].temperature == 0.4
+
+
+def test_load_environment_only_loads_dotenv_when_found(tmp_path: Path, monkeypatch) -> None:
+    import types
+
+    config = _reload_config()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    calls: list[str] = []
+    fake = types.ModuleType("dotenv")
+    fake.load_dotenv = lambda path, override=False: calls.append(path)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "dotenv", fake)
+
+    monkeypatch.setattr(config, "_find_local_dotenv", lambda: None)
+    config.load_environment()
+    assert calls == []
+
+    monkeypatch.setattr(config, "_find_local_dotenv", lambda: "/proj/.env")
+    monkeypatch.setattr(config, "_ENV_LOADED", False)
+    config.load_environment()
+    assert calls == ["/proj/.env"]
+
+
+def test_find_local_dotenv_checks_cwd_then_config_dir(tmp_path: Path, monkeypatch) -> None:
+    config = _reload_config()
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    cwd = tmp_path / "work"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+
+    assert config._find_local_dotenv() is None
+
+    user_env = config.config_dir(create=True) / ".env"
+    user_env.write_text("A=1\n", encoding="utf-8")
+    assert config._find_local_dotenv() == str(user_env)
+
+    (cwd / ".env").write_text("A=2\n", encoding="utf-8")
+    assert config._find_local_dotenv() == str(cwd / ".env")
@@ -43,3 +43,113 @@ def test_fast_main_does_not_crash_when_stdio_missing(monkeypatch) -> None:
     with pytest.raises(SystemExit) as exc:
         fast.main(["--help"])
     assert exc.value.code == 0
+
+
+def test_fast_main_status_and_cancel(monkeypatch, capsys) -> None:
+    import voicepipe.fast as fast
+    from voicepipe.recording_backend import CancelResult, StatusResult
+
+    calls: list[str] = []
+
+    class _Backend:
+        def status(self):
+            calls.append("status")
+            return StatusResult(mode="subprocess", status="recording", pid=1)
+
+        def cancel(self):
+            calls.append("cancel")
+            return CancelResult(mode="subprocess")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            calls.append("close")
+
+    monkeypatch.setattr(fast, "AutoRecorderBackend", _Backend)
+
+    fast.main(["status"])
+    assert capsys.readouterr().out == "recording\n"
+    fast.main(["cancel"])
+    assert calls == ["status", "close", "status", "cancel", "close"]
+
+
+def test_fast_stop_skips_upload_for_header_only_wav(
+    tmp_path, monkeypatch, capsys, isolated_home
+) -> None:
+    import voicepipe.fast as fast
+    from voicepipe.paths import preserved_audio_dir
+    from voicepipe.recording_backend import StatusResult, StopResult
+
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + b"\0" * 40)
+
+    class _Backend:
+        def status(self):
+            return StatusResult(mode="subprocess", status="recording", pid=1)
+
+        def stop(self):
+            return StopResult(mode="subprocess", audio_file=str(audio))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            pass
+
+    def _no_upload(*_a, **_k):
+        raise AssertionError("transcription attempted for an empty recording")
+
+    monkeypatch.setattr(fast, "AutoRecorderBackend", _Backend)
+    monkeypatch.setattr(fast, "send_transcribe_request_result", _no_upload)
+
+    with pytest.raises(SystemExit) as exc:
+        fast.main(["stop"])
+    assert exc.value.code == 1
+    assert "No audio captured (44 bytes recorded)" in capsys.readouterr().err
+    assert (preserved_audio_dir() / audio.name).exists()
+
+
+def test_fast_stop_transcribes_after_backend_closes(
+    tmp_path, monkeypatch, capsys, isolated_home
+) -> None:
+    import voicepipe.fast as fast
+    from tests._recording_stubs import write_fake_wav
+    from voicepipe.recording_backend import StatusResult, StopResult
+    from voicepipe.transcription_result import TranscriptionResult
+
+    audio = write_fake_wav(tmp_path / "audio.wav")
+    calls: list[str] = []
+
+    class _Backend:
+        def status(self):
+            return StatusResult(mode="daemon", status="recording", pid=1)
+
+        def stop(self):
+            calls.append("stop")
+            return StopResult(mode="daemon", audio_file=str(audio))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            calls.append("close")
+
+    def _transcribe(audio_file, **_k):
+        calls.append("transcribe")
+        return TranscriptionResult(
+            text="hello",
+            backend="openai",
+            model="gpt-test",
+            audio_file=audio_file,
+            recording_id=None,
+            source="fast-stop",
+            warnings=[],
+        )
+
+    monkeypatch.setattr(fast, "AutoRecorderBackend", _Backend)
+    monkeypatch.setattr(fast, "send_transcribe_request_result", _transcribe)
+
+    fast.main(["stop"])
+    assert calls == ["stop", "close", "transcribe"]
+    assert capsys.readouterr().out == "hello\n"
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from voicepipe.ipc import IpcProtocolError, _read_json_message
+from voicepipe.ipc import IpcProtocolError, _read_json_message, encode_json_message
 
 
 class _FakeSock:
@@ -27,3 +27,40 @@ def test_read_json_message_rejects_oversize_response() -> None:
     sock = _FakeSock([b"x" * 11])
     with pytest.raises(IpcProtocolError):
         _read_json_message(sock, max_bytes=10)
+
+
+def test_read_json_message_stops_at_reply_newline() -> None:
+    sock = _FakeSock([b'{"ok":', b' true}\n', b"unread"])
+    out = _read_json_message(sock, max_bytes=1024)
+    assert json.loads(out.decode()) == {"ok": True}
+    assert sock._chunks == [b"unread"]
+
+
+def test_read_json_message_only_trial_parses_at_closing_brace(monkeypatch) -> None:
+    import voicepipe.ipc as ipc
+
+    parsed: list[bytes] = []
+    real_loads = json.loads
+
+    def _loads(raw):
+        parsed.append(raw)
+        return real_loads(raw)
+
+    monkeypatch.setattr(ipc.json, "loads", _loads)
+    sock = _FakeSock([b'{"status": "idle", ', b'"nested": {"a": 1}', b"}"])
+    out = _read_json_message(sock, max_bytes=1024)
+    assert real_loads(out.decode()) == {"status": "idle", "nested": {"a": 1}}
+    assert len(parsed) == 2
+
+
+def test_read_json_message_returns_single_segment_reply_uncopied() -> None:
+    reply = b'{"status": "idle"}\n'
+    sock = _FakeSock([reply])
+    assert _read_json_message(sock, max_bytes=1024) is reply
+
+
+def test_encode_json_message_keeps_utf8_raw_and_newline_framed() -> None:
+    raw = encode_json_message({"audio_file": "/tmp/caf\u00e9\nx.wav", "ok": True})
+    assert raw.endswith(b"\n") and raw.count(b"\n") == 1
+    assert "café".encode("utf-8") in raw
+    assert json.loads(raw.decode("utf-8")) == {"audio_file": "/tmp/café\nx.wav", "ok": True}
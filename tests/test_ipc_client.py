@@ -10,7 +10,13 @@ from pathlib import Path
 import pytest
 import sys
 
-from voicepipe.ipc import IpcProtocolError, IpcUnavailable, send_request, try_send_request
+from voicepipe.ipc import (
+    IpcClient,
+    IpcProtocolError,
+    IpcUnavailable,
+    send_request,
+    try_send_request,
+)
 
 if sys.platform == "win32":  # pragma: no cover
     pytest.skip("AF_UNIX integration tests are skipped on Windows CI", allow_module_level=True)
@@ -102,3 +108,93 @@ def test_try_send_request_returns_none_when_socket_missing(tmp_path: Path) -> No
 def test_send_request_raises_when_socket_missing(tmp_path: Path) -> None:
     with pytest.raises(IpcUnavailable):
         send_request("status", socket_path=tmp_path / "missing.sock")
+
+
+def test_ipc_client_reuses_one_connection(tmp_path: Path) -> None:
+    with _unix_socket_path(tmp_path, "voicepipe.sock") as sock_path:
+        seen: list[str] = []
+
+        def handler(conn: socket.socket) -> None:
+            buf = b""
+            while True:
+                while b"\n" not in buf:
+                    chunk = conn.recv(4096)
+                    if not chunk:
+                        return
+                    buf += chunk
+                line, buf = buf.split(b"\n", 1)
+                req = json.loads(line.decode("utf-8"))
+                seen.append(req["command"])
+                conn.sendall(json.dumps({"command": req["command"]}).encode() + b"\n")
+
+        t = _start_ipc_server(sock_path, handler)
+        with IpcClient(sock_path, connect_timeout=1.0) as client:
+            for command in ("status", "start", "stop"):
+                assert client.send(command, read_timeout=1.0) == {"command": command}
+        t.join(timeout=1.0)
+        # The test server accepts exactly one connection.
+        assert seen == ["status", "start", "stop"]
+
+
+def test_ipc_client_reconnects_when_daemon_closes_after_reply(tmp_path: Path, monkeypatch) -> None:
+    import voicepipe.ipc as ipc
+
+    with _unix_socket_path(tmp_path, "voicepipe.sock") as sock_path:
+        sock_path.parent.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(sock_path))
+        server.listen(2)
+
+        def _run() -> None:
+            # Single-shot daemon: one reply per connection, then hang up.
+            for _ in range(2):
+                conn, _ = server.accept()
+                with conn:
+                    req = json.loads(conn.recv(4096).decode("utf-8"))
+                    conn.sendall(json.dumps({"command": req["command"]}).encode())
+            server.close()
+
+        t = threading.Thread(target=_run, daemon=True)
+        t.start()
+        probes: list[object] = []
+        real_existing = ipc._existing_socket_paths
+
+        def _counting(socket_path):
+            probes.append(socket_path)
+            return real_existing(socket_path)
+
+        monkeypatch.setattr(ipc, "_existing_socket_paths", _counting)
+        with IpcClient(sock_path, connect_timeout=1.0) as client:
+            assert client.send("status", read_timeout=1.0) == {"command": "status"}
+            assert client.send("stop", read_timeout=1.0) == {"command": "stop"}
+        t.join(timeout=1.0)
+        # The reconnect goes straight to the path that worked the first time.
+        assert len(probes) == 1
+
+
+def test_ipc_client_try_send_returns_none_when_socket_missing(tmp_path: Path) -> None:
+    with IpcClient(tmp_path / "missing.sock") as client:
+        assert client.try_send("status") is None
+
+
+def test_daemon_serves_several_requests_per_connection() -> None:
+    from voicepipe.daemon import RecordingDaemon
+
+    daemon = RecordingDaemon.__new__(RecordingDaemon)
+    daemon._state_lock = threading.Lock()
+    daemon._get_status = lambda: {"status": "idle"}  # type: ignore[method-assign]
+
+    server_end, client_end = socket.socketpair()
+    t = threading.Thread(target=daemon._handle_client, args=(server_end,), daemon=True)
+    t.start()
+    with client_end:
+        client_end.sendall(b'{"command": "status"}\n{"command": "bogus"}\n')
+        buf = b""
+        while buf.count(b"\n") < 2:
+            chunk = client_end.recv(4096)
+            assert chunk
+            buf += chunk
+    t.join(timeout=1.0)
+    first, second = buf.splitlines()
+    assert json.loads(first) == {"status": "idle"}
+    assert json.loads(second) == {"error": "Unknown command: bogus"}
@@ -91,3 +91,74 @@ def test_doctor_artifacts_dir_creates_dirs(tmp_path: Path, monkeypatch) -> None:
         monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
     out = paths.doctor_artifacts_dir(create=True)
     assert out.exists()
+
+
+def test_move_file_renames_on_same_filesystem(tmp_path: Path) -> None:
+    from voicepipe.platform import move_file
+
+    src = tmp_path / "a.wav"
+    src.write_bytes(b"RIFF")
+    dst = tmp_path / "b.wav"
+    assert move_file(src, dst) == str(dst)
+    assert not src.exists()
+    assert dst.read_bytes() == b"RIFF"
+
+
+def test_move_file_copies_across_devices(tmp_path: Path, monkeypatch) -> None:
+    import errno
+    import os
+    import sys
+
+    import pytest
+
+    import voicepipe.platform as platform_mod
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("sendfile copies are only used on Linux")
+
+    def cross_device(_src, _dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(platform_mod.os, "rename", cross_device)
+    src = tmp_path / "a.wav"
+    payload = os.urandom(200_000)
+    src.write_bytes(payload)
+    os.utime(src, (1_000_000_000, 1_000_000_000))
+    dst = tmp_path / "preserved" / "a.wav"
+    dst.parent.mkdir()
+    assert platform_mod.move_file(src, dst) == str(dst)
+    assert not src.exists()
+    assert dst.read_bytes() == payload
+    assert int(dst.stat().st_mtime) == 1_000_000_000
+
+
+def test_move_file_falls_back_when_sendfile_fails(tmp_path: Path, monkeypatch) -> None:
+    import errno
+    import os
+    import shutil
+
+    import voicepipe.platform as platform_mod
+
+    def cross_device(_src, _dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    def no_sendfile(*_args):
+        raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+    moved: list[tuple[str, str]] = []
+
+    def fake_move(src, dst):
+        moved.append((src, dst))
+        return dst
+
+    monkeypatch.setattr(platform_mod.os, "rename", cross_device)
+    monkeypatch.setattr(platform_mod.os, "sendfile", no_sendfile, raising=False)
+    monkeypatch.setattr(platform_mod.sys, "platform", "linux")
+    monkeypatch.setattr(shutil, "move", fake_move)
+    src = tmp_path / "a.wav"
+    src.write_bytes(b"RIFF" * 100)
+    dst = tmp_path / "b.wav"
+    assert platform_mod.move_file(src, dst) == str(dst)
+    assert moved == [(str(src), str(dst))]
+    assert src.exists()
+    assert not dst.exists()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import importlib
-import io
 import json
+import os
 import signal
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -18,9 +19,9 @@ def _reload_backend():
     return session, recording_backend
 
 
-def test_daemon_backend_unavailable_when_try_send_request_returns_none(monkeypatch) -> None:
+def test_daemon_backend_unavailable_when_try_send_returns_none(monkeypatch) -> None:
     _session, rb = _reload_backend()
-    monkeypatch.setattr(rb, "try_send_request", lambda *args, **kwargs: None)
+    monkeypatch.setattr(rb.IpcClient, "try_send", lambda *args, **kwargs: None)
     backend = rb.DaemonRecorderBackend()
     with pytest.raises(rb.BackendUnavailable):
         backend.status()
@@ -28,14 +29,16 @@ def test_daemon_backend_unavailable_when_try_send_request_returns_none(monkeypat
 
 def test_daemon_backend_raises_recording_error_on_error_payload(monkeypatch) -> None:
     _session, rb = _reload_backend()
-    monkeypatch.setattr(rb, "try_send_request", lambda *args, **kwargs: {"error": "boom"})
+    monkeypatch.setattr(rb.IpcClient, "try_send", lambda *args, **kwargs: {"error": "boom"})
     backend = rb.DaemonRecorderBackend()
     with pytest.raises(rb.RecordingError) as exc:
         backend.status()
     assert "boom" in str(exc.value)
 
 
-def test_subprocess_backend_start_sets_device_env(tmp_path: Path, monkeypatch) -> None:
+def test_subprocess_backend_start_passes_device_argv(
+    tmp_path: Path, monkeypatch, isolated_home: Path
+) -> None:
     _session, rb = _reload_backend()
 
     monkeypatch.setattr(rb.RecordingSession, "find_active_sessions", lambda: [])
@@ -46,19 +49,14 @@ def test_subprocess_backend_start_sets_device_env(tmp_path: Path, monkeypatch) -
     class _FakeProc:
         pid = 123
 
-        def __init__(self):
-            self.stderr = io.StringIO("")
-
         def poll(self):
             return None
 
-    def fake_popen(argv, **kwargs):
+    def fake_spawn(argv, **kwargs):
         captured["argv"] = argv
         captured["env"] = kwargs.get("env")
         return _FakeProc()
 
-    monkeypatch.setattr(rb.subprocess, "Popen", fake_popen)
-
     state_file = tmp_path / "voicepipe-123.json"
     state_file.write_text(
         json.dumps(
@@ -72,17 +70,62 @@ def test_subprocess_backend_start_sets_device_env(tmp_path: Path, monkeypatch) -
         encoding="utf-8",
     )
     monkeypatch.setattr(rb.RecordingSession, "get_state_file", lambda _pid=None: state_file)
-    monkeypatch.setattr(rb.RecordingSession, "get_current_session", lambda: json.loads(state_file.read_text(encoding="utf-8")))
 
     backend = rb.SubprocessRecorderBackend()
+    monkeypatch.setattr(backend, "_spawn", fake_spawn)
     out = backend.start(device=12)
     assert out.mode == "subprocess"
     assert out.pid == 123
-    assert isinstance(captured.get("env"), dict)
-    assert captured["env"]["VOICEPIPE_DEVICE"] == "12"  # type: ignore[index]
+    argv = captured["argv"]
+    assert argv[1:3] == ["-m", "voicepipe.recording_subprocess"]  # type: ignore[index]
+    assert argv[-2:] == ["--", "12"]  # type: ignore[index]
+    assert captured.get("env") is None
+
+
+@pytest.mark.skipif(os.name != "posix", reason="ready pipe is POSIX-only")
+def test_subprocess_backend_start_wakes_on_ready_pipe(
+    tmp_path: Path, monkeypatch, isolated_home: Path
+) -> None:
+    import threading
+    import time
+
+    _session, rb = _reload_backend()
+    monkeypatch.setattr(rb.RecordingSession, "find_active_sessions", lambda: [])
+
+    class _FakeProc:
+        pid = 123
+
+        def poll(self):
+            return None
+
+    state_file = tmp_path / "voicepipe-123.json"
+    monkeypatch.setattr(rb.RecordingSession, "get_state_file", lambda _pid=None: state_file)
+
+    def fake_spawn(argv, *, stderr, pass_fds=(), **kwargs):
+        assert argv[argv.index("--ready-fd") + 1] == str(pass_fds[0])
+        ready_w = os.dup(pass_fds[0])
+
+        def _child() -> None:
+            time.sleep(0.2)
+            state_file.write_text(
+                json.dumps({"pid": 123, "control_path": str(tmp_path / "ctl")}),
+                encoding="utf-8",
+            )
+            os.write(ready_w, b"1")
+            os.close(ready_w)
+
+        threading.Thread(target=_child, daemon=True).start()
+        return _FakeProc()
+
+    backend = rb.SubprocessRecorderBackend()
+    monkeypatch.setattr(backend, "_spawn", fake_spawn)
+    started = time.monotonic()
+    out = backend.start(device=None)
+    assert out.pid == 123
+    assert time.monotonic() - started < 2.0
 
 
-def test_subprocess_backend_start_raises_on_early_exit(monkeypatch) -> None:
+def test_subprocess_backend_start_raises_on_early_exit(monkeypatch, isolated_home: Path) -> None:
     _session, rb = _reload_backend()
 
     monkeypatch.setattr(rb.RecordingSession, "find_active_sessions", lambda: [])
@@ -91,18 +134,22 @@ def test_subprocess_backend_start_raises_on_early_exit(monkeypatch) -> None:
     class _FakeProc:
         pid = 123
 
-        def __init__(self):
-            self.stderr = io.StringIO("bad things happened")
-
         def poll(self):
             return 1
 
-    monkeypatch.setattr(rb.subprocess, "Popen", lambda *a, **k: _FakeProc())
+    def fake_spawn(argv, *, stderr, **kwargs):
+        os.write(stderr, b"bad things happened\n")
+        return _FakeProc()
+
+    # Output from earlier runs in the shared log must not leak into the error.
+    (rb.logs_dir(create=True) / rb._RECORDER_LOG_NAME).write_bytes(b"old run\n")
 
     backend = rb.SubprocessRecorderBackend()
+    monkeypatch.setattr(backend, "_spawn", fake_spawn)
     with pytest.raises(rb.RecordingError) as exc:
         backend.start(device=None)
     assert "bad things happened" in str(exc.value)
+    assert "old run" not in str(exc.value)
 
 
 def test_subprocess_backend_stop_sends_sigterm(monkeypatch) -> None:
@@ -118,6 +165,7 @@ def test_subprocess_backend_stop_sends_sigterm(monkeypatch) -> None:
     calls: list[tuple[str, str]] = []
 
     monkeypatch.setattr(rb, "pid_is_running", lambda _pid: False)
+    monkeypatch.setattr(rb, "open_pidfd", lambda _pid: None)
 
     def fake_write_control(control_path: str, command: str) -> None:
         calls.append((control_path, command))
@@ -130,6 +178,91 @@ def test_subprocess_backend_stop_sends_sigterm(monkeypatch) -> None:
     assert calls == [("/tmp/ctl", "stop")]
 
 
+@pytest.mark.skipif(
+    not hasattr(signal, "pidfd_send_signal") or not hasattr(os, "pidfd_open"),
+    reason="pidfd signalling unavailable",
+)
+def test_subprocess_backend_stop_signals_child_through_pidfd(tmp_path: Path, monkeypatch) -> None:
+    import subprocess
+    import sys
+    import time
+
+    _session, rb = _reload_backend()
+
+    # The child ignores the control file entirely, so only the signal can stop it.
+    child = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import signal, sys, time\n"
+            "signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(30)\n",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert child.stdout is not None
+        assert child.stdout.readline().strip() == "ready"
+        monkeypatch.setattr(
+            rb.RecordingSession,
+            "get_current_session",
+            lambda: {
+                "pid": child.pid,
+                "audio_file": str(tmp_path / "a.wav"),
+                "control_path": str(tmp_path / "ctl"),
+                "started_at": datetime.now().isoformat(),
+            },
+        )
+        backend = rb.SubprocessRecorderBackend()
+        t0 = time.monotonic()
+        backend.stop()
+        assert time.monotonic() - t0 < 5.0
+        assert (tmp_path / "ctl").read_text(encoding="utf-8").strip() == "stop"
+        assert child.wait(timeout=1.0) == 0
+    finally:
+        if child.poll() is None:
+            child.kill()
+            child.wait()
+
+
+@pytest.mark.skipif(
+    not Path("/proc/self/stat").exists(), reason="process start times unavailable"
+)
+def test_subprocess_backend_stop_leaves_recycled_pid_alone(tmp_path: Path, monkeypatch) -> None:
+    import subprocess
+    import sys
+
+    _session, rb = _reload_backend()
+
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+    )
+    try:
+        # A stale session from before this process existed: its PID has been reused.
+        monkeypatch.setattr(
+            rb.RecordingSession,
+            "get_current_session",
+            lambda: {
+                "pid": child.pid,
+                "audio_file": str(tmp_path / "a.wav"),
+                "control_path": str(tmp_path / "ctl"),
+                "started_at": "2000-01-01T00:00:00",
+            },
+        )
+        signalled: list[int] = []
+        monkeypatch.setattr(rb, "signal_pidfd", lambda _fd, signum: signalled.append(signum))
+
+        backend = rb.SubprocessRecorderBackend()
+        backend.stop()
+        assert signalled == []
+        assert child.poll() is None
+    finally:
+        child.kill()
+        child.wait()
+
+
 def test_subprocess_backend_cancel_cleans_up_audio_file(tmp_path: Path, monkeypatch) -> None:
     _session, rb = _reload_backend()
 
@@ -143,6 +276,7 @@ def test_subprocess_backend_cancel_cleans_up_audio_file(tmp_path: Path, monkeypa
 
     monkeypatch.setattr(rb.RecordingSession, "cleanup_session", lambda s: cleaned.append(s))
     monkeypatch.setattr(rb, "pid_is_running", lambda _pid: False)
+    monkeypatch.setattr(rb, "open_pidfd", lambda _pid: None)
 
     calls: list[tuple[str, str]] = []
 
@@ -182,6 +316,15 @@ def test_auto_backend_falls_back_to_subprocess(monkeypatch) -> None:
     assert out.pid == 999
 
 
+def test_auto_backend_close_closes_daemon_connection(monkeypatch) -> None:
+    _session, rb = _reload_backend()
+
+    closed: list[bool] = []
+    with rb.AutoRecorderBackend() as backend:
+        monkeypatch.setattr(backend._daemon._client, "close", lambda: closed.append(True))
+    assert closed == [True]
+
+
 def test_auto_backend_stop_prefers_subprocess_when_daemon_idle(monkeypatch) -> None:
     _session, rb = _reload_backend()
 
@@ -192,21 +335,19 @@ def test_auto_backend_stop_prefers_subprocess_when_daemon_idle(monkeypatch) -> N
         "status",
         lambda: rb.StatusResult(mode="daemon", status="idle", pid=123),
     )
-    monkeypatch.setattr(
-        backend._subprocess,
-        "status",
-        lambda: rb.StatusResult(mode="subprocess", status="recording", pid=777),
-    )
+    session = {"pid": 777, "audio_file": "/tmp/a.wav", "control_path": "/tmp/ctl"}
+    monkeypatch.setattr(backend._subprocess, "current_session", lambda: session)
     monkeypatch.setattr(backend._daemon, "stop", lambda: (_ for _ in ()).throw(AssertionError()))
     monkeypatch.setattr(
         backend._subprocess,
         "stop",
-        lambda: rb.StopResult(mode="subprocess", audio_file="/tmp/a.wav", session={}),
+        lambda *, session: rb.StopResult(mode="subprocess", audio_file="/tmp/a.wav", session=session),
     )
 
     out = backend.stop()
     assert out.mode == "subprocess"
     assert out.audio_file == "/tmp/a.wav"
+    assert out.session is session
 
 
 def test_auto_backend_stop_prefers_daemon_when_recording(monkeypatch) -> None:
@@ -219,11 +360,7 @@ def test_auto_backend_stop_prefers_daemon_when_recording(monkeypatch) -> None:
         "status",
         lambda: rb.StatusResult(mode="daemon", status="recording", pid=123),
     )
-    monkeypatch.setattr(
-        backend._subprocess,
-        "status",
-        lambda: rb.StatusResult(mode="subprocess", status="recording", pid=777),
-    )
+    monkeypatch.setattr(backend._subprocess, "current_session", lambda: {"pid": 777})
     monkeypatch.setattr(
         backend._daemon,
         "stop",
@@ -233,13 +370,13 @@ def test_auto_backend_stop_prefers_daemon_when_recording(monkeypatch) -> None:
         monkeypatch.setattr(
             backend._subprocess,
             "stop",
-            lambda: rb.StopResult(mode="subprocess", audio_file="/tmp/s.wav", session=None),
+            lambda **_k: rb.StopResult(mode="subprocess", audio_file="/tmp/s.wav", session=None),
         )
     else:
         monkeypatch.setattr(
             backend._subprocess,
             "stop",
-            lambda: (_ for _ in ()).throw(AssertionError()),
+            lambda **_k: (_ for _ in ()).throw(AssertionError()),
         )
 
     out = backend.stop()
@@ -261,16 +398,12 @@ def test_auto_backend_cancel_prefers_subprocess_when_daemon_idle(monkeypatch) ->
         "status",
         lambda: rb.StatusResult(mode="daemon", status="idle", pid=123),
     )
-    monkeypatch.setattr(
-        backend._subprocess,
-        "status",
-        lambda: rb.StatusResult(mode="subprocess", status="recording", pid=777),
-    )
+    monkeypatch.setattr(backend._subprocess, "current_session", lambda: {"pid": 777})
     monkeypatch.setattr(backend._daemon, "cancel", lambda: (_ for _ in ()).throw(AssertionError()))
     monkeypatch.setattr(
         backend._subprocess,
         "cancel",
-        lambda: rb.CancelResult(mode="subprocess"),
+        lambda *, session: rb.CancelResult(mode="subprocess"),
     )
 
     out = backend.cancel()
@@ -296,3 +429,166 @@ def test_auto_backend_status_prefers_subprocess_when_daemon_idle(monkeypatch) ->
     out = backend.status()
     assert out.mode == "subprocess"
     assert out.status == "recording"
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="posix_spawn unavailable")
+def test_posix_spawn_redirects_stderr_and_reports_exit_code(tmp_path: Path) -> None:
+    import sys
+    import time
+
+    _session, rb = _reload_backend()
+    backend = rb.SubprocessRecorderBackend()
+    log_path = tmp_path / "child.log"
+    with open(log_path, "ab") as log_fh:
+        proc = backend._posix_spawn(
+            [
+                sys.executable,
+                "-c",
+                "import os, sys\n"
+                "sys.stderr.write(f'boom sid={os.getsid(0) == os.getpid()}')\n"
+                "sys.exit(3)\n",
+            ],
+            stderr=log_fh.fileno(),
+            env={},
+        )
+    while proc.poll() is None:
+        time.sleep(0.01)
+    assert proc.returncode == 3
+    assert log_path.read_text(encoding="utf-8") == "boom sid=True"
+
+
+def test_spawn_forks_recorder_when_single_threaded(monkeypatch) -> None:
+    _session, rb = _reload_backend()
+    backend = rb.SubprocessRecorderBackend()
+    forked: list[list[str]] = []
+    monkeypatch.setattr(rb, "_can_fork_recorder", lambda: True)
+    monkeypatch.setattr(
+        backend,
+        "_fork_recorder",
+        lambda args, *, stderr, pass_fds: forked.append(args) or "forked",
+    )
+
+    assert backend._spawn(["py", "-m", rb._RECORDER_MODULE, "--", "3"], stderr=2) == "forked"
+    assert forked == [["--", "3"]]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork unavailable")
+def test_fork_recorder_runs_entrypoint_with_stderr_redirected(tmp_path: Path, monkeypatch) -> None:
+    import time
+
+    import voicepipe.recording_subprocess as recording_subprocess
+
+    _session, rb = _reload_backend()
+
+    def fake_main(args):
+        os.write(2, f"args={args}".encode())
+        raise SystemExit(3)
+
+    monkeypatch.setattr(recording_subprocess, "main", fake_main)
+    backend = rb.SubprocessRecorderBackend()
+    log_path = tmp_path / "child.log"
+    with open(log_path, "ab") as log_fh:
+        proc = backend._fork_recorder(["--", "5"], stderr=log_fh.fileno())
+    while proc.poll() is None:
+        time.sleep(0.01)
+    assert proc.returncode == 3
+    assert log_path.read_text(encoding="utf-8") == "args=['--', '5']"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork unavailable")
+def test_fork_recorder_closes_fds_not_passed(tmp_path: Path, monkeypatch) -> None:
+    import time
+
+    import voicepipe.recording_subprocess as recording_subprocess
+
+    _session, rb = _reload_backend()
+    ready_r, ready_w = os.pipe()
+
+    def fake_main(_args):
+        still_open = []
+        for fd in (ready_r, ready_w, log_fh.fileno()):
+            try:
+                os.fstat(fd)
+            except OSError:
+                continue
+            still_open.append(fd)
+        os.write(2, repr(still_open).encode())
+
+    monkeypatch.setattr(recording_subprocess, "main", fake_main)
+    backend = rb.SubprocessRecorderBackend()
+    log_path = tmp_path / "child.log"
+    try:
+        with open(log_path, "ab") as log_fh:
+            proc = backend._fork_recorder([], stderr=log_fh.fileno(), pass_fds=(ready_w,))
+        while proc.poll() is None:
+            time.sleep(0.01)
+    finally:
+        os.close(ready_r)
+        os.close(ready_w)
+    assert proc.returncode == 0
+    assert log_path.read_text(encoding="utf-8") == repr([ready_w])
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd_open unavailable")
+def test_wait_for_pid_exit_wakes_on_child_exit() -> None:
+    import subprocess
+    import sys
+    import time
+
+    from voicepipe.platform import wait_for_pid_exit
+
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
+    try:
+        t0 = time.monotonic()
+        assert wait_for_pid_exit(proc.pid, timeout_s=5.0)
+        assert time.monotonic() - t0 < 4.0
+    finally:
+        proc.wait()
+
+
+def test_wait_for_pid_exit_times_out_for_running_process() -> None:
+    from voicepipe.platform import wait_for_pid_exit
+
+    assert wait_for_pid_exit(os.getpid(), timeout_s=0.05) is False
+
+
+def test_wait_for_pid_exit_polling_backs_off(monkeypatch) -> None:
+    import voicepipe.platform as platform
+
+    running = iter([True, True, True, False])
+    sleeps: list[float] = []
+    monkeypatch.setattr(platform, "open_pidfd", lambda _pid: None)
+    monkeypatch.setattr(platform, "pid_is_running", lambda _pid: next(running))
+    monkeypatch.setattr(platform.time, "sleep", sleeps.append)
+
+    assert platform.wait_for_pid_exit(4242, timeout_s=5.0, poll_s=0.003) is True
+    assert sleeps == [0.001, 0.002, 0.003]
+
+
+def test_wait_for_pid_exit_uses_kqueue_without_pidfd(monkeypatch) -> None:
+    import select
+
+    import voicepipe.platform as platform
+
+    registered: list[tuple] = []
+
+    class _FakeKqueue:
+        def control(self, changes, max_events, timeout):
+            registered.append((changes, max_events, timeout))
+            return ["exit-event"]
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(platform, "open_pidfd", lambda _pid: None)
+    monkeypatch.setattr(
+        platform, "pid_is_running", lambda _pid: pytest.fail("polled despite kqueue")
+    )
+    monkeypatch.setattr(select, "kqueue", _FakeKqueue, raising=False)
+    monkeypatch.setattr(select, "kevent", lambda ident, **kw: (ident, kw), raising=False)
+    for name in ("KQ_FILTER_PROC", "KQ_EV_ADD", "KQ_EV_ONESHOT", "KQ_NOTE_EXIT"):
+        monkeypatch.setattr(select, name, 1, raising=False)
+
+    assert platform.wait_for_pid_exit(4242, timeout_s=5.0) is True
+    assert registered[0][0][0][0] == 4242
+    assert registered[0][2] == 5.0
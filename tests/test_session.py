@@ -38,3 +38,38 @@ def test_create_and_cleanup_session(tmp_path: Path, monkeypatch) -> None:
 
     session.RecordingSession.cleanup_session(s)
     assert not state_file.exists()
+
+
+def test_find_active_sessions_prunes_stale_state_files(tmp_path: Path, monkeypatch) -> None:
+    import json
+
+    if sys.platform == "win32":
+        monkeypatch.setenv("TEMP", str(tmp_path))
+        monkeypatch.setenv("TMP", str(tmp_path))
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    else:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    session = _reload_session()
+    rs = session.RecordingSession
+
+    assert rs.find_active_sessions() == []
+
+    live = rs.create_session()
+    state_dir = rs.state_dir()
+    stale = state_dir / f"{rs.STATE_PREFIX}999999999.json"
+    stale_control = state_dir / f"{rs.STATE_PREFIX}999999999.control"
+    stale_control.write_text("", encoding="utf-8")
+    stale.write_text(
+        json.dumps({"pid": 999999999, "control_path": str(stale_control)}), encoding="utf-8"
+    )
+    unrelated = state_dir / "other.json"
+    unrelated.write_text("{}", encoding="utf-8")
+
+    assert rs.find_active_sessions() == [live]
+    assert rs.read_session(int(live["pid"])) == live
+    assert not stale.exists()
+    assert not stale_control.exists()
+    assert unrelated.exists()
+
+    rs.cleanup_session(live)
+    assert rs.read_session(int(live["pid"])) is None
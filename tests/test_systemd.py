@@ -42,3 +42,31 @@ def test_install_user_units_writes_three_units(tmp_path: Path) -> None:
     assert "Voicepipe (Recorder + Transcriber)" in result.target_path.read_text(
         encoding="utf-8"
     )
+
+
+def test_systemctl_show_units_matches_blocks_by_id(monkeypatch) -> None:
+    import subprocess
+
+    import voicepipe.systemd as systemd
+
+    # Out of argument order, an extra blank separator, and no block at all
+    # for the transcriber.
+    stdout = (
+        f"Id={RECORDER_UNIT}\nLoadState=loaded\nActiveState=active\n\n\n"
+        f"Id={TARGET_UNIT}\nLoadState=masked\nActiveState=inactive\n"
+    )
+    monkeypatch.setattr(systemd, "systemctl_path", lambda: "/usr/bin/systemctl")
+    monkeypatch.setattr(
+        systemd.subprocess,
+        "run",
+        lambda cmd, **_k: subprocess.CompletedProcess(cmd, 0, stdout, ""),
+    )
+
+    out = systemd.systemctl_show_units(
+        [TARGET_UNIT, RECORDER_UNIT, TRANSCRIBER_UNIT], ["LoadState", "ActiveState"]
+    )
+    assert out == {
+        TARGET_UNIT: {"LoadState": "masked", "ActiveState": "inactive"},
+        RECORDER_UNIT: {"LoadState": "loaded", "ActiveState": "active"},
+        TRANSCRIBER_UNIT: {},
+    }
@@ -143,7 +143,7 @@ def test_transcribe_via_daemon_propagates_error(tmp_path: Path) -> None:
 
 def test_transcribe_audio_file_falls_back_when_daemon_unavailable(monkeypatch) -> None:
     class _FakeTranscriber:
-        def __init__(self, model: str):
+        def __init__(self, model: str, api_key: str | None = None):
             self.model = model
 
         def transcribe(self, audio_file: str, **_kwargs) -> str:
@@ -154,6 +154,7 @@ def test_transcribe_audio_file_falls_back_when_daemon_unavailable(monkeypatch) -
         lambda *args, **kwargs: (_ for _ in ()).throw(TranscriberDaemonUnavailable("nope")),
     )
     monkeypatch.setattr("voicepipe.transcriber.WhisperTranscriber", _FakeTranscriber)
+    monkeypatch.setattr("voicepipe.transcription.get_openai_api_key", lambda: "test-key")
 
     out = transcribe_audio_file("a.wav", model="m", prefer_daemon=True)
     assert out == "ok:a.wav:m"
@@ -190,13 +191,14 @@ def test_transcribe_audio_file_model_prefix_overrides_backend(monkeypatch) -> No
     monkeypatch.setenv("VOICEPIPE_TRANSCRIBE_BACKEND", "elevenlabs")
 
     class _FakeWhisper:
-        def __init__(self, model: str):
+        def __init__(self, model: str, api_key: str | None = None):
             self.model = model
 
         def transcribe(self, audio_file: str, **_kwargs) -> str:
             return f"ok-openai:{audio_file}:{self.model}"
 
     monkeypatch.setattr("voicepipe.transcriber.WhisperTranscriber", _FakeWhisper)
+    monkeypatch.setattr("voicepipe.transcription.get_openai_api_key", lambda: "test-key")
 
     out = transcribe_audio_file("a.wav", model="openai:gpt-4o-mini-transcribe", prefer_daemon=False)
     assert out == "ok-openai:a.wav:gpt-4o-mini-transcribe"
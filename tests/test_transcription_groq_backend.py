@@ -113,3 +113,86 @@ def test_file_groq_direct(monkeypatch, tmp_path) -> None:
     assert out == f"text:{DEFAULT_GROQ_TRANSCRIBE_MODEL}"
     assert created[0]["base_url"] == DEFAULT_GROQ_BASE_URL
     assert created[0]["api_key"] == "groq-test-key"
+
+
+def test_openai_compatible_transcriber_is_reused_until_key_changes(monkeypatch) -> None:
+    from voicepipe.transcription import _make_openai_compatible_transcriber
+
+    created = _install_fake_whisper(monkeypatch)
+    monkeypatch.setenv("OPENAI_API_KEY", "key-1")
+
+    first = _make_openai_compatible_transcriber("openai", "gpt-4o-transcribe")
+    assert _make_openai_compatible_transcriber("openai", "gpt-4o-transcribe") is first
+    assert len(created) == 1
+
+    monkeypatch.setenv("OPENAI_API_KEY", "key-2")
+    assert _make_openai_compatible_transcriber("openai", "gpt-4o-transcribe") is not first
+    assert len(created) == 2
+
+
+def test_openai_compatible_transcriber_cache_keeps_one_entry_per_model(monkeypatch) -> None:
+    from voicepipe import transcription
+
+    created = _install_fake_whisper(monkeypatch)
+    for key in ("key-1", "key-2", "key-1"):
+        monkeypatch.setenv("OPENAI_API_KEY", key)
+        transcription._make_openai_compatible_transcriber("openai", "gpt-4o-transcribe")
+
+    assert len(created) == 3
+    assert list(transcription._TRANSCRIBER_CACHE) == [("openai", "gpt-4o-transcribe")]
+    digest, _client = transcription._TRANSCRIBER_CACHE[("openai", "gpt-4o-transcribe")]
+    assert "key-1" not in digest
+
+
+def test_openai_compatible_transcriber_cache_follows_resolved_key(monkeypatch) -> None:
+    from voicepipe.transcription import _make_openai_compatible_transcriber
+
+    created = _install_fake_whisper(monkeypatch)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    # e.g. a key read from voicepipe.env or ~/.api-keys rather than os.environ
+    keys = iter(["file-key-1", "file-key-1", "file-key-2"])
+    monkeypatch.setattr("voicepipe.transcription.get_openai_api_key", lambda: next(keys))
+
+    first = _make_openai_compatible_transcriber("openai", "gpt-4o-transcribe")
+    assert _make_openai_compatible_transcriber("openai", "gpt-4o-transcribe") is first
+    assert _make_openai_compatible_transcriber("openai", "gpt-4o-transcribe") is not first
+    assert len(created) == 2
+
+
+def test_prewarm_transcriber_caches_the_direct_client(monkeypatch) -> None:
+    from voicepipe.transcription import (
+        _make_openai_compatible_transcriber,
+        prewarm_transcriber,
+    )
+
+    created = _install_fake_whisper(monkeypatch)
+    monkeypatch.setattr(
+        "voicepipe.transcription.get_groq_api_key", lambda *a, **k: "groq-test-key"
+    )
+    monkeypatch.setenv("GROQ_API_KEY", "groq-prewarm-key")
+
+    prewarm_transcriber(f"groq:{DEFAULT_GROQ_TRANSCRIBE_MODEL}")
+    assert len(created) == 1
+    _make_openai_compatible_transcriber("groq", DEFAULT_GROQ_TRANSCRIBE_MODEL)
+    assert len(created) == 1
+
+
+def test_prewarm_transcriber_defers_to_running_daemon(monkeypatch, tmp_path) -> None:
+    from voicepipe.transcription import prewarm_transcriber
+
+    created = _install_fake_whisper(monkeypatch)
+    monkeypatch.setattr(
+        "voicepipe.transcription.get_groq_api_key", lambda *a, **k: "groq-test-key"
+    )
+    monkeypatch.setattr("voicepipe.transcription.get_daemon_mode", lambda **_k: "auto")
+    monkeypatch.setattr("voicepipe.transcription.is_windows", lambda: False)
+    monkeypatch.setattr(
+        "voicepipe.transcription.find_transcriber_socket_path", lambda: tmp_path / "t.sock"
+    )
+
+    prewarm_transcriber(f"groq:{DEFAULT_GROQ_TRANSCRIBE_MODEL}", prefer_daemon=True)
+    assert created == []
+
+    monkeypatch.setattr("voicepipe.transcription.get_daemon_mode", lambda **_k: "never")
+    prewarm_transcriber(f"groq:{DEFAULT_GROQ_TRANSCRIBE_MODEL}", prefer_daemon=True)
+    assert len(created) == 1
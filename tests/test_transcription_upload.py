@@ -13,7 +13,7 @@ def test_transcribe_audio_fileobj_uses_openai_backend(monkeypatch) -> None:
     calls: dict[str, object] = {}
 
     class _FakeWhisper:
-        def __init__(self, model: str):
+        def __init__(self, model: str, api_key: str | None = None):
             calls["model"] = model
 
         def transcribe_fileobj(self, fh, *, filename: str, **_kwargs) -> str:
@@ -22,6 +22,7 @@ def test_transcribe_audio_fileobj_uses_openai_backend(monkeypatch) -> None:
             return f"ok-fileobj:{filename}:{calls['model']}"
 
     monkeypatch.setattr("voicepipe.transcriber.WhisperTranscriber", _FakeWhisper)
+    monkeypatch.setattr("voicepipe.transcription.get_openai_api_key", lambda: "test-key")
 
     fh = io.BytesIO(b"abc")
     out = transcribe_audio_fileobj(fh, filename="a.wav", model="m")
@@ -31,13 +32,14 @@ def test_transcribe_audio_fileobj_uses_openai_backend(monkeypatch) -> None:
 
 def test_transcribe_audio_fileobj_result_sets_audio_file_none(monkeypatch) -> None:
     class _FakeWhisper:
-        def __init__(self, model: str):
+        def __init__(self, model: str, api_key: str | None = None):
             self.model = model
 
         def transcribe_fileobj(self, _fh, *, filename: str, **_kwargs) -> str:
             return f"ok-fileobj:{filename}:{self.model}"
 
     monkeypatch.setattr("voicepipe.transcriber.WhisperTranscriber", _FakeWhisper)
+    monkeypatch.setattr("voicepipe.transcription.get_openai_api_key", lambda: "test-key")
 
     fh = io.BytesIO(b"abc")
     result = transcribe_audio_fileobj_result(fh, filename="a.wav", model="m", source="test")
@@ -50,7 +52,7 @@ def test_transcribe_audio_fileobj_result_sets_audio_file_none(monkeypatch) -> No
 
 def test_transcribe_audio_bytes_uses_openai_backend(monkeypatch) -> None:
     class _FakeWhisper:
-        def __init__(self, model: str):
+        def __init__(self, model: str, api_key: str | None = None):
             self.model = model
 
         def transcribe_bytes(self, audio_bytes: bytes, *, filename: str, **_kwargs) -> str:
@@ -58,6 +60,7 @@ def test_transcribe_audio_bytes_uses_openai_backend(monkeypatch) -> None:
             return f"ok-bytes:{filename}:{self.model}"
 
     monkeypatch.setattr("voicepipe.transcriber.WhisperTranscriber", _FakeWhisper)
+    monkeypatch.setattr("voicepipe.transcription.get_openai_api_key", lambda: "test-key")
 
     out = transcribe_audio_bytes(b"abc", filename="a.wav", model="m")
     assert out == "ok-bytes:a.wav:m"
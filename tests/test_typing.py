@@ -22,6 +22,7 @@ def test_type_text_prefers_xdotool_on_x11(monkeypatch) -> None:
     monkeypatch.setenv("DISPLAY", ":0")
     monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
     monkeypatch.delenv("VOICEPIPE_TYPE_BACKEND", raising=False)
+    monkeypatch.delenv("VOICEPIPE_XDOTOOL_DELAY_MS", raising=False)
 
     calls: list[list[str]] = []
 
@@ -30,8 +31,11 @@ def test_type_text_prefers_xdotool_on_x11(monkeypatch) -> None:
             return "/bin/xdotool"
         return None
 
-    def fake_run(cmd, **_kwargs):
+    inputs: list[object] = []
+
+    def fake_run(cmd, **kwargs):
         calls.append(list(cmd))
+        inputs.append(kwargs.get("input"))
         return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
 
     monkeypatch.setattr("voicepipe.typing.shutil.which", fake_which)
@@ -42,7 +46,34 @@ def test_type_text_prefers_xdotool_on_x11(monkeypatch) -> None:
     assert err is None
     assert calls
     assert calls[0][:3] == ["/bin/xdotool", "type", "--clearmodifiers"]
+    assert calls[0][3:5] == ["--delay", "12"]
     assert "--window" in calls[0]
+    assert calls[0][-2:] == ["--file", "-"]
+    assert "hello" not in calls[0]
+    assert inputs[0] == "hello"
+
+
+def test_type_text_xdotool_delay_can_be_disabled(monkeypatch) -> None:
+    if sys.platform in ("win32", "darwin"):
+        pytest.skip("Linux-only typing backend")
+    monkeypatch.setenv("VOICEPIPE_TYPE_BACKEND", "xdotool")
+    monkeypatch.setenv("VOICEPIPE_XDOTOOL_DELAY_MS", "0")
+
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(
+        "voicepipe.typing.shutil.which", lambda name: "/bin/xdotool" if name == "xdotool" else None
+    )
+    monkeypatch.setattr("voicepipe.typing.subprocess.run", fake_run)
+
+    ok, err = type_text("hello")
+    assert ok is True
+    assert err is None
+    assert calls[0][3:5] == ["--delay", "0"]
 
 
 def test_get_active_window_id_uses_xdotool(monkeypatch) -> None:
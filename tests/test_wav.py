@@ -21,3 +21,15 @@ def test_write_wav_pcm_writes_valid_header() -> None:
         assert wf.getnchannels() == 1
         assert wf.getsampwidth() == 2
         assert wf.getnframes() == 8000
+
+
+def test_pcm_peak_handles_int16_extremes() -> None:
+    import numpy as np
+
+    from voicepipe.wav import pcm_peak
+
+    assert pcm_peak(np.array([], dtype=np.int16)) == 0
+    assert pcm_peak(np.array([0, 0], dtype=np.int16)) == 0
+    assert pcm_peak(np.array([5, -7, 3], dtype=np.int16)) == 7
+    assert pcm_peak(np.array([-32768, 100], dtype=np.int16)) == 32768
+    assert pcm_peak(np.array([[32767], [-1]], dtype=np.int16)) == 32767
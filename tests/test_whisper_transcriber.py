@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import sys
 
 import pytest
 
@@ -71,3 +72,25 @@ def test_transcribe_file_sends_only_the_caller_prompt() -> None:
     transcriber.transcribe_file(io.BytesIO(b"audio"), prompt="my custom hint")
     sent_prompt = fake.audio.transcriptions.last_params.get("prompt")
     assert sent_prompt == "my custom hint"
+
+
+def test_keepalive_expiry_configures_pooled_http_client(monkeypatch) -> None:
+    import types
+
+    import voicepipe.transcriber as transcriber_mod
+
+    created: list[dict[str, object]] = []
+    fake_httpx = types.SimpleNamespace(
+        Client=lambda **kw: ("client", kw),
+        Timeout=lambda *a, **kw: ("timeout", a, kw),
+        Limits=lambda **kw: kw,
+    )
+    monkeypatch.setitem(sys.modules, "httpx", fake_httpx)
+    monkeypatch.setattr(transcriber_mod, "OpenAI", lambda **kw: created.append(kw) or object())
+
+    WhisperTranscriber(api_key="k", model="m")
+    WhisperTranscriber(api_key="k", model="m", keepalive_expiry=120.0)
+
+    assert "http_client" not in created[0]
+    _tag, client_kwargs = created[1]["http_client"]  # type: ignore[misc]
+    assert client_kwargs["limits"]["keepalive_expiry"] == 120.0
@@ -19,14 +19,13 @@ try:
 except Exception:  # pragma: no cover
     sd = None  # type: ignore[assignment]
 
-import numpy as np
-
 from voicepipe.audio_device import (
     apply_pulse_source_preference,
     read_device_preference,
     resolve_device_index,
 )
 from voicepipe.config import device_cache_path, load_environment
+from voicepipe.wav import pcm_peak
 logger = logging.getLogger(__name__)
 
 _SILENCE_THRESHOLD_INT16 = 50
@@ -182,11 +181,7 @@ def _probe_input_max_amp(
         blocksize=0,
     ) as stream:
         data, _overflowed = stream.read(frames)
-    if not getattr(data, "size", 0):
-        return 0
-    # Avoid int16 abs(-32768) overflow by promoting to int32.
-    arr = np.asarray(data, dtype=np.int32)
-    return int(np.max(np.abs(arr))) if arr.size else 0
+    return pcm_peak(data)
 
 
 @dataclass(frozen=True)
@@ -6,12 +6,12 @@ import logging
 
 import click
 
-from voicepipe.commands import register
+from voicepipe.commands import LazyGroup, register
 from voicepipe.config import load_environment
 from voicepipe.logging_utils import configure_logging
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.option("--debug", is_flag=True, help="Enable debug logging")
 @click.pass_context
 def main(ctx: click.Context, debug: bool) -> None:
@@ -25,10 +25,20 @@ register(main)
 
 
 @main.command("_record", hidden=True)
-def _record() -> None:
-    """Internal command to run recording subprocess."""
+@click.argument("device", required=False)
+def _record(device: str | None) -> None:
+    """Internal command to run recording subprocess.
+
+    Kept for compatibility; the backend runs `voicepipe.recording_subprocess`
+    directly.
+    """
+    import os
+
     from voicepipe.recording_subprocess import run_recording_subprocess
 
+    if device:
+        os.environ["VOICEPIPE_DEVICE"] = device
+
     run_recording_subprocess()
 
 
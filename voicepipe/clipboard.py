@@ -12,6 +12,12 @@ import subprocess
 
 from voicepipe.platform import is_macos, is_windows
 
+_UNIX_CLIPBOARD_COMMANDS: dict[str, list[str]] = {
+    "wl-copy": ["wl-copy"],
+    "xclip": ["xclip", "-selection", "clipboard"],
+    "xsel": ["xsel", "--clipboard", "--input"],
+}
+
 
 def copy_to_clipboard(text: str) -> tuple[bool, str | None]:
     """Copy text to the OS clipboard (best-effort).
@@ -24,7 +30,9 @@ def copy_to_clipboard(text: str) -> tuple[bool, str | None]:
         if is_macos():
             if not shutil.which("pbcopy"):
                 return False, "pbcopy not found"
-            subprocess.run(["pbcopy"], input=payload, text=True, check=True)
+            subprocess.run(
+                ["pbcopy"], input=payload.encode("utf-8"), stdout=subprocess.DEVNULL, check=True
+            )
             return True, None
 
         if is_windows():
@@ -34,43 +42,31 @@ def copy_to_clipboard(text: str) -> tuple[bool, str | None]:
             subprocess.run(["clip"], input=payload, text=True, check=True)
             return True, None
 
-        # Linux / other Unix:
+        # Linux / other Unix: prefer the tool matching the session, then fall
+        # back to any installed tool even if env vars aren't set (with a
+        # clear error if it fails). Each tool is looked up on PATH once.
         wayland = bool((os.environ.get("WAYLAND_DISPLAY") or "").strip())
         x11 = bool((os.environ.get("DISPLAY") or "").strip())
 
-        if wayland and shutil.which("wl-copy"):
-            subprocess.run(["wl-copy"], input=payload, text=True, check=True)
-            return True, None
-
-        if x11 and shutil.which("xclip"):
-            subprocess.run(
-                ["xclip", "-selection", "clipboard"],
-                input=payload,
-                text=True,
-                check=True,
-            )
-            return True, None
-
-        if x11 and shutil.which("xsel"):
-            subprocess.run(["xsel", "--clipboard", "--input"], input=payload, text=True, check=True)
-            return True, None
-
-        # Fall back to attempting tools even if env vars aren't set; provide a
-        # clear error if they fail.
-        if shutil.which("wl-copy"):
-            subprocess.run(["wl-copy"], input=payload, text=True, check=True)
-            return True, None
-        if shutil.which("xclip"):
-            subprocess.run(
-                ["xclip", "-selection", "clipboard"],
-                input=payload,
-                text=True,
-                check=True,
-            )
-            return True, None
-        if shutil.which("xsel"):
-            subprocess.run(["xsel", "--clipboard", "--input"], input=payload, text=True, check=True)
-            return True, None
+        order: list[str] = []
+        if wayland:
+            order.append("wl-copy")
+        if x11:
+            order += ["xclip", "xsel"]
+        order += [tool for tool in _UNIX_CLIPBOARD_COMMANDS if tool not in order]
+
+        for tool in order:
+            if shutil.which(tool):
+                # Hand over pre-encoded bytes, and keep our stdout away from
+                # wl-copy/xclip: they fork to keep serving the selection and
+                # would otherwise hold a piped stdout open after we exit.
+                subprocess.run(
+                    _UNIX_CLIPBOARD_COMMANDS[tool],
+                    input=payload.encode("utf-8"),
+                    stdout=subprocess.DEVNULL,
+                    check=True,
+                )
+                return True, None
 
         hint = "Install wl-clipboard (wl-copy) for Wayland or xclip/xsel for X11."
         return False, f"No clipboard tool found. {hint}"
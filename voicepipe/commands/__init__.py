@@ -1,39 +1,68 @@
-"""Click command groups for the Voicepipe CLI."""
+"""Click command groups for the Voicepipe CLI.
+
+Command modules are imported lazily (on first lookup) so hot paths like
+`voicepipe start`/`voicepipe stop` don't pay for importing every subcommand.
+"""
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import click
 
-from .config import config_group
-from .doctor import doctor_group, doctor_legacy
-from .recording import cancel, daemon, dictate, start, status, stop, transcribe_file
-from .replay import replay
-from . import smoke as smoke_module
-from .service import service_group
-from .serve import serve
-from .setup import setup
-from .launchd import launchd_group
-from .hotkey import hotkey_group
-from .triggers import triggers_group
+
+# CLI name -> "module:attribute" relative to this package.
+_COMMANDS: dict[str, str] = {
+    "config": "config:config_group",
+    "service": "service:service_group",
+    "launchd": "launchd:launchd_group",
+    "hotkey": "hotkey:hotkey_group",
+    "setup": "setup:setup",
+    "doctor": "doctor:doctor_group",
+    "doctor-legacy": "doctor:doctor_legacy",
+    "smoke": "smoke:smoke",
+    "triggers": "triggers:triggers_group",
+    "serve": "serve:serve",
+    "start": "recording:start",
+    "stop": "recording:stop",
+    "dictate": "recording:dictate",
+    "status": "recording:status",
+    "cancel": "recording:cancel",
+    "transcribe-file": "recording:transcribe_file",
+    "daemon": "recording:daemon",
+    "replay": "replay:replay",
+}
+
+
+def _load_command(spec: str) -> click.Command:
+    module_name, _sep, attr = spec.partition(":")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    command = getattr(module, attr)
+    if not isinstance(command, click.Command):
+        raise TypeError(f"{spec} is not a click command")
+    return command
+
+
+class LazyGroup(click.Group):
+    """A click group that imports registered subcommands on first use."""
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, str] | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(_load_command(self.lazy_commands[cmd_name]), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
 def register(main: click.Group) -> None:
-    main.add_command(config_group)
-    main.add_command(service_group)
-    main.add_command(launchd_group)
-    main.add_command(hotkey_group)
-    main.add_command(setup)
-    main.add_command(doctor_group)
-    main.add_command(doctor_legacy)
-    main.add_command(smoke_module.smoke)
-    main.add_command(triggers_group)
-    main.add_command(serve)
-
-    main.add_command(start)
-    main.add_command(stop)
-    main.add_command(dictate)
-    main.add_command(status)
-    main.add_command(cancel)
-    main.add_command(transcribe_file)
-    main.add_command(daemon)
-    main.add_command(replay)
+    if isinstance(main, LazyGroup):
+        main.lazy_commands.update(_COMMANDS)
+        return
+    for name, spec in _COMMANDS.items():
+        main.add_command(_load_command(spec), name)
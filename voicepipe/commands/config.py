@@ -43,6 +43,7 @@ from voicepipe.systemd import (
     systemctl_show_properties,
 )
 from voicepipe.platform import is_windows
+from voicepipe.wav import pcm_peak
 from voicepipe.commands._hints import print_restart_hint
 
 
@@ -224,7 +225,6 @@ def _probe_device_level(
     samplerate: int,
     channels: int,
 ) -> int:
-    import numpy as np
     import sounddevice as sd
 
     frames = int(max(0.05, float(seconds)) * float(samplerate))
@@ -236,7 +236,7 @@ def _probe_device_level(
         device=int(device_index),
     )
     sd.wait()
-    return int(np.max(np.abs(data))) if data.size else 0
+    return pcm_peak(data)
 
 
 def _probe_pulse_source(
@@ -283,7 +283,7 @@ def _probe_pulse_source(
                 if proc.returncode == 0:
                     data = proc.stdout or b""
                     arr = np.frombuffer(data, dtype=np.int16)
-                    return int(np.max(np.abs(arr.astype(np.int32)))) if arr.size else 0
+                    return pcm_peak(arr)
             except Exception:
                 pass
 
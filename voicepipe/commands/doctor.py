@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import os
 import shutil
 import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -24,7 +28,7 @@ from voicepipe.config import (
     legacy_elevenlabs_key_paths,
     read_env_file,
 )
-from voicepipe.ipc import IpcError, send_request, try_send_request
+from voicepipe.ipc import IpcClient, IpcError, try_send_request
 from voicepipe.paths import (
     daemon_socket_paths,
     doctor_artifacts_dir,
@@ -43,9 +47,11 @@ from voicepipe.systemd import (
     systemctl_cat,
     systemctl_path,
     systemctl_show_properties,
+    systemctl_show_units,
 )
 from voicepipe.typing import resolve_typing_backend
-from voicepipe.platform import is_macos, is_windows
+from voicepipe.wav import pcm_peak
+from voicepipe.platform import is_macos, is_windows, move_file, open_pidfd, wait_pidfd
 
 
 @click.group(name="doctor", invoke_without_command=True)
@@ -67,21 +73,17 @@ def doctor_group(ctx: click.Context, verbose: bool) -> None:
         click.echo("  voicepipe doctor audio")
 
 
-def _wav_max_amp(path: Path) -> int | None:
+def _wav_max_amp(path: str | os.PathLike[str]) -> int | None:
     try:
         import wave
 
         import numpy as np
 
-        with wave.open(str(path), "rb") as wf:
+        with wave.open(os.fspath(path), "rb") as wf:
             frames = wf.readframes(wf.getnframes())
         if not frames:
             return 0
-        arr = np.frombuffer(frames, dtype=np.int16)
-        if not arr.size:
-            return 0
-        # Avoid int16 abs(-32768) overflow by promoting to int32.
-        return int(np.max(np.abs(arr.astype(np.int32))))
+        return pcm_peak(np.frombuffer(frames, dtype=np.int16))
     except Exception:
         return None
 
@@ -208,22 +210,130 @@ def _doctor_summary(*, verbose: bool) -> None:
             click.echo(f"  {line}")
 
 
-def _preserve_doctor_audio_file(path: Path) -> Path:
-    dest_dir = doctor_artifacts_dir(create=True)
-    dest = dest_dir / path.name
-    if dest.exists():
-        stem = path.stem
-        suffix = path.suffix
+def _wait_process(proc: subprocess.Popen, timeout: float) -> bool:
+    """Wait up to `timeout` for `proc`; return True if it exited (and reap it).
+
+    With a pidfd the wait wakes as soon as the child exits instead of on
+    `Popen.wait`'s next polling tick.
+    """
+    pidfd = open_pidfd(proc.pid)
+    if pidfd is None:
+        try:
+            proc.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    try:
+        if not wait_pidfd(pidfd, timeout):
+            return False
+    finally:
+        os.close(pidfd)
+    proc.wait()
+    return True
+
+
+def _play_wav(path: str, timeout: float) -> bool:
+    """Play a 16-bit PCM WAV in-process via sounddevice.
+
+    Returns False if playback was cut off after `timeout` seconds. Raises when
+    the file or the audio backend can't be used, so callers can fall back to
+    ffplay.
+    """
+    import wave
+
+    import numpy as np
+    import sounddevice as sd  # type: ignore
+
+    with wave.open(path, "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"unsupported sample width {wf.getsampwidth()}")
+        channels = wf.getnchannels()
+        samplerate = wf.getframerate()
+        frames = wf.readframes(wf.getnframes())
+    data = np.frombuffer(frames, dtype=np.int16).reshape(-1, channels)
+
+    timed_out = threading.Event()
+
+    def _stop() -> None:
+        timed_out.set()
+        sd.stop()
+
+    timer = threading.Timer(timeout, _stop)
+    timer.daemon = True
+    sd.play(data, samplerate, latency="low")
+    timer.start()
+    try:
+        sd.wait()
+    except KeyboardInterrupt:
+        sd.stop()
+        raise
+    finally:
+        timer.cancel()
+    return not timed_out.is_set()
+
+
+def _run_transcribe_test(path: str, outcome: dict[str, Any]) -> None:
+    try:
+        from voicepipe.config import get_transcribe_model
+        from voicepipe.transcription import transcribe_audio_file
+
+        outcome["text"] = transcribe_audio_file(
+            path,
+            model=get_transcribe_model(),
+            prefer_daemon=True,
+        )
+    except Exception as e:
+        outcome["error"] = e
+
+
+def _process_group_kwargs() -> dict[str, Any]:
+    """Popen kwargs that start the child as its own process-group leader.
+
+    Python 3.11+ can do this with a plain `setpgid` (`process_group=0`), which
+    unlike `start_new_session` does not also create a new session.
+    """
+    if is_windows():
+        return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+    if sys.version_info >= (3, 11):
+        return {"process_group": 0}
+    return {"start_new_session": True}
+
+
+def _signal_process(proc: subprocess.Popen, signum: int) -> None:
+    """Send `signum` to `proc`'s process group (Unix) or terminate it (Windows)."""
+    if not is_windows():
+        with contextlib.suppress(OSError):
+            os.killpg(proc.pid, signum)
+            return
+    with contextlib.suppress(OSError):
+        (proc.terminate if signum == signal.SIGTERM else proc.kill)()
+
+
+def _terminate_process(proc: subprocess.Popen, *, grace_s: float) -> bool:
+    """Escalate SIGTERM -> SIGKILL, giving `proc` `grace_s` to exit after each."""
+    for signum in (signal.SIGTERM, getattr(signal, "SIGKILL", signal.SIGTERM)):
+        _signal_process(proc, signum)
+        if _wait_process(proc, grace_s):
+            return True
+    return False
+
+
+def _preserve_doctor_audio_file(path: str | os.PathLike[str]) -> str:
+    src = os.fspath(path)
+    dest_dir = os.fspath(doctor_artifacts_dir(create=True))
+    name = os.path.basename(src)
+    dest = os.path.join(dest_dir, name)
+    if os.path.exists(dest):
+        stem, suffix = os.path.splitext(name)
         for i in range(1, 1000):
-            candidate = dest_dir / f"{stem}-{i}{suffix}"
-            if not candidate.exists():
+            candidate = os.path.join(dest_dir, f"{stem}-{i}{suffix}")
+            if not os.path.exists(candidate):
                 dest = candidate
                 break
     try:
-        moved = shutil.move(str(path), str(dest))
-        return Path(moved)
+        return move_file(src, dest)
     except Exception:
-        return path
+        return src
 
 
 @doctor_group.command("env")
@@ -232,89 +342,121 @@ def doctor_env() -> None:
     daemon_socket = find_daemon_socket_path()
     transcriber_socket = find_transcriber_socket_path()
     runtime_path = runtime_app_dir()
+    # Build the report and write it once instead of one echo per line.
+    lines: list[str] = []
 
-    click.echo(f"python: {sys.executable}")
-    click.echo(f"cwd: {os.getcwd()}")
-    click.echo(f"platform: {sys.platform}")
+    lines.append(f"python: {sys.executable}")
+    lines.append(f"cwd: {os.getcwd()}")
+    lines.append(f"platform: {sys.platform}")
 
     if is_windows():
-        click.echo(f"USERPROFILE: {os.environ.get('USERPROFILE', '')}")
-        click.echo(f"APPDATA: {os.environ.get('APPDATA', '')}")
-        click.echo(f"LOCALAPPDATA: {os.environ.get('LOCALAPPDATA', '')}")
-        click.echo(f"TEMP: {os.environ.get('TEMP', '')}")
-        click.echo(f"TMP: {os.environ.get('TMP', '')}")
+        lines.append(f"USERPROFILE: {os.environ.get('USERPROFILE', '')}")
+        lines.append(f"APPDATA: {os.environ.get('APPDATA', '')}")
+        lines.append(f"LOCALAPPDATA: {os.environ.get('LOCALAPPDATA', '')}")
+        lines.append(f"TEMP: {os.environ.get('TEMP', '')}")
+        lines.append(f"TMP: {os.environ.get('TMP', '')}")
     elif is_macos():
-        click.echo(f"HOME: {os.environ.get('HOME', '')}")
-        click.echo(f"TMPDIR: {os.environ.get('TMPDIR', '')}")
+        lines.append(f"HOME: {os.environ.get('HOME', '')}")
+        lines.append(f"TMPDIR: {os.environ.get('TMPDIR', '')}")
+
+    lines.append(f"XDG_RUNTIME_DIR: {os.environ.get('XDG_RUNTIME_DIR', '')}")
+    lines.append(f"XDG_SESSION_TYPE: {os.environ.get('XDG_SESSION_TYPE', '')}")
+    lines.append(f"XDG_CURRENT_DESKTOP: {os.environ.get('XDG_CURRENT_DESKTOP', '')}")
+    lines.append(f"DISPLAY: {os.environ.get('DISPLAY', '')}")
+    lines.append(f"WAYLAND_DISPLAY: {os.environ.get('WAYLAND_DISPLAY', '')}")
+    lines.append(f"VOICEPIPE_TYPE_BACKEND: {os.environ.get('VOICEPIPE_TYPE_BACKEND', '')}")
+    lines.append(f"VOICEPIPE_DAEMON_MODE: {os.environ.get('VOICEPIPE_DAEMON_MODE', '')}")
 
-    click.echo(f"XDG_RUNTIME_DIR: {os.environ.get('XDG_RUNTIME_DIR', '')}")
-    click.echo(f"XDG_SESSION_TYPE: {os.environ.get('XDG_SESSION_TYPE', '')}")
-    click.echo(f"XDG_CURRENT_DESKTOP: {os.environ.get('XDG_CURRENT_DESKTOP', '')}")
-    click.echo(f"DISPLAY: {os.environ.get('DISPLAY', '')}")
-    click.echo(f"WAYLAND_DISPLAY: {os.environ.get('WAYLAND_DISPLAY', '')}")
-    click.echo(f"VOICEPIPE_TYPE_BACKEND: {os.environ.get('VOICEPIPE_TYPE_BACKEND', '')}")
-    click.echo(f"VOICEPIPE_DAEMON_MODE: {os.environ.get('VOICEPIPE_DAEMON_MODE', '')}")
+    # One PATH walk per binary for the whole report (typing backend
+    # resolution runs twice and the dependency checks below reuse it).
+    which = functools.lru_cache(maxsize=None)(shutil.which)
 
     env = dict(os.environ)
-    resolved = resolve_typing_backend(env=env)
+    resolved = resolve_typing_backend(env=env, which=which)
     auto_env = dict(env)
     auto_env.pop("VOICEPIPE_TYPE_BACKEND", None)
-    auto = resolve_typing_backend(env=auto_env)
-    click.echo(
+    auto = resolve_typing_backend(env=auto_env, which=which)
+    lines.append(
         f"typing backend resolved: {resolved.name} "
         f"(session={resolved.session_type}, supports_window_id={resolved.supports_window_id})"
     )
-    click.echo(f"typing backend reason: {resolved.reason}")
+    lines.append(f"typing backend reason: {resolved.reason}")
     if resolved.path:
-        click.echo(f"typing backend path: {resolved.path}")
+        lines.append(f"typing backend path: {resolved.path}")
     if resolved.error:
-        click.echo(f"typing backend error: {resolved.error}")
-    click.echo(
+        lines.append(f"typing backend error: {resolved.error}")
+    lines.append(
         f"typing backend auto would choose: {auto.name} "
         f"(session={auto.session_type}, supports_window_id={auto.supports_window_id})"
     )
-    click.echo(f"typing backend auto reason: {auto.reason}")
+    lines.append(f"typing backend auto reason: {auto.reason}")
 
-    click.echo(f"env file path: {env_file_path()}")
-    click.echo(f"state dir: {state_dir()} exists: {state_dir().exists()}")
-    click.echo(f"logs dir: {logs_dir()} exists: {logs_dir().exists()}")
-    click.echo(f"runtime dir: {runtime_path} exists: {runtime_path.exists()}")
-    click.echo(f"daemon socket: {daemon_socket or '(not found)'}")
-    click.echo(f"daemon socket candidates: {', '.join(str(p) for p in daemon_socket_paths())}")
-    click.echo(f"transcriber socket: {transcriber_socket or '(not found)'}")
-    click.echo(
+    # Most of the paths below share a parent directory (config dir, state
+    # dir), so list each parent once and answer existence checks from that.
+    # Names map to whether the entry is a symlink: those are resolved with
+    # Path.exists() so a dangling link reads as missing.
+    listings: dict[Path, dict[str, bool] | None] = {}
+
+    def exists(path: Path) -> bool:
+        parent = path.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as it:
+                    listings[parent] = {entry.name: entry.is_symlink() for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                listings[parent] = {}
+            except OSError:
+                listings[parent] = None
+        names = listings[parent]
+        if names is None:
+            return path.exists()
+        is_symlink = names.get(path.name)
+        if is_symlink is None:
+            return False
+        return path.exists() if is_symlink else True
+
+    env_path = env_file_path()
+    state_path = state_dir()
+    logs_path = logs_dir()
+    artifacts_path = doctor_artifacts_dir()
+    preserved_path = preserved_audio_dir()
+
+    lines.append(f"env file path: {env_path}")
+    lines.append(f"state dir: {state_path} exists: {exists(state_path)}")
+    lines.append(f"logs dir: {logs_path} exists: {exists(logs_path)}")
+    lines.append(f"runtime dir: {runtime_path} exists: {exists(runtime_path)}")
+    lines.append(f"daemon socket: {daemon_socket or '(not found)'}")
+    lines.append(f"daemon socket candidates: {', '.join(str(p) for p in daemon_socket_paths())}")
+    lines.append(f"transcriber socket: {transcriber_socket or '(not found)'}")
+    lines.append(
         f"transcriber socket candidates: {', '.join(str(p) for p in transcriber_socket_paths())}"
     )
 
-    click.echo(
-        f"doctor artifacts dir: {doctor_artifacts_dir()} exists: {doctor_artifacts_dir().exists()}"
-    )
-    click.echo(
-        f"preserved audio dir: {preserved_audio_dir()} exists: {preserved_audio_dir().exists()}"
-    )
+    lines.append(f"doctor artifacts dir: {artifacts_path} exists: {exists(artifacts_path)}")
+    lines.append(f"preserved audio dir: {preserved_path} exists: {exists(preserved_path)}")
 
     # API key presence (never print the key)
     key_env = os.environ.get("OPENAI_API_KEY")
     key_eleven_env = (os.environ.get("ELEVENLABS_API_KEY") or "") or (
         os.environ.get("XI_API_KEY") or ""
     )
-    key_env_file = env_file_path()
-    click.echo(f"OPENAI_API_KEY env set: {bool(key_env)}")
-    click.echo(f"ELEVENLABS_API_KEY/XI_API_KEY env set: {bool(key_eleven_env)}")
-    click.echo(f"env file exists: {key_env_file} {key_env_file.exists()}")
+    lines.append(f"OPENAI_API_KEY env set: {bool(key_env)}")
+    lines.append(f"ELEVENLABS_API_KEY/XI_API_KEY env set: {bool(key_eleven_env)}")
+    lines.append(f"env file exists: {env_path} {exists(env_path)}")
     for path in legacy_api_key_paths():
-        click.echo(f"legacy key file exists: {path} {path.exists()}")
+        lines.append(f"legacy key file exists: {path} {exists(path)}")
     for path in legacy_elevenlabs_key_paths():
-        click.echo(f"legacy elevenlabs key file exists: {path} {path.exists()}")
-    click.echo(f"api key resolvable: {detect_openai_api_key()}")
-    click.echo(f"elevenlabs api key resolvable: {detect_elevenlabs_api_key()}")
+        lines.append(f"legacy elevenlabs key file exists: {path} {exists(path)}")
+    lines.append(f"api key resolvable: {detect_openai_api_key()}")
+    lines.append(f"elevenlabs api key resolvable: {detect_elevenlabs_api_key()}")
 
-    ffmpeg_path = shutil.which("ffmpeg")
-    xdotool_path = shutil.which("xdotool")
-    wtype_path = shutil.which("wtype")
-    click.echo(f"ffmpeg found: {bool(ffmpeg_path)}")
-    click.echo(f"xdotool found: {bool(xdotool_path)}")
-    click.echo(f"wtype found: {bool(wtype_path)}")
+    ffmpeg_path = which("ffmpeg")
+    xdotool_path = which("xdotool")
+    wtype_path = which("wtype")
+    lines.append(f"ffmpeg found: {bool(ffmpeg_path)}")
+    lines.append(f"xdotool found: {bool(xdotool_path)}")
+    lines.append(f"wtype found: {bool(wtype_path)}")
+    click.echo("\n".join(lines))
 
 
 @doctor_group.command("systemd")
@@ -324,6 +466,11 @@ def doctor_systemd() -> None:
         click.echo("systemctl not found (is systemd installed?)", err=True)
         return
 
+    # Collect the report (stdout) and the fix-up hints (stderr) and write
+    # each once at the end.
+    lines: list[str] = []
+    hints: list[str] = []
+
     env_path = env_file_path()
     env_values = read_env_file(env_path)
 
@@ -342,13 +489,13 @@ def doctor_systemd() -> None:
         or (env_values.get("XI_API_KEY") or "").strip()
     )
 
-    click.echo(f"env file: {env_path} exists: {env_path.exists()}")
-    click.echo(f"env file perms 0600: {env_file_permissions_ok(env_path)}")
-    click.echo(f"transcribe backend (env file): {backend}")
-    click.echo(f"env file has OPENAI_API_KEY: {has_openai_key}")
-    click.echo(f"env file has ELEVENLABS_API_KEY/XI_API_KEY: {has_eleven_key}")
-    click.echo(f"OPENAI_API_KEY env set (this process): {bool(os.environ.get('OPENAI_API_KEY'))}")
-    click.echo(
+    lines.append(f"env file: {env_path} exists: {env_path.exists()}")
+    lines.append(f"env file perms 0600: {env_file_permissions_ok(env_path)}")
+    lines.append(f"transcribe backend (env file): {backend}")
+    lines.append(f"env file has OPENAI_API_KEY: {has_openai_key}")
+    lines.append(f"env file has ELEVENLABS_API_KEY/XI_API_KEY: {has_eleven_key}")
+    lines.append(f"OPENAI_API_KEY env set (this process): {bool(os.environ.get('OPENAI_API_KEY'))}")
+    lines.append(
         "ELEVENLABS_API_KEY/XI_API_KEY env set (this process): "
         f"{bool((os.environ.get('ELEVENLABS_API_KEY') or '').strip() or (os.environ.get('XI_API_KEY') or '').strip())}"
     )
@@ -362,8 +509,9 @@ def doctor_systemd() -> None:
         "UnitFileState",
         "FragmentPath",
     ]
+    props_by_unit = systemctl_show_units(units, props_wanted)
     for unit in units:
-        props = systemctl_show_properties(unit, props_wanted)
+        props = props_by_unit[unit]
         load_state = props.get("LoadState", "")
         active_state = props.get("ActiveState", "")
         sub_state = props.get("SubState", "")
@@ -371,30 +519,30 @@ def doctor_systemd() -> None:
         fragment = props.get("FragmentPath", "")
         err = props.get("error", "")
 
-        click.echo(f"unit: {unit}")
+        lines.append(f"unit: {unit}")
         if err and not load_state:
-            click.echo(f"  error: {err}")
+            lines.append(f"  error: {err}")
             continue
-        click.echo(f"  LoadState: {load_state}")
-        click.echo(f"  UnitFileState: {unit_file_state}")
-        click.echo(f"  ActiveState: {active_state} ({sub_state})")
+        lines.append(f"  LoadState: {load_state}")
+        lines.append(f"  UnitFileState: {unit_file_state}")
+        lines.append(f"  ActiveState: {active_state} ({sub_state})")
         if fragment:
-            click.echo(f"  FragmentPath: {fragment}")
+            lines.append(f"  FragmentPath: {fragment}")
 
         cat = systemctl_cat(unit)
         if cat.returncode != 0:
-            click.echo(f"  systemctl cat failed: {(cat.stderr or '').strip()}")
+            lines.append(f"  systemctl cat failed: {(cat.stderr or '').strip()}")
             continue
 
         unit_text = cat.stdout or ""
         if unit == TARGET_UNIT:
             wants_both = (RECORDER_UNIT in unit_text) and (TRANSCRIBER_UNIT in unit_text)
-            click.echo(f"  unit wants recorder+transcriber: {wants_both}")
+            lines.append(f"  unit wants recorder+transcriber: {wants_both}")
         else:
             has_env_file = "/.config/voicepipe/voicepipe.env" in unit_text
-            click.echo(f"  unit references voicepipe.env: {has_env_file}")
+            lines.append(f"  unit references voicepipe.env: {has_env_file}")
             part_of_target = f"PartOf={TARGET_UNIT}" in unit_text
-            click.echo(f"  unit PartOf {TARGET_UNIT}: {part_of_target}")
+            lines.append(f"  unit PartOf {TARGET_UNIT}: {part_of_target}")
 
     # Suggested fixes
     if backend == "elevenlabs":
@@ -402,29 +550,32 @@ def doctor_systemd() -> None:
             (os.environ.get("ELEVENLABS_API_KEY") or "").strip()
             or (os.environ.get("XI_API_KEY") or "").strip()
         ):
-            click.echo("missing api key: set it with:", err=True)
-            click.echo("  voicepipe setup --backend elevenlabs", err=True)
-            click.echo("  voicepipe config set-elevenlabs-key --from-stdin", err=True)
+            hints.append("missing api key: set it with:")
+            hints.append("  voicepipe setup --backend elevenlabs")
+            hints.append("  voicepipe config set-elevenlabs-key --from-stdin")
 
-        click.echo("quick setup (recommended):", err=True)
-        click.echo("  voicepipe setup --backend elevenlabs", err=True)
+        hints.append("quick setup (recommended):")
+        hints.append("  voicepipe setup --backend elevenlabs")
     else:
         if not has_openai_key and not (
             os.environ.get("OPENAI_API_KEY") or ""
         ).strip():
-            click.echo("missing api key: set it with:", err=True)
-            click.echo("  voicepipe setup", err=True)
-            click.echo("  voicepipe config set-openai-key --from-stdin", err=True)
+            hints.append("missing api key: set it with:")
+            hints.append("  voicepipe setup")
+            hints.append("  voicepipe config set-openai-key --from-stdin")
 
-        click.echo("quick setup (recommended):", err=True)
-        click.echo("  voicepipe setup", err=True)
+        hints.append("quick setup (recommended):")
+        hints.append("  voicepipe setup")
 
-    click.echo("common fixes:", err=True)
-    click.echo("  voicepipe service install", err=True)
-    click.echo("  voicepipe service enable", err=True)
-    click.echo("  voicepipe service start", err=True)
-    click.echo("  voicepipe service restart", err=True)
-    click.echo(f"  systemctl --user restart {TARGET_UNIT}", err=True)
+    hints.append("common fixes:")
+    hints.append("  voicepipe service install")
+    hints.append("  voicepipe service enable")
+    hints.append("  voicepipe service start")
+    hints.append("  voicepipe service restart")
+    hints.append(f"  systemctl --user restart {TARGET_UNIT}")
+
+    click.echo("\n".join(lines))
+    click.echo("\n".join(hints), err=True)
 
 
 def _doctor_daemon(
@@ -442,98 +593,127 @@ def _doctor_daemon(
     click.echo(f"daemon socket: {socket_path or '(not found)'}")
     click.echo(f"daemon socket candidates: {', '.join(str(p) for p in daemon_socket_paths())}")
 
-    # Daemon ping (avoid falling back to subprocess mode)
-    if socket_path is not None and socket_path.exists():
-        t0 = time.time()
-        try:
-            resp = send_request("status", socket_path=socket_path)
-        except IpcError as e:
-            resp = {"error": str(e)}
-        dt_ms = int((time.time() - t0) * 1000)
-        click.echo(f"daemon status ms: {dt_ms}")
-        click.echo(f"daemon status resp: {resp}")
-    else:
-        click.echo("daemon status: skipped (daemon socket missing)", err=True)
-
-    recorded_file: str | None = None
-    if record_test:
-        if socket_path is None or not socket_path.exists():
-            click.echo("record-test: skipped (daemon socket missing)", err=True)
-        else:
+    # One connection carries the ping and the record-test requests.
+    with IpcClient(socket_path) as client:
+        # Daemon ping (avoid falling back to subprocess mode)
+        if socket_path is not None and socket_path.exists():
+            t0 = time.time()
             try:
-                status = try_send_request("status", socket_path=socket_path) or {}
-                if status.get("status") == "recording":
-                    click.echo(
-                        "record-test: skipped (daemon already recording)", err=True
-                    )
-                else:
-                    click.echo(
-                        f"record-test: recording for {record_seconds:.1f}s... speak now",
-                        err=True,
-                    )
-                    start_resp = try_send_request(
-                        "start", socket_path=socket_path
-                    ) or {}
-                    if start_resp.get("error"):
+                resp = client.send("status")
+            except IpcError as e:
+                resp = {"error": str(e)}
+            dt_ms = int((time.time() - t0) * 1000)
+            click.echo(f"daemon status ms: {dt_ms}")
+            click.echo(f"daemon status resp: {resp}")
+        else:
+            click.echo("daemon status: skipped (daemon socket missing)", err=True)
+
+        recorded_file: str | None = None
+        # Set from a single stat once the record test produces a file; the later
+        # play/cleanup steps reuse it instead of re-checking the path.
+        recorded_exists = False
+        if record_test:
+            if socket_path is None or not socket_path.exists():
+                click.echo("record-test: skipped (daemon socket missing)", err=True)
+            else:
+                try:
+                    status = client.try_send("status") or {}
+                    if status.get("status") == "recording":
                         click.echo(
-                            f"record-test start error: {start_resp.get('error')}",
-                            err=True,
+                            "record-test: skipped (daemon already recording)", err=True
                         )
                     else:
-                        time.sleep(max(0.1, float(record_seconds)))
-                        stop_resp = try_send_request(
-                            "stop", socket_path=socket_path
-                        ) or {}
-                        recorded_file = stop_resp.get("audio_file")
-                        if stop_resp.get("error"):
+                        click.echo(
+                            f"record-test: recording for {record_seconds:.1f}s... speak now",
+                            err=True,
+                        )
+                        start_resp = client.try_send("start") or {}
+                        if start_resp.get("error"):
                             click.echo(
-                                f"record-test stop error: {stop_resp.get('error')}",
+                                f"record-test start error: {start_resp.get('error')}",
                                 err=True,
                             )
-                        elif recorded_file and Path(recorded_file).exists():
-                            size = Path(recorded_file).stat().st_size
-                            click.echo(f"record-test file: {recorded_file}")
-                            click.echo(f"record-test bytes: {size}")
-                            if cleanup:
+                        else:
+                            time.sleep(max(0.1, float(record_seconds)))
+                            stop_resp = client.try_send("stop") or {}
+                            recorded_file = stop_resp.get("audio_file")
+                            size = None
+                            if recorded_file and not stop_resp.get("error"):
+                                try:
+                                    size = os.stat(recorded_file).st_size
+                                except OSError:
+                                    size = None
+                            if stop_resp.get("error"):
                                 click.echo(
-                                    "record-test output: will delete (--cleanup)", err=True
+                                    f"record-test stop error: {stop_resp.get('error')}",
+                                    err=True,
                                 )
-                            else:
-                                preserved = _preserve_doctor_audio_file(
-                                    Path(recorded_file)
-                                )
-                                if str(preserved) != str(recorded_file):
-                                    click.echo(f"record-test preserved: {preserved}")
-                                recorded_file = str(preserved)
-
-                            # Help detect "it records but it's silent" issues.
-                            amp = _wav_max_amp(Path(recorded_file))
-                            if amp is not None:
-                                click.echo(f"record-test max_amp: {amp}")
-                                if int(amp) <= 0:
+                            elif size is not None:
+                                recorded_exists = True
+                                click.echo(f"record-test file: {recorded_file}")
+                                click.echo(f"record-test bytes: {size}")
+                                if cleanup:
                                     click.echo(
-                                        "record-test warning: audio appears silent (all zeros).",
-                                        err=True,
+                                        "record-test output: will delete (--cleanup)", err=True
                                     )
-                        else:
-                            click.echo(
-                                "record-test: no audio file produced", err=True
-                            )
-            except Exception as e:
-                click.echo(f"record-test error: {e}", err=True)
+                                else:
+                                    preserved = _preserve_doctor_audio_file(recorded_file)
+                                    if preserved != recorded_file:
+                                        click.echo(f"record-test preserved: {preserved}")
+                                    recorded_file = preserved
+
+                                # Help detect "it records but it's silent" issues.
+                                amp = _wav_max_amp(recorded_file)
+                                if amp is not None:
+                                    click.echo(f"record-test max_amp: {amp}")
+                                    if int(amp) <= 0:
+                                        click.echo(
+                                            "record-test warning: audio appears silent (all zeros).",
+                                            err=True,
+                                        )
+                            else:
+                                click.echo(
+                                    "record-test: no audio file produced", err=True
+                                )
+                except Exception as e:
+                    click.echo(f"record-test error: {e}", err=True)
+
+    transcriber: threading.Thread | None = None
+    transcribe_outcome: dict[str, Any] = {}
+    if transcribe_test and recorded_file:
+        # The transcription round-trip runs while the file plays; its result
+        # is reported after playback so the output order stays the same.
+        transcriber = threading.Thread(
+            target=_run_transcribe_test,
+            args=(recorded_file, transcribe_outcome),
+            daemon=True,
+        )
+        transcriber.start()
 
-    if play and recorded_file and Path(recorded_file).exists():
-        ffplay_path = shutil.which("ffplay")
-        if not ffplay_path:
-            click.echo("play: skipped (ffplay not found)", err=True)
-        else:
+    if play and recorded_file and recorded_exists:
+        play_timeout = max(5.0, float(record_seconds) + 5.0)
+        ffplay_path: str | None = None
+        try:
+            click.echo(
+                f"play: starting playback (timeout {play_timeout:.1f}s)...",
+                err=True,
+            )
+            if not _play_wav(recorded_file, play_timeout):
+                click.echo("play: playback timed out, stopped", err=True)
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            click.echo(f"play: in-process playback unavailable ({e})", err=True)
+            ffplay_path = shutil.which("ffplay")
+            if not ffplay_path:
+                click.echo("play: skipped (ffplay not found)", err=True)
+        if ffplay_path:
             try:
-                play_timeout = max(5.0, float(record_seconds) + 5.0)
                 click.echo(
                     f"play: starting ffplay (timeout {play_timeout:.1f}s)...",
                     err=True,
                 )
-                proc = subprocess.Popen(
+                with subprocess.Popen(
                     [
                         ffplay_path,
                         "-autoexit",
@@ -542,90 +722,35 @@ def _doctor_daemon(
                         "error",
                         recorded_file,
                     ],
-                    **(
-                        {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
-                        if is_windows()
-                        else {"start_new_session": True}
-                    ),
-                )
-                try:
-                    proc.wait(timeout=play_timeout)
-                except subprocess.TimeoutExpired:
-                    click.echo("play: ffplay timed out, terminating...", err=True)
-                    if not is_windows():
-                        try:
-                            os.killpg(proc.pid, signal.SIGTERM)
-                        except Exception:
-                            try:
-                                proc.terminate()
-                            except Exception:
-                                pass
-                    else:
-                        try:
-                            proc.terminate()
-                        except Exception:
-                            pass
+                    **_process_group_kwargs(),
+                ) as proc:
                     try:
-                        proc.wait(timeout=1.0)
-                    except subprocess.TimeoutExpired:
-                        if not is_windows():
-                            try:
-                                os.killpg(proc.pid, signal.SIGKILL)
-                            except Exception:
-                                try:
-                                    proc.kill()
-                                except Exception:
-                                    pass
-                        else:
-                            try:
-                                proc.kill()
-                            except Exception:
-                                pass
-                        try:
-                            proc.wait(timeout=1.0)
-                        except subprocess.TimeoutExpired:
-                            pass
-                except KeyboardInterrupt:
-                    click.echo("play: interrupted, terminating ffplay...", err=True)
-                    if not is_windows():
-                        try:
-                            os.killpg(proc.pid, signal.SIGTERM)
-                        except Exception:
-                            try:
-                                proc.terminate()
-                            except Exception:
-                                pass
-                    else:
-                        try:
-                            proc.terminate()
-                        except Exception:
-                            pass
-                    raise
+                        if not _wait_process(proc, play_timeout):
+                            click.echo("play: ffplay timed out, terminating...", err=True)
+                            _terminate_process(proc, grace_s=1.0)
+                    except KeyboardInterrupt:
+                        click.echo("play: interrupted, terminating ffplay...", err=True)
+                        _signal_process(proc, signal.SIGTERM)
+                        raise
             except Exception as e:
                 click.echo(f"play error: {e}", err=True)
 
     if transcribe_test:
-        if not recorded_file:
+        if transcriber is None:
             click.echo("transcribe-test: skipped (no record-test file)", err=True)
         else:
-            try:
-                from voicepipe.config import get_transcribe_model
-                from voicepipe.transcription import transcribe_audio_file
-
-                model = get_transcribe_model()
-                text = transcribe_audio_file(
-                    recorded_file,
-                    model=model,
-                    prefer_daemon=True,
-                )
+            transcriber.join()
+            if "error" in transcribe_outcome:
+                click.echo(f"transcribe-test error: {transcribe_outcome['error']}", err=True)
+            else:
                 click.echo("transcribe-test text:")
-                click.echo(text)
-            except Exception as e:
-                click.echo(f"transcribe-test error: {e}", err=True)
+                click.echo(transcribe_outcome.get("text", ""))
 
-    if cleanup and recorded_file and Path(recorded_file).exists():
+    if cleanup and recorded_file and recorded_exists:
         try:
-            Path(recorded_file).unlink()
+            os.unlink(recorded_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             click.echo(f"cleanup error: {e}", err=True)
 
@@ -651,7 +776,7 @@ def _doctor_daemon(
 @click.option(
     "--play",
     is_flag=True,
-    help="Play the record-test file via ffplay (if available)",
+    help="Play the record-test file (sounddevice, falling back to ffplay)",
 )
 @click.option(
     "--cleanup",
@@ -714,8 +839,7 @@ def _doctor_audio(seconds: float) -> None:
         if not pcm:
             raise RuntimeError("No audio data recorded")
 
-        arr = np.frombuffer(pcm, dtype=np.int16)
-        max_amp = int(np.max(np.abs(arr.astype(np.int32)))) if arr.size else 0
+        max_amp = pcm_peak(np.frombuffer(pcm, dtype=np.int16))
         click.echo(
             f"audio-test source={resolution.source} backend={getattr(recorder, 'backend', 'unknown')} "
             f"device={selection.device_index} samplerate={fs} channels={selection.channels} max_amp={max_amp}"
@@ -756,7 +880,7 @@ def doctor_audio(seconds: float) -> None:
 @click.option(
     "--play",
     is_flag=True,
-    help="Play the record-test file via ffplay (if available)",
+    help="Play the record-test file (sounddevice, falling back to ffplay)",
 )
 def doctor_legacy(
     audio_test: bool,
@@ -28,11 +28,15 @@ from voicepipe.recording_backend import (
 )
 from voicepipe.session import RecordingSession
 from voicepipe import trigger_meta
-from voicepipe.transcript_triggers import match_transcript_trigger
-from voicepipe.transcription import transcribe_audio_file_result, transcribe_audio_fileobj_result
+from voicepipe.transcription import (
+    prewarm_transcriber,
+    transcribe_audio_file_result,
+    transcribe_audio_fileobj_result,
+)
 from voicepipe.transcription_result import IntentResult, TranscriptionResult
 from voicepipe.typing import perform_type_sequence, press_enter, type_text
-from voicepipe.platform import is_windows
+from voicepipe.platform import is_windows, move_file
+from voicepipe.wav import MIN_AUDIO_BYTES
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +54,10 @@ def _emit_transcription(
         if not text:
             intent = IntentResult(mode="unknown", dictation_text="", reason="empty")
         else:
+            # Deferred: the trigger engine is only needed once there is a
+            # transcript, so `voicepipe cancel|status|stop` skip importing it.
+            from voicepipe.transcript_triggers import match_transcript_trigger
+
             match = match_transcript_trigger(text, triggers=get_transcript_triggers())
             if match is None:
                 intent = IntentResult(mode="dictation", dictation_text=text, reason="default")
@@ -155,11 +163,20 @@ def _transcribe_and_finalize(
     keep_audio: bool,
     source: str,
     prefer_daemon: bool = True,
+    prewarm: threading.Thread | None = None,
 ) -> None:
     transcription_ok = False
     try:
         if not audio_file:
             raise RuntimeError("No audio file produced")
+        try:
+            audio_size = os.stat(audio_file).st_size
+        except FileNotFoundError:
+            raise RuntimeError("No audio file produced") from None
+        if audio_size < MIN_AUDIO_BYTES:
+            raise RuntimeError(f"No audio captured ({audio_size} bytes recorded)")
+        if prewarm is not None:
+            prewarm.join()
         result = transcribe_audio_file_result(
             audio_file,
             model=resolved_model,
@@ -193,20 +210,21 @@ def _transcribe_and_finalize(
             except Exception:
                 pass
 
-        if audio_file and os.path.exists(audio_file):
+        if audio_file and transcription_ok and not keep_audio:
+            # The common path: delete without a separate existence check.
+            try:
+                os.unlink(audio_file)
+            except OSError:
+                pass
+        elif audio_file and os.path.exists(audio_file):
             if transcription_ok:
-                if keep_audio:
-                    click.echo(f"Kept audio file: {audio_file}", err=True)
-                    return
-                try:
-                    os.unlink(audio_file)
-                except Exception:
-                    pass
+                click.echo(f"Kept audio file: {audio_file}", err=True)
+                return
             else:
                 try:
                     dst_dir = preserved_audio_dir(create=True)
                     dst = dst_dir / Path(audio_file).name
-                    shutil.move(audio_file, dst)
+                    move_file(audio_file, dst)
                     audio_file = str(dst)
                 except Exception:
                     pass
@@ -308,8 +326,8 @@ def _transcribe_and_finalize_fileobj(
 def start(device: str | None) -> None:
     """Start recording audio from microphone."""
     try:
-        backend = AutoRecorderBackend()
-        result = backend.start(device=device)
+        with AutoRecorderBackend() as backend:
+            result = backend.start(device=device)
         if result.mode == "daemon":
             click.echo("Recording started (daemon mode)")
         else:
@@ -373,23 +391,36 @@ def stop(
     """Stop recording and transcribe the audio."""
     try:
         resolved_model = (model or get_transcribe_model()).strip()
-        backend = AutoRecorderBackend()
-        stop_result = backend.stop()
-        _transcribe_and_finalize(
-            audio_file=stop_result.audio_file,
-            session=stop_result.session,
-            recording_id=getattr(stop_result, "recording_id", None),
-            resolved_model=resolved_model,
-            language=language,
-            prompt=prompt,
-            temperature=float(temperature),
-            type_=bool(type_),
-            json_output=bool(json_),
-            clipboard=bool(clipboard),
-            keep_audio=bool(keep_audio),
-            source="stop",
-            prefer_daemon=True,
+        # Build the API client while the recorder flushes and exits; it is only
+        # waited on once there is audio worth transcribing.
+        prewarm = threading.Thread(
+            target=prewarm_transcriber,
+            args=(resolved_model,),
+            kwargs={"prefer_daemon": True},
+            daemon=True,
         )
+        prewarm.start()
+        try:
+            with AutoRecorderBackend() as backend:
+                stop_result = backend.stop()
+            _transcribe_and_finalize(
+                audio_file=stop_result.audio_file,
+                session=stop_result.session,
+                recording_id=getattr(stop_result, "recording_id", None),
+                resolved_model=resolved_model,
+                language=language,
+                prompt=prompt,
+                temperature=float(temperature),
+                type_=bool(type_),
+                json_output=bool(json_),
+                clipboard=bool(clipboard),
+                keep_audio=bool(keep_audio),
+                source="stop",
+                prefer_daemon=True,
+                prewarm=prewarm,
+            )
+        finally:
+            prewarm.join()
 
     except RecordingError as e:
         click.echo(f"Error: {e}", err=True)
@@ -403,8 +434,8 @@ def stop(
 def status() -> None:
     """Check recording status."""
     try:
-        backend = AutoRecorderBackend()
-        result = backend.status()
+        with AutoRecorderBackend() as backend:
+            result = backend.status()
         if result.mode == "daemon":
             if result.status == "recording":
                 click.echo("Status: recording (daemon mode)")
@@ -579,21 +610,27 @@ def dictate(
     # but use an in-process (in-memory) recorder when the daemon is not desired
     # or unavailable (notably on Windows).
     if not is_windows() and prefer_daemon:
-        backend = AutoRecorderBackend()
-        started = False
         try:
-            backend.start(device=device)
-            started = True
-
-            if seconds is None:
-                click.echo("Recording... press ENTER to stop (Ctrl+C to cancel).", err=True)
-                _ = sys.stdin.readline()
-            else:
-                click.echo(f"Recording for {float(seconds):.1f}s...", err=True)
-                time.sleep(float(seconds))
+            with AutoRecorderBackend() as backend:
+                backend.start(device=device)
+                try:
+                    if seconds is None:
+                        click.echo(
+                            "Recording... press ENTER to stop (Ctrl+C to cancel).", err=True
+                        )
+                        _ = sys.stdin.readline()
+                    else:
+                        click.echo(f"Recording for {float(seconds):.1f}s...", err=True)
+                        time.sleep(float(seconds))
+
+                    stop_result = backend.stop()
+                except BaseException:
+                    try:
+                        backend.cancel()
+                    except Exception:
+                        pass
+                    raise
 
-            stop_result = backend.stop()
-            started = False
             resolved_model = (model or get_transcribe_model()).strip()
             _transcribe_and_finalize(
                 audio_file=stop_result.audio_file,
@@ -612,28 +649,13 @@ def dictate(
             )
             return
         except KeyboardInterrupt:
-            if started:
-                try:
-                    backend.cancel()
-                except Exception:
-                    pass
             raise SystemExit(130)
         except RecordingError as e:
-            if started:
-                try:
-                    backend.cancel()
-                except Exception:
-                    pass
             click.echo(f"Error: {e}", err=True)
             raise SystemExit(1)
         except SystemExit:
             raise
         except Exception as e:
-            if started:
-                try:
-                    backend.cancel()
-                except Exception:
-                    pass
             click.echo(f"Error: {e}", err=True)
             raise SystemExit(1)
 
@@ -787,8 +809,8 @@ def dictate(
 def cancel() -> None:
     """Cancel active recording without transcribing."""
     try:
-        backend = AutoRecorderBackend()
-        backend.cancel()
+        with AutoRecorderBackend() as backend:
+            backend.cancel()
         click.echo("Recording cancelled")
 
     except RecordingError as e:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 
 import click
 
@@ -18,8 +19,8 @@ from voicepipe.systemd import (
     run_systemctl,
     selected_units,
     systemctl_cat,
-    systemctl_show_properties,
     systemctl_path,
+    systemctl_show_units,
     user_unit_dir,
 )
 
@@ -255,9 +256,10 @@ def service_reload() -> None:
     )
 
 
-def _format_unit_line(unit: str) -> tuple[str, bool, bool]:
-    props_wanted = ["LoadState", "ActiveState", "SubState", "UnitFileState"]
-    props = systemctl_show_properties(unit, props_wanted)
+_STATUS_PROPS = ["LoadState", "ActiveState", "SubState", "UnitFileState"]
+
+
+def _format_unit_line(unit: str, props: dict[str, str]) -> tuple[str, bool, bool]:
     load_state = props.get("LoadState", "")
     active_state = props.get("ActiveState", "") or "unknown"
     sub_state = props.get("SubState", "")
@@ -299,31 +301,29 @@ def service_status(full: bool, recorder: bool, transcriber: bool) -> None:
                     units = [TARGET_UNIT, *units]
             except Exception:
                 pass
-        rc = 0
-        for unit in units:
-            proc = subprocess.run(
-                ["systemctl", "--user", "--no-pager", "--full", "status", unit],
-                check=False,
-            )
-            rc = max(rc, proc.returncode)
-        raise SystemExit(rc)
+        # systemctl prints each unit in turn; one call covers them all.
+        proc = subprocess.run(
+            ["systemctl", "--user", "--no-pager", "--full", "status", *units],
+            check=False,
+        )
+        raise SystemExit(proc.returncode)
 
     click.echo("Voicepipe services (systemd --user):")
-    units: list[str] = []
+    # One `systemctl show` for every unit instead of a cat + show per unit.
     if recorder or transcriber:
         units = _service_units(recorder, transcriber)
+        props_by_unit = systemctl_show_units(units, _STATUS_PROPS)
     else:
-        try:
-            if systemctl_cat(TARGET_UNIT).returncode == 0:
-                units.append(TARGET_UNIT)
-        except Exception:
-            pass
-        units.extend([RECORDER_UNIT, TRANSCRIBER_UNIT])
+        units = [TARGET_UNIT, RECORDER_UNIT, TRANSCRIBER_UNIT]
+        props_by_unit = systemctl_show_units(units, _STATUS_PROPS)
+        target_load_state = props_by_unit[TARGET_UNIT].get("LoadState", "")
+        if target_load_state in ("", "not-found"):
+            units = [RECORDER_UNIT, TRANSCRIBER_UNIT]
 
     any_missing = False
     any_inactive = False
     for unit in units:
-        line, found, is_active = _format_unit_line(unit)
+        line, found, is_active = _format_unit_line(unit, props_by_unit[unit])
         click.echo(f"  {line}")
         if not found:
             any_missing = True
@@ -353,7 +353,8 @@ def service_status(full: bool, recorder: bool, transcriber: bool) -> None:
 @click.option("--transcriber", is_flag=True, hidden=True, help="Only manage the transcriber unit")
 def service_logs(lines: int, follow: bool, recorder: bool, transcriber: bool) -> None:
     """Tail logs for Voicepipe services."""
-    if not journalctl_path():
+    journalctl = journalctl_path()
+    if not journalctl:
         raise click.ClickException("journalctl not found")
     units = _service_units(recorder, transcriber)
     cmd = ["journalctl", "--user"]
@@ -362,4 +363,10 @@ def service_logs(lines: int, follow: bool, recorder: bool, transcriber: bool) ->
     cmd.extend(["-n", str(int(lines))])
     if follow:
         cmd.append("-f")
+    if os.name == "posix":
+        # Nothing runs after journalctl, so hand the process over to it rather
+        # than keeping a Python parent alive (for hours, with --follow).
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(journalctl, cmd)
     raise SystemExit(subprocess.run(cmd, check=False).returncode)
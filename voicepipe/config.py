@@ -23,11 +23,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-try:
-    from dotenv import load_dotenv
-except Exception:  # pragma: no cover
-    load_dotenv = None
-
 from voicepipe.platform import getenv_path, is_windows
 from voicepipe.platform import is_macos
 
@@ -208,6 +203,23 @@ def _read_key_from_api_keys(*, env_name: str, dir_candidates: list[str]) -> str:
     return ""
 
 
+def _find_local_dotenv() -> str | None:
+    """Return the first local `.env` (cwd, then the config dir) that exists.
+
+    Two stat calls, so python-dotenv only gets imported when there is a file
+    for it to load.
+    """
+    candidates = [os.path.join(os.getcwd(), ".env")]
+    try:
+        candidates.append(os.fspath(config_dir() / ".env"))
+    except Exception:
+        pass
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
 def load_environment(*, load_cwd_dotenv: bool = True) -> None:
     """Load Voicepipe configuration into environment variables.
 
@@ -235,9 +247,12 @@ def load_environment(*, load_cwd_dotenv: bool = True) -> None:
         pass
 
     if load_cwd_dotenv:
-        if load_dotenv is not None:
+        dotenv_path = _find_local_dotenv()
+        if dotenv_path is not None:
             try:
-                load_dotenv(override=False)
+                from dotenv import load_dotenv
+
+                load_dotenv(dotenv_path, override=False)
             except Exception:
                 pass
 
@@ -654,13 +669,17 @@ def read_env_file(path: Optional[Path] = None) -> dict[str, str]:
     """
 
     env_path = env_file_path() if path is None else Path(path)
-    if not env_path.exists():
+    # Single open+read (no separate exists() stat); a missing file is just empty.
+    try:
+        with open(env_path, "rb") as fh:
+            data = fh.read()
+    except OSError:
         return {}
 
     out: dict[str, str] = {}
     try:
         # Use utf-8-sig so UTF-8 BOM files (common on Windows) are accepted.
-        for raw in env_path.read_text(encoding="utf-8-sig").splitlines():
+        for raw in data.decode("utf-8-sig").splitlines():
             line = raw.strip()
             if not line or line.startswith("#"):
                 continue
@@ -21,6 +21,7 @@ from .audio import resolve_audio_input, select_audio_input
 from .audio_device import apply_pulse_source_preference, get_default_pulse_source
 from .config import get_audio_channels, get_audio_sample_rate
 from .device import parse_device_index
+from .ipc import encode_json_message
 from .logging_utils import configure_logging
 from .paths import audio_tmp_dir, daemon_socket_path
 from .recorder import FastAudioRecorder
@@ -206,7 +207,7 @@ class RecordingDaemon:
         while self.running:
             try:
                 conn, _ = self.socket.accept()
-                threading.Thread(target=self._handle_client, args=(conn,)).start()
+                threading.Thread(target=self._handle_client, args=(conn,), daemon=True).start()
             except Exception as e:
                 if self.running:
                     logger.exception("Error accepting connection: %s", e)
@@ -237,56 +238,84 @@ class RecordingDaemon:
         logger.info("Daemon shutdown complete.")
         sys.exit(0)
         
+    def _read_request(self, conn, buf: bytes):
+        """Read one request from `conn`; returns (request, leftover bytes).
+
+        Requests are newline-delimited JSON. A bare JSON object without a
+        trailing newline is still accepted for older clients.
+        """
+        while True:
+            line, sep, rest = buf.partition(b"\n")
+            if sep:
+                if line.strip():
+                    return json.loads(line.decode()), rest
+                buf = rest
+                continue
+            if buf.strip():
+                try:
+                    return json.loads(buf.decode()), b""
+                except json.JSONDecodeError:
+                    pass
+            chunk = conn.recv(4096)
+            if not chunk:
+                return None, b""
+            buf += chunk
+            if len(buf) > 65536:
+                raise ValueError("Request too large")
+
+    def _dispatch(self, request):
+        command = request.get('command')
+
+        with self._state_lock:
+            if command == 'start':
+                return self._start_recording(request.get('device'))
+            elif command == 'stop':
+                return self._stop_recording()
+            elif command == 'cancel':
+                return self._cancel_recording()
+            elif command == 'status':
+                return self._get_status()
+            else:
+                return {'error': f'Unknown command: {command}'}
+
     def _handle_client(self, conn):
-        """Handle client requests."""
+        """Handle client requests.
+
+        A client may send several requests over one connection (see
+        `voicepipe.ipc.IpcClient`); the connection is closed once the client
+        hangs up or stays idle past the timeout.
+        """
+        buf = b""
+        served = False
         try:
             conn.settimeout(2.0)
-            data = b""
-            request = None
             while True:
-                chunk = conn.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if len(data) > 65536:
-                    raise ValueError("Request too large")
                 try:
-                    request = json.loads(data.decode())
-                    break
-                except json.JSONDecodeError:
-                    continue
-
-            if not request:
-                return
+                    request, buf = self._read_request(conn, buf)
+                except socket.timeout:
+                    if served:
+                        return
+                    raise
+                if not request:
+                    return
+
+                response = self._dispatch(request)
+                try:
+                    conn.sendall(encode_json_message(response))
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                served = True
+                conn.settimeout(30.0)
 
-            command = request.get('command')
-            
-            with self._state_lock:
-                if command == 'start':
-                    response = self._start_recording(request.get('device'))
-                elif command == 'stop':
-                    response = self._stop_recording()
-                elif command == 'cancel':
-                    response = self._cancel_recording()
-                elif command == 'status':
-                    response = self._get_status()
-                else:
-                    response = {'error': f'Unknown command: {command}'}
-                
-            try:
-                conn.sendall(json.dumps(response).encode())
-            except (BrokenPipeError, ConnectionResetError):
-                pass
-            
         except Exception as e:
             response = {'error': str(e)}
             try:
-                conn.sendall(json.dumps(response).encode())
-            except (BrokenPipeError, ConnectionResetError):
+                conn.sendall(encode_json_message(response))
+            except (BrokenPipeError, ConnectionResetError, OSError):
                 pass
         finally:
             conn.close()
-            
+
     def _start_recording(self, device_index=None):
         """Start a new recording."""
         if self.recording:
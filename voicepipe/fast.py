@@ -8,7 +8,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
-import shutil
 import sys
 import threading
 import time
@@ -19,11 +18,13 @@ from voicepipe import trigger_meta
 from voicepipe.config import get_transcribe_model, load_environment
 from voicepipe.locks import LockHeld, PidFileLock
 from voicepipe.paths import logs_dir, preserved_audio_dir, runtime_app_dir
-from voicepipe.platform import is_linux, is_macos, is_windows
+from voicepipe.platform import is_linux, is_macos, is_windows, move_file
 from voicepipe.recording_backend import AutoRecorderBackend, RecordingError
+from voicepipe.wav import MIN_AUDIO_BYTES
 
 
 DEBOUNCE_MS = 500  # milliseconds
+_USAGE = "Usage: voicepipe-fast [start|stop|toggle|cancel|status]"
 
 _LOG_FH = None
 _INPROCESS_RECORDING: dict[str, object] = {}
@@ -289,11 +290,16 @@ def execute_toggle_split(*, perform_transcribe: bool) -> _TogglePostStop | None:
     try:
         fast_log("[TOGGLE] Starting toggle execution")
 
-        backend = AutoRecorderBackend()
-        status = backend.status()
-        fast_log(f"[TOGGLE] Status: {status.mode}:{status.status}")
+        with AutoRecorderBackend() as backend:
+            status = backend.status()
+            fast_log(f"[TOGGLE] Status: {status.mode}:{status.status}")
+
+            if status.status != "recording":
+                fast_log("[TOGGLE] Starting recording...")
+                # Start recording
+                backend.start(device=None)
+                return None
 
-        if status.status == "recording":
             # Keep imports out of the `start` hot path.
             from voicepipe.typing import (
                 get_active_window_id,
@@ -312,25 +318,19 @@ def execute_toggle_split(*, perform_transcribe: bool) -> _TogglePostStop | None:
                     fast_log("[TOGGLE] Target window: (unknown)")
 
             fast_log("[TOGGLE] Recording active, stopping...")
-            # Stop and transcribe
             stop_result = backend.stop()
-            audio_file = stop_result.audio_file
-            fast_log(f"[TOGGLE] Audio file: {audio_file}")
-            post = _TogglePostStop(
-                audio_file=audio_file,
-                target_window=target_window,
-                typing_backend=typing_backend,
-            )
-            if not perform_transcribe:
-                return post
 
-            _perform_toggle_post_stop(post)
-        else:
-            fast_log("[TOGGLE] Starting recording...")
-            # Start recording
-            backend.start(device=None)
-            return None
+        audio_file = stop_result.audio_file
+        fast_log(f"[TOGGLE] Audio file: {audio_file}")
+        post = _TogglePostStop(
+            audio_file=audio_file,
+            target_window=target_window,
+            typing_backend=typing_backend,
+        )
+        if not perform_transcribe:
+            return post
 
+        _perform_toggle_post_stop(post)
         return None
     except RecordingError as e:
         fast_log(f"[TOGGLE] Recording error: {e}")
@@ -417,15 +417,17 @@ def _perform_toggle_post_stop(post: _TogglePostStop) -> None:
         fast_log("[TOGGLE] No transcription returned")
 
     if transcription_ok:
-        if os.path.exists(audio_file):
+        try:
             os.unlink(audio_file)
-            fast_log(f"[TOGGLE] Cleaned up audio file: {audio_file}")
+        except FileNotFoundError:
+            return
+        fast_log(f"[TOGGLE] Cleaned up audio file: {audio_file}")
         return
 
     try:
         dst_dir = preserved_audio_dir(create=True)
         dst = dst_dir / Path(audio_file).name
-        shutil.move(audio_file, dst)
+        move_file(audio_file, dst)
         audio_file = str(dst)
     except Exception:
         pass
@@ -895,17 +897,17 @@ def main(argv: Optional[list[str]] = None) -> None:
 
     args = list(sys.argv[1:] if argv is None else argv)
     if len(args) < 1:
-        _eprint("Usage: voicepipe-fast [start|stop|toggle]")
+        _eprint(_USAGE)
         raise SystemExit(1)
 
     if args[0] in ("-h", "--help", "help"):
-        _oprint("Usage: voicepipe-fast [start|stop|toggle]")
+        _oprint(_USAGE)
         raise SystemExit(0)
 
     cmd = args[0]
-    if cmd not in ("start", "stop", "toggle"):
+    if cmd not in ("start", "stop", "toggle", "cancel", "status"):
         _eprint(f"Error: unknown command: {cmd}")
-        _eprint("Usage: voicepipe-fast [start|stop|toggle]")
+        _eprint(_USAGE)
         raise SystemExit(2)
 
     # For toggle command, use file locking to prevent concurrent execution
@@ -934,54 +936,85 @@ def main(argv: Optional[list[str]] = None) -> None:
         return
 
     try:
-        backend = AutoRecorderBackend()
-        if cmd == "start":
-            status = backend.status()
-            if status.status == "recording":
-                raise SystemExit(0)  # Already recording, exit silently
+        with AutoRecorderBackend() as backend:
+            if cmd == "status":
+                # One word on stdout, cheap enough to poll from a status bar.
+                _oprint(backend.status().status)
+                return
 
-            backend.start(device=None)
-            return
+            if cmd == "cancel":
+                status = backend.status()
+                if status.status != "recording":
+                    raise SystemExit(0)  # Not recording, exit silently
+                backend.cancel()
+                return
+
+            if cmd == "start":
+                status = backend.status()
+                if status.status == "recording":
+                    raise SystemExit(0)  # Already recording, exit silently
 
-        elif cmd == "stop":
+                backend.start(device=None)
+                return
+
+            # cmd == "stop"
             status = backend.status()
             if status.status != "recording":
                 raise SystemExit(0)  # Not recording, exit silently
 
             stop_result = backend.stop()
-            audio_file = stop_result.audio_file
-            if os.path.exists(audio_file) and os.path.getsize(audio_file) > 0:
-                result = send_transcribe_request_result(audio_file, source="fast-stop")
-                output_text = (result.text or "").rstrip()
-                # Persist last output for replay/recovery workflows.
-                try:
-                    from voicepipe.last_output import save_last_output
 
-                    payload = result.to_dict()
-                    payload["output_text"] = output_text
-                    save_last_output(output_text, payload=payload)
+        audio_file = stop_result.audio_file
+        try:
+            audio_size: int | None = os.stat(audio_file).st_size
+        except OSError:
+            audio_size = None
+        if audio_size is None or audio_size < MIN_AUDIO_BYTES:
+            # Same threshold as `voicepipe stop`: don't upload a bare header.
+            if audio_size is not None:
+                try:
+                    dst_dir = preserved_audio_dir(create=True)
+                    dst = dst_dir / Path(audio_file).name
+                    move_file(audio_file, dst)
+                    audio_file = str(dst)
                 except Exception:
                     pass
-                # Output text
-                if output_text:
-                    out = getattr(sys, "stdout", None)
-                    if out is not None:
-                        print(output_text, file=out)
-                    else:
-                        fast_log(output_text)
-                # Clean up
-                if output_text and os.path.exists(audio_file):
-                    os.unlink(audio_file)
-                elif not output_text:
-                    try:
-                        dst_dir = preserved_audio_dir(create=True)
-                        dst = dst_dir / Path(audio_file).name
-                        shutil.move(audio_file, dst)
-                        audio_file = str(dst)
-                    except Exception:
-                        pass
-                    fast_log(f"[STOP] Preserved audio file: {audio_file}")
-            return
+                fast_log(f"[STOP] Preserved audio file: {audio_file}")
+            _eprint(f"Error: No audio captured ({audio_size or 0} bytes recorded)")
+            raise SystemExit(1)
+        result = send_transcribe_request_result(audio_file, source="fast-stop")
+        output_text = (result.text or "").rstrip()
+        # Persist last output for replay/recovery workflows.
+        try:
+            from voicepipe.last_output import save_last_output
+
+            payload = result.to_dict()
+            payload["output_text"] = output_text
+            save_last_output(output_text, payload=payload)
+        except Exception:
+            pass
+        # Output text
+        if output_text:
+            out = getattr(sys, "stdout", None)
+            if out is not None:
+                print(output_text, file=out)
+            else:
+                fast_log(output_text)
+        # Clean up
+        if output_text:
+            try:
+                os.unlink(audio_file)
+            except FileNotFoundError:
+                pass
+        else:
+            try:
+                dst_dir = preserved_audio_dir(create=True)
+                dst = dst_dir / Path(audio_file).name
+                move_file(audio_file, dst)
+                audio_file = str(dst)
+            except Exception:
+                pass
+            fast_log(f"[STOP] Preserved audio file: {audio_file}")
 
     except RecordingError as e:
         _eprint(f"Error: {e}")
@@ -26,8 +26,21 @@ class IpcProtocolError(IpcError):
     pass
 
 
+class _IpcConnectionClosed(IpcProtocolError):
+    pass
+
+
+def encode_json_message(message: Dict[str, Any]) -> bytes:
+    """Frame `message` for the daemon socket: compact UTF-8 JSON plus a newline.
+
+    Non-ASCII text (paths, device names) travels as raw UTF-8 rather than
+    `\\uXXXX` escapes; JSON still escapes any newline, so framing holds.
+    """
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
 def _read_json_message(sock: socket.socket, *, max_bytes: int) -> bytes:
-    data = b""
+    data = bytearray()
     while True:
         try:
             chunk = sock.recv(4096)
@@ -35,17 +48,170 @@ def _read_json_message(sock: socket.socket, *, max_bytes: int) -> bytes:
             raise IpcTimeout("Timed out waiting for daemon response") from e
         if not chunk:
             break
+        if not data and len(chunk) <= max_bytes and chunk.endswith(b"\n"):
+            # Replies are small, so the whole line usually arrives in one
+            # recv; hand it back without copying it through the buffer.
+            return chunk
         data += chunk
         if len(data) > max_bytes:
             raise IpcProtocolError(f"Daemon response too large (>{max_bytes} bytes)")
+        if data.endswith(b"\n"):
+            # The daemon terminates each reply with a newline (and compact JSON
+            # never contains one), so a complete reply needs no trial parse.
+            return bytes(data)
+        # Older daemons send one unterminated object; only a buffer ending in
+        # the closing brace can hold a complete one, so skip parsing otherwise.
+        if not data.endswith(b"}"):
+            continue
         try:
             json.loads(data.decode())
-            return data
+            return bytes(data)
         except json.JSONDecodeError:
             continue
     if not data:
-        raise IpcProtocolError("Daemon returned an empty response")
-    return data
+        raise _IpcConnectionClosed("Daemon returned an empty response")
+    return bytes(data)
+
+
+def _existing_socket_paths(socket_path: Optional[Path]) -> list[Path]:
+    sock_paths = [socket_path] if socket_path is not None else daemon_socket_paths()
+    existing_paths: list[Path] = []
+    for p in sock_paths:
+        try:
+            if p.exists():
+                existing_paths.append(p)
+        except Exception:
+            continue
+    if not existing_paths:
+        tried = ", ".join(str(p) for p in sock_paths)
+        raise IpcUnavailable(f"Daemon socket not found (tried: {tried})")
+    return existing_paths
+
+
+def _default_read_timeout(command: str) -> float:
+    return 0.5 if command == "status" else 5.0
+
+
+class IpcClient:
+    """A daemon connection that is reused across several requests.
+
+    The daemon answers newline-delimited requests on one connection until the
+    client hangs up, so callers issuing a sequence of commands (status, start,
+    stop) only pay for one connect. If the daemon dropped the connection in the
+    meantime (idle timeout, older single-shot daemon), the request is retried
+    once on a fresh connection, going straight to the socket path that worked
+    before rather than re-probing every candidate.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        *,
+        connect_timeout: float = 0.5,
+        max_response_bytes: int = 65536,
+    ) -> None:
+        self.socket_path = socket_path
+        self.connect_timeout = connect_timeout
+        self.max_response_bytes = max_response_bytes
+        self._sock: Optional[socket.socket] = None
+        self._connected_path: Optional[Path] = None
+
+    def __enter__(self) -> "IpcClient":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            try:
+                sock.close()
+            except Exception:
+                pass
+
+    def _open(self, sock_path: Path) -> socket.socket:
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        except OSError as e:
+            raise IpcUnavailable(f"Unix sockets are unavailable on this platform: {e}") from e
+        client.settimeout(self.connect_timeout)
+        try:
+            client.connect(str(sock_path))
+        except OSError:
+            client.close()
+            raise
+        self._connected_path = sock_path
+        return client
+
+    def _connect(self) -> socket.socket:
+        if self._connected_path is not None:
+            try:
+                return self._open(self._connected_path)
+            except OSError:
+                self._connected_path = None
+
+        existing_paths = _existing_socket_paths(self.socket_path)
+        last_error: Exception | None = None
+        for sock_path in existing_paths:
+            try:
+                return self._open(sock_path)
+            except OSError as e:
+                last_error = e
+
+        msg = f"Could not connect to daemon (tried: {', '.join(str(p) for p in existing_paths)})"
+        if last_error is not None:
+            msg = f"{msg}: {last_error}"
+        raise IpcUnavailable(msg)
+
+    def send(
+        self, command: str, *, read_timeout: Optional[float] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Send one request over the shared connection and return the response."""
+        if not command:
+            raise ValueError("command must be non-empty")
+        if read_timeout is None:
+            read_timeout = _default_read_timeout(command)
+        payload = encode_json_message({"command": command, **kwargs})
+
+        reused = self._sock is not None
+        while True:
+            if self._sock is None:
+                self._sock = self._connect()
+            sock = self._sock
+            try:
+                sock.settimeout(self.connect_timeout)
+                sock.sendall(payload)
+                sock.settimeout(read_timeout)
+                response_bytes = _read_json_message(sock, max_bytes=self.max_response_bytes)
+            except (OSError, _IpcConnectionClosed) as e:
+                self.close()
+                if reused:
+                    # The daemon hung up on the idle connection; retry once.
+                    reused = False
+                    continue
+                if isinstance(e, IpcError):
+                    raise
+                raise IpcUnavailable(f"Lost connection to daemon: {e}") from e
+            except IpcError:
+                self.close()
+                raise
+            try:
+                return json.loads(response_bytes.decode())
+            except json.JSONDecodeError as e:
+                self.close()
+                raise IpcProtocolError(f"Invalid JSON response from daemon: {e}") from e
+
+    def try_send(
+        self, command: str, *, read_timeout: Optional[float] = None, **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Best-effort variant of `send` with the same contract as `try_send_request`."""
+        try:
+            return self.send(command, read_timeout=read_timeout, **kwargs)
+        except IpcUnavailable:
+            return None
+        except IpcError as e:
+            return {"error": str(e)}
 
 
 def send_request(
@@ -61,20 +227,10 @@ def send_request(
     if not command:
         raise ValueError("command must be non-empty")
 
-    sock_paths = [socket_path] if socket_path is not None else daemon_socket_paths()
-    existing_paths: list[Path] = []
-    for p in sock_paths:
-        try:
-            if p.exists():
-                existing_paths.append(p)
-        except Exception:
-            continue
-    if not existing_paths:
-        tried = ", ".join(str(p) for p in sock_paths)
-        raise IpcUnavailable(f"Daemon socket not found (tried: {tried})")
+    existing_paths = _existing_socket_paths(socket_path)
 
     if read_timeout is None:
-        read_timeout = 0.5 if command == "status" else 5.0
+        read_timeout = _default_read_timeout(command)
 
     request = {"command": command, **kwargs}
 
@@ -93,7 +249,7 @@ def send_request(
                 last_error = e
                 continue
 
-            payload = (json.dumps(request) + "\n").encode()
+            payload = encode_json_message(request)
             try:
                 client.sendall(payload)
             except OSError as e:
@@ -6,8 +6,10 @@ from hot paths (e.g. hotkey runners) and during unit tests on any OS.
 
 from __future__ import annotations
 
+import errno
 import os
 import sys
+import time
 from typing import Optional
 
 
@@ -80,6 +82,183 @@ def pid_is_running(pid: int) -> bool:
         return False
 
 
+def process_start_time(pid: int) -> Optional[float]:
+    """Return when `pid` started, as a Unix timestamp, or None if unknown.
+
+    Read from /proc (Linux); other platforms return None.
+    """
+    try:
+        with open(f"/proc/{int(pid)}/stat", "rb") as fh:
+            stat = fh.read()
+        # The command name is parenthesised and may contain spaces, so split
+        # after its closing paren; starttime is field 22 overall.
+        start_ticks = int(stat[stat.rindex(b")") + 2 :].split()[19])
+        with open("/proc/stat", "rb") as fh:
+            for line in fh:
+                if line.startswith(b"btime "):
+                    boot_time = int(line.split()[1])
+                    break
+            else:
+                return None
+        return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def open_pidfd(pid: int) -> Optional[int]:
+    """Return a pidfd for `pid` (Linux >= 5.3), or None when unavailable."""
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None or pid <= 0:
+        return None
+    try:
+        return int(pidfd_open(int(pid)))
+    except OSError:
+        return None
+
+
+def wait_pidfd(pidfd: int, timeout_s: float) -> bool:
+    """Wait up to `timeout_s` for the process behind `pidfd` to exit."""
+    import select
+
+    poller = select.poll()
+    poller.register(pidfd, select.POLLIN)
+    return bool(poller.poll(max(0, int(float(timeout_s) * 1000))))
+
+
+def signal_pidfd(pidfd: int, signum: int) -> bool:
+    """Send `signum` via `pidfd`; returns False when unsupported or it fails."""
+    import signal
+
+    send = getattr(signal, "pidfd_send_signal", None)
+    if send is None:
+        return False
+    try:
+        send(pidfd, signum)
+        return True
+    except OSError:
+        return False
+
+
+def _wait_kqueue(pid: int, timeout_s: float) -> Optional[bool]:
+    """Wait for `pid` to exit with a kqueue NOTE_EXIT filter (macOS/BSD).
+
+    Returns None when kqueue is unavailable so the caller can poll instead.
+    """
+    import select
+
+    kqueue = getattr(select, "kqueue", None)
+    if kqueue is None or pid <= 0:
+        return None
+    try:
+        kq = kqueue()
+    except OSError:
+        return None
+    try:
+        event = select.kevent(
+            int(pid),
+            filter=select.KQ_FILTER_PROC,
+            flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+            fflags=select.KQ_NOTE_EXIT,
+        )
+        try:
+            return bool(kq.control([event], 1, max(0.0, float(timeout_s))))
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return None
+    finally:
+        kq.close()
+
+
+def wait_for_pid_exit(pid: int, *, timeout_s: float, poll_s: float = 0.05) -> bool:
+    """Return True once `pid` has exited, False if `timeout_s` elapses first.
+
+    On Linux this blocks on a pidfd and on macOS/BSD on a kqueue, so callers
+    wake as soon as the process exits; elsewhere it falls back to polling
+    `pid_is_running`, backing off from 1 ms up to `poll_s` so quick exits are
+    noticed quickly.
+    """
+    pidfd = open_pidfd(pid)
+    if pidfd is not None:
+        try:
+            return wait_pidfd(pidfd, timeout_s)
+        finally:
+            try:
+                os.close(pidfd)
+            except OSError:
+                pass
+
+    exited = _wait_kqueue(pid, timeout_s)
+    if exited is not None:
+        return exited
+
+    deadline = time.monotonic() + float(timeout_s)
+    delay = 0.001
+    while pid_is_running(pid):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, poll_s)
+    return True
+
+
+def move_file(src: str | os.PathLike[str], dst: str | os.PathLike[str]) -> str:
+    """Move `src` to the file path `dst` and return `dst`.
+
+    Same-filesystem moves are a single rename. On Linux, cross-device moves
+    copy with `os.sendfile` so the bytes stay in the kernel, then remove
+    `src`; everything else (and any failed copy) defers to `shutil.move`.
+    """
+    import shutil
+
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+    try:
+        os.rename(src, dst)
+        return dst
+    except OSError as e:
+        if e.errno != errno.EXDEV or not sys.platform.startswith("linux"):
+            return str(shutil.move(src, dst))
+
+    try:
+        _sendfile_copy(src, dst)
+    except BaseException as e:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        if not isinstance(e, OSError):
+            raise
+        return str(shutil.move(src, dst))
+    os.unlink(src)
+    return dst
+
+
+def _sendfile_copy(src: str, dst: str) -> None:
+    """Copy `src` to `dst` with `os.sendfile`, keeping mode and times."""
+    cloexec = getattr(os, "O_CLOEXEC", 0)
+    src_fd = os.open(src, os.O_RDONLY | cloexec)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(
+            dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | cloexec, st.st_mode & 0o777
+        )
+        try:
+            offset = 0
+            while offset < st.st_size:
+                sent = os.sendfile(dst_fd, src_fd, offset, st.st_size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            os.fsync(dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def supports_af_unix() -> bool:
     """Return True if the runtime supports `socket.AF_UNIX` sockets."""
     try:
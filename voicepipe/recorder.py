@@ -174,8 +174,7 @@ class AudioRecorder:
 
         if not getattr(data, "size", 0):
             return True
-        arr = np.asarray(data, dtype=np.int32)
-        return bool(arr.size and int(np.max(np.abs(arr))) == 0)
+        return not np.any(data)
 
     def _pre_open_stream(self) -> None:
         _require_sounddevice()
@@ -280,11 +279,7 @@ class AudioRecorder:
                 last_error = e
                 if not self._is_device_unavailable(e):
                     break
-                try:
-                    import time as _time
-                    _time.sleep(backoff)
-                except Exception:
-                    pass
+                time.sleep(backoff)
                 backoff = min(backoff * 2, 1.0)
                 self.stream = None
 
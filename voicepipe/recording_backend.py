@@ -7,17 +7,30 @@ fallback behavior consistent.
 from __future__ import annotations
 
 import os
+import select
 import signal
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, Any, Literal, Mapping
 
-from voicepipe.ipc import try_send_request
+from voicepipe.ipc import IpcClient
 from voicepipe.config import get_daemon_mode
-from voicepipe.platform import is_windows, pid_is_running
+from voicepipe.paths import logs_dir
+from voicepipe.platform import (
+    is_linux,
+    is_windows,
+    open_pidfd,
+    pid_is_running,
+    process_start_time,
+    signal_pidfd,
+    wait_for_pid_exit,
+    wait_pidfd,
+)
 from voicepipe.session import RecordingSession
 
 
@@ -63,8 +76,22 @@ class CancelResult:
 class DaemonRecorderBackend:
     mode: BackendMode = "daemon"
 
+    def __init__(self) -> None:
+        # One connection for the backend's lifetime: a status check followed
+        # by stop/cancel (the usual CLI sequence) costs a single connect.
+        self._client = IpcClient()
+
+    def __enter__(self) -> "DaemonRecorderBackend":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._client.close()
+
     def _call(self, command: str, **kwargs: Any) -> dict[str, Any]:
-        resp = try_send_request(command, **kwargs)
+        resp = self._client.try_send(command, **kwargs)
         if resp is None:
             raise BackendUnavailable("daemon unavailable")
         if resp.get("error"):
@@ -109,22 +136,201 @@ class DaemonRecorderBackend:
         )
 
 
+# Slack for comparing a process start time (derived from a whole-second boot
+# time, which also shifts when the wall clock is stepped) with the session's
+# started_at stamp.
+_START_TIME_SLACK_S = 5.0
+
+
+def _session_owns_pid(pid: int, started_at: Any) -> bool | None:
+    """Whether `pid` is still the process that wrote a session started at `started_at`.
+
+    The recorder creates its session after it starts, so a process that
+    started later can only be an unrelated one that reused the PID. Returns
+    None when either timestamp is unavailable.
+    """
+    if not isinstance(started_at, str) or not started_at:
+        return None
+    try:
+        session_ts = datetime.fromisoformat(started_at).timestamp()
+    except (ValueError, OverflowError, OSError):
+        return None
+    process_ts = process_start_time(pid)
+    if process_ts is None:
+        return None
+    return process_ts <= session_ts + _START_TIME_SLACK_S
+
+
+_RECORDER_LOG_NAME = "recording-subprocess.log"
+_RECORDER_LOG_MAX_BYTES = 1_000_000
+
+
+def _open_recorder_log() -> tuple[IO[bytes], Path | None]:
+    """Open the append-only log that receives the recorder child's stderr.
+
+    The child can run for minutes; a file (unlike a pipe nobody drains once
+    `start` returns) can never fill up and block its writes.
+    """
+    try:
+        path = logs_dir(create=True) / _RECORDER_LOG_NAME
+        try:
+            if path.stat().st_size > _RECORDER_LOG_MAX_BYTES:
+                os.replace(path, path.with_name(path.name + ".1"))
+        except OSError:
+            pass
+        return open(path, "ab"), path
+    except OSError:
+        return open(os.devnull, "wb"), None
+
+
+def _read_log_from(path: Path | None, offset: int) -> str:
+    if path is None:
+        return ""
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(offset)
+            return fh.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+class _SpawnedProcess:
+    """Minimal `Popen`-like handle for a child started via `os.posix_spawn`."""
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.returncode: int | None = None
+
+    def poll(self) -> int | None:
+        if self.returncode is not None:
+            return self.returncode
+        try:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+        except ChildProcessError:
+            # Already reaped elsewhere; treat as exited.
+            self.returncode = 0
+            return self.returncode
+        if pid:
+            self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+_RECORDER_MODULE = "voicepipe.recording_subprocess"
+
+
+def _can_fork_recorder() -> bool:
+    # fork() without exec is only safe while this process is single-threaded;
+    # macOS audio frameworks don't survive it at all, so keep it to Linux.
+    return is_linux() and hasattr(os, "fork") and threading.active_count() == 1
+
+
+def _close_fds_except(keep: tuple[int, ...]) -> None:
+    # Close every descriptor above stdio that isn't in `keep` (e.g. the
+    # parent's end of the ready pipe and its copy of the recorder log).
+    try:
+        max_fd = os.sysconf("SC_OPEN_MAX")
+    except (OSError, ValueError):
+        max_fd = 65536
+    low = 3
+    for fd in sorted(fd for fd in set(keep) if fd >= low):
+        os.closerange(low, fd)
+        low = fd + 1
+    os.closerange(low, max_fd)
+
+
 class SubprocessRecorderBackend:
     mode: BackendMode = "subprocess"
 
-    def _spawn(self, argv: list[str], *, env: dict[str, str]) -> subprocess.Popen:
+    def _spawn(
+        self,
+        argv: list[str],
+        *,
+        stderr: int,
+        env: Mapping[str, str] | None = None,
+        pass_fds: tuple[int, ...] = (),
+    ) -> subprocess.Popen | _SpawnedProcess:
+        if env is None and argv[1:3] == ["-m", _RECORDER_MODULE] and _can_fork_recorder():
+            return self._fork_recorder(argv[3:], stderr=stderr, pass_fds=pass_fds)
+        if not is_windows() and hasattr(os, "posix_spawn"):
+            return self._posix_spawn(argv, stderr=stderr, env=env, pass_fds=pass_fds)
         kwargs: dict[str, Any] = {}
         if is_windows():
             kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        else:
+            kwargs["pass_fds"] = pass_fds
+            kwargs["start_new_session"] = True
         return subprocess.Popen(
             argv,
             env=env,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True,
+            stderr=stderr,
             **kwargs,
         )
 
+    def _posix_spawn(
+        self,
+        argv: list[str],
+        *,
+        stderr: int,
+        env: Mapping[str, str] | None = None,
+        pass_fds: tuple[int, ...] = (),
+    ) -> _SpawnedProcess:
+        # posix_spawn avoids duplicating the parent's address space before
+        # exec; stdout goes to /dev/null and stderr to the caller's fd. Like
+        # the fork path, the child gets its own session.
+        for fd in pass_fds:
+            os.set_inheritable(fd, True)
+        pid = os.posix_spawn(
+            argv[0],
+            argv,
+            os.environ if env is None else env,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_DUP2, stderr, 2),
+            ],
+            setsid=True,
+        )
+        return _SpawnedProcess(pid)
+
+    def _fork_recorder(
+        self, args: list[str], *, stderr: int, pass_fds: tuple[int, ...] = ()
+    ) -> _SpawnedProcess:
+        """Run the recorder in a forked copy of this process.
+
+        The child already has the interpreter and voicepipe loaded, so it skips
+        the start-up and imports a fresh `python -m` would pay for. Like a
+        spawn with `close_fds`, it keeps only stdio and `pass_fds` open.
+        """
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        pid = os.fork()
+        if pid:
+            return _SpawnedProcess(pid)
+
+        code = 1
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            os.dup2(devnull, 0)
+            os.dup2(devnull, 1)
+            os.dup2(stderr, 2)
+            os.close(devnull)
+            _close_fds_except(pass_fds)
+
+            from voicepipe.recording_subprocess import main
+
+            main(args)
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except BaseException:
+            code = 1
+        finally:
+            os._exit(code)
+
     def _write_control(self, control_path: str, command: str) -> None:
         path = Path(control_path)
         try:
@@ -133,13 +339,50 @@ class SubprocessRecorderBackend:
             raise RecordingError(f"Failed to write control command ({command}) to {path}: {e}") from e
 
     def _wait_for_exit(self, pid: int, *, timeout_s: float) -> None:
-        deadline = time.monotonic() + float(timeout_s)
-        while time.monotonic() < deadline:
-            if not pid_is_running(int(pid)):
-                return
-            time.sleep(0.05)
+        if wait_for_pid_exit(int(pid), timeout_s=float(timeout_s)):
+            return
         raise RecordingError(f"Timed out waiting for recording subprocess to exit (pid={pid})")
 
+    def _request_exit(
+        self,
+        pid: int,
+        control_path: str,
+        command: str,
+        signum: int,
+        *,
+        started_at: Any = None,
+    ) -> None:
+        # Open the pidfd first so the identity check below and every later
+        # signal/wait refer to the same process, then make sure that process
+        # is still the recorder: a stale session file may name a PID that has
+        # since been reused by something else.
+        pidfd = open_pidfd(pid)
+        try:
+            self._write_control(control_path, command)
+            owner = _session_owns_pid(pid, started_at)
+            if owner is False:
+                # The recorder is gone; its PID now belongs to another process.
+                return
+            if pidfd is None:
+                if pid_is_running(pid):
+                    self._wait_for_exit(pid, timeout_s=10.0)
+                return
+            # The control file is the contract; the signal only wakes the
+            # child's loop now instead of at its next control-file poll, so
+            # it is skipped when the process identity can't be confirmed.
+            if owner:
+                signal_pidfd(pidfd, signum)
+            if not wait_pidfd(pidfd, 10.0):
+                raise RecordingError(
+                    f"Timed out waiting for recording subprocess to exit (pid={pid})"
+                )
+        finally:
+            if pidfd is not None:
+                try:
+                    os.close(pidfd)
+                except OSError:
+                    pass
+
     def start(self, *, device: str | int | None) -> StartResult:
         active = RecordingSession.find_active_sessions()
         if active:
@@ -147,13 +390,36 @@ class SubprocessRecorderBackend:
                 f"Recording already in progress (PID: {active[0].get('pid')})"
             )
 
-        env = os.environ.copy()
+        # The device travels as an argument so the child can inherit the
+        # environment as-is instead of us copying it.
+        argv = [sys.executable, "-m", _RECORDER_MODULE]
+        # The child writes a byte to this pipe once its session file exists
+        # (and the pipe hits EOF if it dies first), so we can block on it
+        # instead of polling for the file.
+        ready_r: int | None = None
+        ready_w: int | None = None
+        if not is_windows():
+            ready_r, ready_w = os.pipe()
+            argv += ["--ready-fd", str(ready_w)]
         if device is not None:
-            env["VOICEPIPE_DEVICE"] = str(device)
+            argv += ["--", str(device)]
 
-        proc = self._spawn([sys.executable, "-m", "voicepipe.cli", "_record"], env=env)
+        log_fh, log_path = _open_recorder_log()
+        try:
+            log_offset = log_fh.seek(0, os.SEEK_END)
+            if ready_w is None:
+                proc = self._spawn(argv, stderr=log_fh.fileno())
+            else:
+                proc = self._spawn(argv, stderr=log_fh.fileno(), pass_fds=(ready_w,))
+        except BaseException:
+            if ready_r is not None:
+                os.close(ready_r)
+            raise
+        finally:
+            log_fh.close()
+            if ready_w is not None:
+                os.close(ready_w)
 
-        state_file = RecordingSession.get_state_file(proc.pid)
         timeout_s = 5.0
         raw_timeout = os.environ.get("VOICEPIPE_RECORDING_INIT_TIMEOUT")
         if raw_timeout:
@@ -163,19 +429,41 @@ class SubprocessRecorderBackend:
                 pass
         deadline = time.monotonic() + timeout_s
         session: dict[str, Any] | None = None
-        while time.monotonic() < deadline:
-            if proc.poll() is not None:
-                stderr = (proc.stderr.read() if proc.stderr else "") if proc.stderr else ""
-                raise RecordingError(f"Error starting recording: {stderr}")
-            try:
-                if state_file.exists():
-                    session = RecordingSession.get_current_session()
-                    control = session.get("control_path") if isinstance(session, dict) else None
-                    if isinstance(control, str) and control:
-                        break
-            except Exception:
-                session = None
-            time.sleep(0.05)
+        # Without the ready pipe, wake immediately if the child dies instead
+        # of sleeping out the poll interval (pidfd on Linux; plain sleep
+        # elsewhere).
+        pidfd = open_pidfd(proc.pid) if ready_r is None else None
+        try:
+            while time.monotonic() < deadline:
+                if proc.poll() is not None:
+                    stderr = _read_log_from(log_path, log_offset).strip()
+                    raise RecordingError(f"Error starting recording: {stderr}")
+                # We know the child's PID, so read its state file directly
+                # rather than rescanning every session.
+                session = RecordingSession.read_session(proc.pid)
+                control = session.get("control_path") if session else None
+                if isinstance(control, str) and control:
+                    break
+                if ready_r is not None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                    if select.select([ready_r], [], [], remaining)[0]:
+                        # Ready byte or EOF: either way the pipe has said all
+                        # it will; re-check and fall back to polling.
+                        os.close(ready_r)
+                        ready_r = None
+                        pidfd = open_pidfd(proc.pid)
+                elif pidfd is None:
+                    time.sleep(0.05)
+                else:
+                    wait_pidfd(pidfd, 0.05)
+        finally:
+            if ready_r is not None:
+                os.close(ready_r)
+            if pidfd is not None:
+                try:
+                    os.close(pidfd)
+                except OSError:
+                    pass
 
         if not session:
             raise RecordingError(
@@ -204,8 +492,16 @@ class SubprocessRecorderBackend:
             recording_id=recording_id,
         )
 
-    def stop(self) -> StopResult:
-        session = RecordingSession.get_current_session()
+    def current_session(self) -> dict[str, Any] | None:
+        """Return the active session, or None when nothing is recording."""
+        try:
+            return RecordingSession.get_current_session()
+        except RuntimeError:
+            return None
+
+    def stop(self, *, session: dict[str, Any] | None = None) -> StopResult:
+        if session is None:
+            session = RecordingSession.get_current_session()
         pid = session.get("pid")
         audio_file = session.get("audio_file")
         recording_id = session.get("recording_id") if isinstance(session, dict) else None
@@ -218,24 +514,11 @@ class SubprocessRecorderBackend:
         if not isinstance(control_path, str) or not control_path:
             raise RecordingError("Session is missing control_path (upgrade mismatch?)")
 
-        self._write_control(control_path, "stop")
-        if pid_is_running(int(pid)):
-            self._wait_for_exit(int(pid), timeout_s=10.0)
-
-        # Best-effort: wait for the audio file to exist and have a stable, non-zero size.
-        try:
-            last_size = -1
-            for _ in range(3):
-                if not os.path.exists(audio_file):
-                    time.sleep(0.05)
-                    continue
-                size = os.path.getsize(audio_file)
-                if size > 0 and size == last_size:
-                    break
-                last_size = size
-                time.sleep(0.05)
-        except Exception:
-            pass
+        # Returns once the child has exited, i.e. after it finished writing
+        # the audio file, so there's nothing left to wait for.
+        self._request_exit(
+            int(pid), control_path, "stop", signal.SIGTERM, started_at=session.get("started_at")
+        )
 
         return StopResult(
             mode=self.mode,
@@ -244,8 +527,9 @@ class SubprocessRecorderBackend:
             recording_id=recording_id if isinstance(recording_id, str) else None,
         )
 
-    def cancel(self) -> CancelResult:
-        session = RecordingSession.get_current_session()
+    def cancel(self, *, session: dict[str, Any] | None = None) -> CancelResult:
+        if session is None:
+            session = RecordingSession.get_current_session()
         pid = session.get("pid")
         audio_file = session.get("audio_file")
         if not isinstance(pid, int):
@@ -255,9 +539,13 @@ class SubprocessRecorderBackend:
         if not isinstance(control_path, str) or not control_path:
             raise RecordingError("Session is missing control_path (upgrade mismatch?)")
 
-        self._write_control(control_path, "cancel")
-        if pid_is_running(int(pid)):
-            self._wait_for_exit(int(pid), timeout_s=10.0)
+        self._request_exit(
+            int(pid),
+            control_path,
+            "cancel",
+            getattr(signal, "SIGUSR1", signal.SIGINT),
+            started_at=session.get("started_at"),
+        )
 
         # Cleanup is best-effort; the subprocess also cleans up its own session.
         try:
@@ -265,25 +553,24 @@ class SubprocessRecorderBackend:
         except Exception:
             pass
 
-        if isinstance(audio_file, str) and audio_file and os.path.exists(audio_file):
+        if isinstance(audio_file, str) and audio_file:
             try:
                 os.unlink(audio_file)
-            except Exception:
+            except OSError:
                 pass
 
         return CancelResult(mode=self.mode)
 
     def status(self) -> StatusResult:
-        try:
-            session = RecordingSession.get_current_session()
-            pid = session.get("pid")
-            return StatusResult(
-                mode=self.mode,
-                status="recording",
-                pid=int(pid) if isinstance(pid, int) else None,
-            )
-        except RuntimeError:
+        session = self.current_session()
+        if session is None:
             return StatusResult(mode=self.mode, status="idle", pid=None)
+        pid = session.get("pid")
+        return StatusResult(
+            mode=self.mode,
+            status="recording",
+            pid=int(pid) if isinstance(pid, int) else None,
+        )
 
 
 class AutoRecorderBackend:
@@ -301,6 +588,15 @@ class AutoRecorderBackend:
         self._daemon = DaemonRecorderBackend()
         self._subprocess = SubprocessRecorderBackend()
 
+    def __enter__(self) -> "AutoRecorderBackend":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._daemon.close()
+
     def _daemon_allowed(self) -> bool:
         if self._daemon_mode == "never":
             return False
@@ -339,9 +635,11 @@ class AutoRecorderBackend:
         if self._daemon_required() and daemon_status is None and self._daemon_allowed():
             raise RecordingError("Daemon mode required but daemon is unavailable")
 
-        subprocess_status = self._subprocess_status()
-        if subprocess_status.status == "recording":
-            return self._subprocess.stop()
+        # Hand the session we just found to the backend so it isn't looked
+        # up (and every state file rescanned) a second time.
+        session = self._subprocess.current_session()
+        if session is not None:
+            return self._subprocess.stop(session=session)
 
         raise RecordingError("No recording in progress")
 
@@ -353,9 +651,11 @@ class AutoRecorderBackend:
         if self._daemon_required() and daemon_status is None and self._daemon_allowed():
             raise RecordingError("Daemon mode required but daemon is unavailable")
 
-        subprocess_status = self._subprocess_status()
-        if subprocess_status.status == "recording":
-            return self._subprocess.cancel()
+        # Hand the session we just found to the backend so it isn't looked
+        # up (and every state file rescanned) a second time.
+        session = self._subprocess.current_session()
+        if session is not None:
+            return self._subprocess.cancel(session=session)
 
         raise RecordingError("No recording in progress")
 
@@ -3,13 +3,60 @@
 This exists so recording can run as a separate process that can be stopped via
 signals or a cross-platform control file while keeping the top-level Click CLI
 responsive.
+
+The backend launches it as
+`python -m voicepipe.recording_subprocess [--ready-fd FD] [-- DEVICE]` so the
+child skips importing Click and the CLI command tree. With `--ready-fd`, one
+byte is written to FD once the session file exists.
 """
 
 from __future__ import annotations
 
+from typing import Optional, Sequence
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    import logging
+    import os
+    import sys
+
+    from voicepipe.config import load_environment
+    from voicepipe.logging_utils import configure_logging
+
+    args = list(sys.argv[1:] if argv is None else argv)
+    ready_fd: Optional[int] = None
+    if len(args) >= 2 and args[0] == "--ready-fd":
+        ready_fd = int(args[1])
+        args = args[2:]
+    if args and args[0] == "--":
+        args = args[1:]
+    load_environment()
+    configure_logging(default_level=logging.WARNING)
+    if args and args[0]:
+        os.environ["VOICEPIPE_DEVICE"] = args[0]
+
+    run_recording_subprocess(ready_fd=ready_fd)
 
-def run_recording_subprocess() -> None:
+
+def _signal_ready(fd: Optional[int]) -> None:
+    if fd is None:
+        return
     import os
+
+    try:
+        os.write(fd, b"1")
+    except OSError:
+        pass
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def run_recording_subprocess(*, ready_fd: Optional[int] = None) -> None:
+    import contextlib
+    import os
+    import select
     import signal
     import sys
     import threading
@@ -21,6 +68,8 @@ def run_recording_subprocess() -> None:
     recorder = None
     session = None
     timeout_timer = None
+    max_seconds = 300.0
+    use_itimer = hasattr(signal, "setitimer") and hasattr(signal, "SIGALRM")
     try:
         def _safe_stderr(message: str) -> None:
             err = getattr(sys, "stderr", None)
@@ -32,49 +81,69 @@ def run_recording_subprocess() -> None:
             except Exception:
                 pass
 
-        # Create the session file first so callers can observe that the
-        # subprocess is alive even if importing audio dependencies is slow
-        # (Windows AV / first-run import jitter).
-        session = RecordingSession.create_session()
-        audio_file = str(session.get("audio_file") or "")
-        control_path = str(session.get("control_path") or "")
-        control_file = Path(control_path) if control_path else None
-
         stop_event = threading.Event()
         requested_action: dict[str, str] = {"action": ""}
         timed_out: dict[str, bool] = {"value": False}
 
         def _cleanup_session() -> None:
-            try:
+            with contextlib.suppress(Exception):
                 RecordingSession.cleanup_session(session)
-            except Exception:
-                pass
 
         def _request(action: str) -> None:
             if not requested_action["action"]:
                 requested_action["action"] = action
             stop_event.set()
 
-        def stop_handler(_signum, _frame) -> None:
+        def _timeout_stop(*_args) -> None:
+            timed_out["value"] = True
             _request("stop")
 
-        def cancel_handler(_signum, _frame) -> None:
-            _request("cancel")
+        signal_actions: dict[int, str] = {signal.SIGTERM: "stop", signal.SIGINT: "cancel"}
+        if hasattr(signal, "SIGUSR1"):
+            signal_actions[signal.SIGUSR1] = "cancel"
+
+        def _dispatch_signal(signum: int) -> None:
+            if use_itimer and signum == signal.SIGALRM:
+                _timeout_stop()
+                return
+            action = signal_actions.get(signum)
+            if action:
+                _request(action)
+
+        # On Unix, route signals through a wakeup pipe: the handlers only wake
+        # the main loop, which dispatches them outside of signal context.
+        wakeup_fds: list[int] = []
+        if os.name == "posix" and hasattr(select, "poll"):
+            rfd, wfd = os.pipe()
+            try:
+                os.set_blocking(rfd, False)
+                os.set_blocking(wfd, False)
+                signal.set_wakeup_fd(wfd)
+                wakeup_fds = [rfd, wfd]
+            except Exception:
+                os.close(rfd)
+                os.close(wfd)
+
+        def signal_handler(signum, _frame) -> None:
+            if not wakeup_fds:
+                _dispatch_signal(signum)
 
         # Signals are best-effort (mostly for Unix), but the cross-platform
         # contract is the control file stored in the session JSON.
-        try:
-            signal.signal(signal.SIGTERM, stop_handler)
-        except Exception:
-            pass
-        try:
-            signal.signal(signal.SIGINT, cancel_handler)
-        except Exception:
-            pass
-        try:
-            signal.signal(signal.SIGUSR1, cancel_handler)
-        except Exception:
-            pass
+        for signum in signal_actions:
+            with contextlib.suppress(Exception):
+                signal.signal(signum, signal_handler)
+
+        # Create the session file (after the handlers, since stop/cancel may
+        # signal us as soon as it appears) so callers can observe that the
+        # subprocess is alive even if importing audio dependencies is slow
+        # (Windows AV / first-run import jitter).
+        session = RecordingSession.create_session()
+        _signal_ready(ready_fd)
+        ready_fd = None
+        audio_file = str(session.get("audio_file") or "")
+        control_path = str(session.get("control_path") or "")
+        control_file = Path(control_path) if control_path else None
 
         from voicepipe.audio import (
             resolve_audio_input_for_recording,
@@ -108,10 +177,8 @@ def run_recording_subprocess() -> None:
             recorder.start_recording(output_file=audio_file)
         except Exception as e:
             _safe_stderr(f"Audio start failed ({resolution.source}): {e}")
-            try:
+            with contextlib.suppress(Exception):
                 recorder.cleanup()
-            except Exception:
-                pass
 
             strict = str(getattr(resolution, "source", "")).startswith("config-")
             selection = select_audio_input(
@@ -138,23 +205,36 @@ def run_recording_subprocess() -> None:
                 name = str(sd.query_devices(int(selection.device_index)).get("name", ""))
             except Exception:
                 name = ""
-            try:
+            with contextlib.suppress(Exception):
                 write_device_cache(selection, device_name=name, source="auto")
-            except Exception:
-                pass
-
-        def _timeout_stop() -> None:
-            timed_out["value"] = True
-            _request("stop")
 
-        timeout_timer = threading.Timer(300, _timeout_stop)
-        timeout_timer.daemon = True
-        timeout_timer.start()
+        # Prefer a kernel interval timer (no extra thread); Windows has no
+        # SIGALRM, so keep a daemon Timer thread there.
+        if use_itimer:
+            signal.signal(signal.SIGALRM, signal_handler)
+            signal.setitimer(signal.ITIMER_REAL, max_seconds)
+        else:
+            timeout_timer = threading.Timer(max_seconds, _timeout_stop)
+            timeout_timer.daemon = True
+            timeout_timer.start()
 
         last_mtime_ns: int | None = None
         poll_s = 0.05
+        poller = None
+        if wakeup_fds:
+            poller = select.poll()
+            poller.register(wakeup_fds[0], select.POLLIN)
         while not stop_event.is_set():
-            stop_event.wait(timeout=poll_s)
+            if poller is not None:
+                if poller.poll(int(poll_s * 1000)):
+                    try:
+                        signums = os.read(wakeup_fds[0], 64)
+                    except BlockingIOError:
+                        signums = b""
+                    for signum in signums:
+                        _dispatch_signal(signum)
+            else:
+                stop_event.wait(timeout=poll_s)
             if stop_event.is_set():
                 break
 
@@ -189,25 +269,33 @@ def run_recording_subprocess() -> None:
                 _request("cancel")
 
         action = requested_action["action"] or "stop"
+        if use_itimer:
+            with contextlib.suppress(Exception):
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        if wakeup_fds:
+            with contextlib.suppress(Exception):
+                signal.set_wakeup_fd(-1)
+            for fd in wakeup_fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            wakeup_fds = []
         if timeout_timer:
-            try:
+            with contextlib.suppress(Exception):
                 timeout_timer.cancel()
-            except Exception:
-                pass
             timeout_timer = None
 
         if action == "cancel":
             if recorder and recorder.recording:
-                try:
+                with contextlib.suppress(Exception):
                     recorder.stop_recording()
-                except Exception:
-                    pass
             if recorder:
                 recorder.cleanup()
             try:
-                if audio_file and os.path.exists(audio_file):
+                if audio_file:
                     os.unlink(audio_file)
-            except Exception:
+            except OSError:
                 pass
             _cleanup_session()
             raise SystemExit(0)
@@ -252,21 +340,21 @@ def run_recording_subprocess() -> None:
     except SystemExit:
         raise
     except Exception as e:
-        try:
+        with contextlib.suppress(Exception):
             _safe_stderr(f"Error: {e}")
-        except Exception:
-            pass
         if recorder:
             recorder.cleanup()
         if session:
-            try:
+            with contextlib.suppress(Exception):
                 RecordingSession.cleanup_session(session)
-            except Exception:
-                pass
         try:
             audio_file = str(session.get("audio_file") or "") if session else ""
-            if audio_file and os.path.exists(audio_file):
+            if audio_file:
                 os.unlink(audio_file)
         except Exception:
             pass
         raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
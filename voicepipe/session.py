@@ -39,11 +39,18 @@ class RecordingSession:
     def find_active_sessions(cls) -> list[dict[str, Any]]:
         """Find all active recording sessions."""
         state_dir = cls.state_dir(create=False)
-        if not state_dir.exists():
+        try:
+            with os.scandir(state_dir) as it:
+                candidates = [
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.startswith(cls.STATE_PREFIX) and entry.name.endswith(".json")
+                ]
+        except OSError:
             return []
 
         sessions: list[dict[str, Any]] = []
-        for file in state_dir.glob(f"{cls.STATE_PREFIX}*.json"):
+        for file in candidates:
             try:
                 with open(file, "r", encoding="utf-8") as f:
                     data: dict[str, Any] = json.load(f)
@@ -108,6 +115,16 @@ class RecordingSession:
 
         return session
 
+    @classmethod
+    def read_session(cls, pid: int) -> dict[str, Any] | None:
+        """Read the session for `pid` without scanning the other state files."""
+        try:
+            with open(cls.get_state_file(pid), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
     @classmethod
     def get_current_session(cls) -> dict[str, Any]:
         """Get the current active session."""
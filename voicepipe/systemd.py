@@ -146,21 +146,51 @@ def run_systemctl(args: list[str], *, check: bool = False) -> subprocess.Complet
     return subprocess.run(cmd, check=check)
 
 
+def _parse_show_block(text: str) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for line in text.splitlines():
+        if "=" in line:
+            k, _sep, v = line.partition("=")
+            out[k] = v
+    return out
+
+
 def systemctl_show_properties(
     unit: str, properties: list[str]
 ) -> dict[str, str]:
+    return systemctl_show_units([unit], properties)[unit]
+
+
+def systemctl_show_units(
+    units: list[str], properties: list[str]
+) -> dict[str, dict[str, str]]:
+    """Fetch properties for several units with a single `systemctl show` call.
+
+    systemctl prints one block per unit separated by a blank line. Blocks are
+    matched to units by their `Id=` property rather than by position, so a
+    missing block or a stray separator can't shift properties onto the wrong
+    unit; a unit without a block gets an empty dict.
+    """
     systemctl = systemctl_path()
     if not systemctl:
         raise RuntimeError("systemctl not found (is systemd installed?)")
-    cmd = [systemctl, "--user", "show", unit, *sum([["-p", p] for p in properties], [])]
+    wanted = properties if "Id" in properties else ["Id", *properties]
+    cmd = [systemctl, "--user", "show", *units, *sum([["-p", p] for p in wanted], [])]
     proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    out: dict[str, str] = {}
-    for line in (proc.stdout or "").splitlines():
-        if "=" in line:
-            k, _sep, v = line.partition("=")
-            out[k] = v
-    if proc.returncode != 0:
-        out.setdefault("error", (proc.stderr or "").strip())
+
+    by_id: dict[str, dict[str, str]] = {}
+    for block in (proc.stdout or "").split("\n\n"):
+        props = _parse_show_block(block)
+        unit_id = props.get("Id", "")
+        if unit_id in units and unit_id not in by_id:
+            if "Id" not in properties:
+                del props["Id"]
+            by_id[unit_id] = props
+    out: dict[str, dict[str, str]] = {}
+    for unit in units:
+        out[unit] = by_id.get(unit, {})
+        if proc.returncode != 0:
+            out[unit].setdefault("error", (proc.stderr or "").strip())
     return out
 
 
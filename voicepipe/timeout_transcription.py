@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import logging
 import os
-import shutil
 from pathlib import Path
 
 from voicepipe.config import get_transcribe_model
 from voicepipe.last_output import save_last_output
 from voicepipe.paths import preserved_audio_dir
+from voicepipe.platform import move_file
 from voicepipe.transcription import transcribe_audio_file_result
 
 
@@ -54,9 +54,9 @@ def transcribe_timeout_audio_file(
 
     if not keep_audio:
         try:
-            if audio_file and os.path.exists(audio_file):
+            if audio_file:
                 os.unlink(audio_file)
-        except Exception:
+        except OSError:
             pass
 
     return True
@@ -74,7 +74,7 @@ def _preserve_audio_file(audio_file: str) -> str:
     try:
         dst_dir = preserved_audio_dir(create=True)
         dst = dst_dir / Path(audio_file).name
-        shutil.move(audio_file, dst)
+        move_file(audio_file, dst)
         logger.warning("Preserved timed-out audio file: %s", dst)
         return str(dst)
     except Exception:
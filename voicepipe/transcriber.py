@@ -36,6 +36,7 @@ Transcribe spoken words only. Do not annotate non-speech sounds such as breaths,
         api_key: Optional[str] = None,
         model: str = "gpt-4o-transcribe",
         base_url: Optional[str] = None,
+        keepalive_expiry: Optional[float] = None,
     ):
         """Initialize the transcriber with API key and model.
 
@@ -43,6 +44,10 @@ Transcribe spoken words only. Do not annotate non-speech sounds such as breaths,
         transcription endpoint (e.g. Groq's ``/openai/v1`` for
         ``whisper-large-v3-turbo``). When omitted, the default OpenAI
         endpoint is used and behavior is unchanged.
+
+        ``keepalive_expiry`` keeps idle HTTPS connections pooled for that many
+        seconds (httpx defaults to 5s), so long-lived callers like the
+        transcriber daemon skip a TLS handshake between dictations.
         """
         if OpenAI is None:
             raise RuntimeError(
@@ -54,6 +59,20 @@ Transcribe spoken words only. Do not annotate non-speech sounds such as breaths,
         client_kwargs = {"api_key": self.api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
+        if keepalive_expiry is not None:
+            import httpx
+
+            # Mirrors the OpenAI SDK's default timeout/limits, with a longer
+            # keep-alive window.
+            client_kwargs["http_client"] = httpx.Client(
+                timeout=httpx.Timeout(600.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=1000,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=float(keepalive_expiry),
+                ),
+                follow_redirects=True,
+            )
         self.client = OpenAI(**client_kwargs)
         self.model = model
         self.base_url = base_url
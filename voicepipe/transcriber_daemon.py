@@ -96,14 +96,20 @@ def _resolve_backend_and_model(
     return backend, raw or default_model
 
 
+# The daemon lives across many dictations; keep its HTTPS connection to the
+# transcription API warm between them instead of re-handshaking each time.
+_HTTP_KEEPALIVE_S = 120.0
+
+
 def _build_transcriber(backend: str, model: str):
     if backend == "openai":
-        return WhisperTranscriber(model=model)
+        return WhisperTranscriber(model=model, keepalive_expiry=_HTTP_KEEPALIVE_S)
     if backend == "groq":
         return WhisperTranscriber(
             api_key=get_groq_api_key(),
             model=model,
             base_url=DEFAULT_GROQ_BASE_URL,
+            keepalive_expiry=_HTTP_KEEPALIVE_S,
         )
     if backend == "elevenlabs":
         return ElevenLabsTranscriber(model_id=model)
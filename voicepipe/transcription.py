@@ -7,9 +7,11 @@ This centralizes the logic for:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import socket
+import threading
 from pathlib import Path
 from typing import Any, BinaryIO, Optional
 
@@ -17,13 +19,14 @@ from voicepipe.config import (
     DEFAULT_GROQ_BASE_URL,
     get_daemon_mode,
     get_groq_api_key,
+    get_openai_api_key,
     get_transcribe_backend,
     get_transcribe_prompt,
     get_transcribe_prompt_append_triggers,
     get_transcript_commands_config,
 )
 from voicepipe.platform import is_windows
-from voicepipe.paths import transcriber_socket_paths
+from voicepipe.paths import find_transcriber_socket_path, transcriber_socket_paths
 from voicepipe.transcription_result import TranscriptionResult
 
 
@@ -103,6 +106,17 @@ def _resolve_backend_and_model(model: str) -> tuple[str, str, str]:
     return backend, model_id, model_for_daemon
 
 
+# One client per (backend, model), tagged with a digest of the API key it was
+# built with. Guarded by a lock because `prewarm_transcriber` fills it from a
+# background thread.
+_TRANSCRIBER_CACHE: dict[tuple[str, str], tuple[str, Any]] = {}
+_TRANSCRIBER_CACHE_LOCK = threading.Lock()
+
+
+def _api_key_digest(api_key: Optional[str]) -> str:
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+
 def _make_openai_compatible_transcriber(backend: str, model: str):
     """Build a ``WhisperTranscriber`` for an OpenAI-API-compatible backend.
 
@@ -114,13 +128,59 @@ def _make_openai_compatible_transcriber(backend: str, model: str):
     """
     from voicepipe.transcriber import WhisperTranscriber
 
-    if backend == "groq":
-        return WhisperTranscriber(
-            api_key=get_groq_api_key(),
-            model=model,
-            base_url=DEFAULT_GROQ_BASE_URL,
-        )
-    return WhisperTranscriber(model=model)
+    # Reuse the client across calls in long-lived processes so its HTTP
+    # connection pool stays warm. The key is resolved the same way the client
+    # would (env, voicepipe.env, credentials, ~/.api-keys), so a changed key
+    # from any of those sources replaces the cached client.
+    api_key = get_groq_api_key() if backend == "groq" else get_openai_api_key()
+    digest = _api_key_digest(api_key)
+    cache_key = (backend, model)
+    with _TRANSCRIBER_CACHE_LOCK:
+        cached = _TRANSCRIBER_CACHE.get(cache_key)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        if backend == "groq":
+            transcriber = WhisperTranscriber(
+                api_key=api_key,
+                model=model,
+                base_url=DEFAULT_GROQ_BASE_URL,
+            )
+        else:
+            transcriber = WhisperTranscriber(api_key=api_key, model=model)
+        _TRANSCRIBER_CACHE[cache_key] = (digest, transcriber)
+        return transcriber
+
+
+def clear_transcriber_cache() -> None:
+    """Drop every cached direct-API transcriber client."""
+    with _TRANSCRIBER_CACHE_LOCK:
+        _TRANSCRIBER_CACHE.clear()
+
+
+def prewarm_transcriber(model: str, *, prefer_daemon: bool = False) -> None:
+    """Best-effort: build and cache the client `transcribe_audio_file` would use.
+
+    Importing ``openai`` and constructing the client is slow enough to be worth
+    overlapping with other work (e.g. the recorder shutting down in
+    ``voicepipe stop``). With ``prefer_daemon``, nothing is built when the
+    transcriber daemon is going to take the request anyway.
+    """
+    try:
+        if prefer_daemon and _transcriber_daemon_expected():
+            return
+        backend, resolved_model, _model_for_daemon = _resolve_backend_and_model(model)
+        if backend in ("openai", "groq"):
+            _make_openai_compatible_transcriber(backend, resolved_model)
+    except Exception:
+        pass
+
+
+def _transcriber_daemon_expected() -> bool:
+    daemon_mode = get_daemon_mode(load_env=True)
+    if daemon_mode == "never" or (daemon_mode == "auto" and is_windows()):
+        return False
+    return find_transcriber_socket_path() is not None
 
 
 def _transcribe_via_daemon(
@@ -620,6 +620,45 @@ end run
         return False, f"osascript error: {e}"
 
 
+_XDOTOOL_DEFAULT_DELAY_MS = 12
+
+
+def _xdotool_type_delay_ms() -> int:
+    """Per-keystroke delay for `xdotool type`.
+
+    Defaults to xdotool's own 12 ms, since `--delay 0` drops characters in
+    some X11 clients; `VOICEPIPE_XDOTOOL_DELAY_MS=0` opts into instant typing.
+    """
+    raw = (os.environ.get("VOICEPIPE_XDOTOOL_DELAY_MS") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else _XDOTOOL_DEFAULT_DELAY_MS
+    except ValueError:
+        return _XDOTOOL_DEFAULT_DELAY_MS
+
+
+def _run_xdotool(
+    cmd: list[str], *, input: Optional[str] = None, timeout: float = 2.0
+) -> tuple[bool, Optional[str]]:
+    try:
+        result = subprocess.run(
+            cmd,
+            input=input,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+            check=False,
+        )
+        if result.returncode != 0:
+            err = (result.stderr or "").strip()
+            return False, err or f"xdotool failed (rc={result.returncode})"
+        return True, None
+    except subprocess.TimeoutExpired:
+        return False, "xdotool timed out"
+    except Exception as e:
+        return False, f"xdotool error: {e}"
+
+
 def type_text(
     text: str,
     *,
@@ -646,32 +685,20 @@ def type_text(
 
     if backend.name == "xdotool":
         cmd = [backend.path or "xdotool", "type", "--clearmodifiers"]
+        cmd += ["--delay", str(_xdotool_type_delay_ms())]
         if window_id:
             cmd += ["--window", str(window_id)]
-        cmd += ["--", text]
-        try:
-            timeout_s = max(2.0, min(30.0, len(text) / 20.0))
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout_s,
-                check=False,
-            )
-            if result.returncode != 0:
-                err = (result.stderr or "").strip()
-                return False, err or f"xdotool failed (rc={result.returncode})"
-            return True, None
-        except subprocess.TimeoutExpired:
-            return False, "xdotool timed out"
-        except Exception as e:
-            return False, f"xdotool error: {e}"
+        # Stream the text over stdin: long transcripts would otherwise hit
+        # argv size limits and show up in the process list.
+        cmd += ["--file", "-"]
+        return _run_xdotool(cmd, input=text, timeout=max(2.0, min(30.0, len(text) / 20.0)))
 
     if backend.name == "wtype":
         try:
             result = subprocess.run(
                 [backend.path or "wtype", text],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=10.0,
                 check=False,
@@ -683,7 +710,8 @@ def type_text(
             result = subprocess.run(
                 [backend.path or "wtype"],
                 input=text,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=10.0,
                 check=False,
@@ -749,22 +777,7 @@ def press_enter(
         if window_id:
             cmd += ["--window", str(window_id)]
         cmd += ["Return"]
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=2.0,
-                check=False,
-            )
-            if result.returncode != 0:
-                err = (result.stderr or "").strip()
-                return False, err or f"xdotool failed (rc={result.returncode})"
-            return True, None
-        except subprocess.TimeoutExpired:
-            return False, "xdotool timed out"
-        except Exception as e:
-            return False, f"xdotool error: {e}"
+        return _run_xdotool(cmd)
 
     if backend.name == "wtype":
         # Wayland: send a real Return keysym press/release instead of a newline
@@ -773,7 +786,8 @@ def press_enter(
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=2.0,
                 check=False,
@@ -876,22 +890,7 @@ def press_keys(
         if window_id:
             cmd += ["--window", str(window_id)]
         cmd += specs
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=2.0,
-                check=False,
-            )
-            if result.returncode != 0:
-                err = (result.stderr or "").strip()
-                return False, err or f"xdotool failed (rc={result.returncode})"
-            return True, None
-        except subprocess.TimeoutExpired:
-            return False, "xdotool timed out"
-        except Exception as e:
-            return False, f"xdotool error: {e}"
+        return _run_xdotool(cmd)
 
     if backend.name == "wtype":
         mod_map = {
@@ -918,7 +917,8 @@ def press_keys(
         try:
             result = subprocess.run(
                 argv,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=2.0,
                 check=False,
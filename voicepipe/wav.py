@@ -6,6 +6,11 @@ from typing import BinaryIO
 import wave
 
 
+# A recording smaller than this holds little more than a WAV header (the mic
+# failed or the session was stopped instantly); don't spend an upload on it.
+MIN_AUDIO_BYTES = 1024
+
+
 def read_wav_duration_s(path: str) -> float | None:
     """Return duration in seconds for a WAV file, or None if unreadable."""
     try:
@@ -19,6 +24,17 @@ def read_wav_duration_s(path: str) -> float | None:
         return None
 
 
+def pcm_peak(samples) -> int:
+    """Return the peak absolute amplitude of an int16 sample array.
+
+    Uses the array's own min/max reductions instead of `abs()` on an int32
+    copy, so no buffer-sized temporaries are allocated. -32768 reports 32768.
+    """
+    if not getattr(samples, "size", 0):
+        return 0
+    return max(int(samples.max()), -int(samples.min()))
+
+
 def pcm_duration_s(
     pcm: bytes,
     *,